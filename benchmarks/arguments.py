@@ -0,0 +1,64 @@
+"""
+Benchmark the per-call overhead of argument handling on frequently
+called API methods, with pydantic argument validation turned on and off
+(``MdAPI(validate_arguments=...)``).
+
+Requests and response parsing are stubbed out, so only the work done
+before a request would be sent is timed.
+
+Run with ``python -m benchmarks.arguments``.
+"""
+import time
+
+from mdapi import MdAPI
+from mdapi.schema import Type
+
+
+CHAPTER = "00000000-0000-0000-0000-000000000001"
+MANGA = Type.construct_obj({
+    "id": "00000000-0000-0000-0000-000000000002",
+    "type": "manga",
+    "attributes": {},
+})
+
+
+def client(validate):
+    md = MdAPI(validate_arguments=validate)
+    md.api._make_request = lambda *args, **kwargs: {}
+    md.api._parse = lambda obj, trusted=None: obj
+    return md
+
+
+CALLS = {
+    "chapter.mark_read": lambda md: md.chapter.mark_read(CHAPTER),
+    "manga.get": lambda md: md.manga.get(MANGA),
+    "misc.report_mdah": lambda md: md.misc.report_mdah(
+        "https://example.org/data/hash/x1.png", True, False, 123456, 250
+    ),
+}
+
+
+def calls_per_second(func, md, duration=0.5):
+    calls = 0
+    start = time.perf_counter()
+    while (elapsed := time.perf_counter() - start) < duration:
+        for _ in range(100):
+            func(md)
+        calls += 100
+    return calls / elapsed
+
+
+def main():
+    validated, fast = client(True), client(False)
+    print(
+        f"{'method':>20} {'validated':>12} {'unvalidated':>12} "
+        f"{'speedup':>8}"
+    )
+    for name, func in CALLS.items():
+        on = calls_per_second(func, validated)
+        off = calls_per_second(func, fast)
+        print(f"{name:>20} {on:>8.0f}/sec {off:>8.0f}/sec {off / on:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""
+Micro-benchmark for the per-item overhead of consuming a
+`mdapi.util.PaginatedRequest`, before and after the pagination buffer was
+moved from a list to a deque.
+
+Requests are served from memory, and model parsing is replaced with a
+no-op for the buffer measurements so only pagination overhead is timed.
+
+Run with ``python -m benchmarks.pagination``.
+"""
+import time
+from unittest import mock
+
+from mdapi.util import PaginatedRequest
+
+
+class FakeAPI:
+    prefetch = 0
+    lazy_results = False
+    trusted_responses = False
+
+    def __init__(self, total, limit):
+        self.total = total
+        self.limit = limit
+        # Build responses up front so that only consumption is timed
+        self.pages = {
+            offset: [
+                {
+                    "data": {
+                        "id": str(offset + i), "type": "manga",
+                        "attributes": {},
+                    },
+                    "relationships": [{"id": "a", "type": "author"}],
+                }
+                for i in range(min(limit, total - offset))
+            ]
+            for offset in range(0, total, limit)
+        }
+
+    def _make_request(self, *args, params=None, **kwargs):
+        return {
+            "results": list(self.pages.get(params["offset"], ())),
+            "limit": self.limit,
+            "offset": params["offset"],
+            "total": self.total,
+        }
+
+
+class ListPaginatedRequest(PaginatedRequest):
+    """
+    The previous buffer implementation: a list consumed with ``pop(0)``,
+    merging relationships into the response one item at a time.
+    """
+
+    def _get_next(self):
+        results = self._request(self.offset)
+        self.total = results.get("total", 0)
+        self.offset += results.get("limit", 0)
+        self._results = results.get("results", [])
+        self.has_more = self.offset < self.total
+
+    def __next__(self):
+        self._ensure_populated()
+
+        if len(self._results) == 0:
+            raise StopIteration
+
+        result = self._results.pop(0)
+        if "relationships" in result:
+            result["data"]["relationships"] = result["relationships"]
+        result = result.get("data", result)
+        return self._parse(result)
+
+
+def consume(cls, total, limit, repeat=5):
+    """
+    Time consuming every result, returning the best per-item time.
+    """
+    api = FakeAPI(total, limit)
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in cls(api, ("GET", "/manga"), limit=limit):
+            pass
+        elapsed = (time.perf_counter() - start) / total
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    print(f"{'page size':>10} {'items':>8} {'before':>12} {'after':>12}")
+    with mock.patch.object(PaginatedRequest, "_parse", staticmethod(id)):
+        for limit in (100, 1_000, 10_000):
+            total = 100_000
+            before = consume(ListPaginatedRequest, total, limit)
+            after = consume(PaginatedRequest, total, limit)
+            print(
+                f"{limit:>10} {total:>8} {before * 1e6:>10.2f}us "
+                f"{after * 1e6:>10.2f}us"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""
+Benchmark parsing a large feed page with full validation
+(``Type.parse_obj``) against the trusted-response path
+(``Type.construct_obj``) used by ``MdAPI(trusted_responses=True)``.
+
+Run with ``python -m benchmarks.parsing``.
+"""
+import time
+
+from mdapi.schema import Type
+
+
+def chapter(n):
+    return {
+        "id": f"00000000-0000-0000-0000-{n:012}",
+        "type": "chapter",
+        "attributes": {
+            "title": f"Chapter {n}",
+            "volume": "1",
+            "chapter": str(n),
+            "translatedLanguage": "en",
+            "hash": "0123456789abcdef0123456789abcdef",
+            "data": [f"x{i}-{'a' * 64}.png" for i in range(20)],
+            "dataSaver": [f"x{i}-{'b' * 64}.jpg" for i in range(20)],
+            "uploader": "00000000-0000-0000-0000-000000000001",
+            "version": 1,
+            "createdAt": "2021-05-01T12:00:00+00:00",
+            "updatedAt": "2021-05-01T12:00:00+00:00",
+            "publishAt": "2021-05-01T12:00:00+00:00",
+        },
+        "relationships": [
+            {"id": "00000000-0000-0000-0000-000000000002", "type": "manga"},
+            {
+                "id": "00000000-0000-0000-0000-000000000003",
+                "type": "scanlation_group",
+            },
+        ],
+    }
+
+
+def manga(n):
+    tag = {
+        "id": "00000000-0000-0000-0000-000000000004",
+        "type": "tag",
+        "attributes": {
+            "name": {"en": "Action"},
+            "description": [],
+            "group": "genre",
+            "version": 1,
+        },
+    }
+    return {
+        "id": f"00000000-0000-0000-0000-{n:012}",
+        "type": "manga",
+        "attributes": {
+            "title": {"en": f"Manga {n}"},
+            "altTitles": [{"ja": "Manga"}, {"en": "Another title"}],
+            "description": {"en": "A description " * 20},
+            "isLocked": False,
+            "links": {"al": "1", "mal": "2"},
+            "originalLanguage": "ja",
+            "lastVolume": None,
+            "lastChapter": None,
+            "publicationDemographic": "shounen",
+            "status": "ongoing",
+            "year": 2021,
+            "contentRating": "safe",
+            "tags": [tag] * 8,
+            "version": 1,
+            "createdAt": "2021-05-01T12:00:00+00:00",
+            "updatedAt": "2021-05-01T12:00:00+00:00",
+        },
+        "relationships": [
+            {"id": "00000000-0000-0000-0000-000000000005", "type": "author"},
+        ],
+    }
+
+
+def best_of(func, page, repeat=5):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for i in page:
+            func(i)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    print(f"{'page':>16} {'validated':>12} {'trusted':>12} {'speedup':>8}")
+    for name, factory in (("100 chapters", chapter), ("100 manga", manga)):
+        page = [factory(n) for n in range(100)]
+        assert all(
+            Type.parse_obj(i) == Type.construct_obj(i) for i in page
+        )
+
+        validated = best_of(Type.parse_obj, page)
+        trusted = best_of(Type.construct_obj, page)
+        print(
+            f"{name:>16} {validated * 1e3:>10.2f}ms {trusted * 1e3:>10.2f}ms "
+            f"{validated / trusted:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
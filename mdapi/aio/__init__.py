@@ -0,0 +1,7 @@
+from .mdapi import AsyncMdAPI
+from .util import AsyncCursorPaginatedRequest, AsyncPaginatedRequest
+
+
+__all__ = (
+    "AsyncMdAPI", "AsyncPaginatedRequest", "AsyncCursorPaginatedRequest"
+)
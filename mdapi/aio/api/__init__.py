@@ -0,0 +1,18 @@
+from .account import AsyncAccountAPI
+from .auth import AsyncAuthAPI
+from .author import AsyncAuthorAPI
+from .chapter import AsyncChapterAPI
+from .cover import AsyncCoverAPI
+from .group import AsyncGroupAPI
+from .list import AsyncListAPI
+from .manga import AsyncMangaAPI
+from .misc import AsyncMiscAPI
+from .user import AsyncUserAPI
+from .upload import AsyncUploadAPI
+
+
+__all__ = (
+    "AsyncAccountAPI", "AsyncAuthAPI", "AsyncAuthorAPI", "AsyncChapterAPI",
+    "AsyncGroupAPI", "AsyncListAPI", "AsyncMangaAPI", "AsyncMiscAPI",
+    "AsyncUserAPI", "AsyncCoverAPI", "AsyncUploadAPI"
+)
@@ -0,0 +1,40 @@
+from ...endpoints import Endpoints
+from ...schema import User
+from .base import AsyncAPIBase
+
+
+class AsyncAccountAPI(AsyncAPIBase):
+    """
+    Asyncio counterpart of `mdapi.api.account.AccountAPI`.
+    """
+
+    async def create(self, username: str, password: str, email: str) -> User:
+        return self.api._parse(await self.api._make_request(
+            Endpoints.Account.CREATE, body={
+                "username": username,
+                "password": password,
+                "email": email
+            }, auth=False
+        ))
+
+    async def recover(self, email: str) -> None:
+        await self.api._make_request(Endpoints.Account.RECOVER, body={
+            "email": email
+        }, auth=False)
+
+    async def complete_recover(self, code: str, password: str) -> None:
+        await self.api._make_request(Endpoints.Account.COMPLETE_RECOVER, body={
+            "newPassword": password
+        }, urlparams={
+            "code": code
+        }, auth=False)
+
+    async def activate(self, code: str) -> None:
+        await self.api._make_request(Endpoints.Account.ACTIVATE, urlparams={
+            "code": code
+        })
+
+    async def activate_resend(self, email: str) -> None:
+        await self.api._make_request(Endpoints.Account.ACTIVATE_RESEND, body={
+            "email": email
+        })
@@ -0,0 +1,40 @@
+from ...util import validate_arguments
+from ...endpoints import Endpoints
+from ...exceptions import MdException
+from .base import AsyncAPIBase
+
+
+class AsyncAuthAPI(AsyncAPIBase):
+    """
+    Asyncio counterpart of `mdapi.api.auth.AuthAPI`.
+    """
+
+    @validate_arguments
+    async def login(self, username: str, password: str) -> None:
+        token = (await self.api._make_request(Endpoints.Auth.LOGIN, {
+            "username": username,
+            "password": password
+        })).get("token")
+
+        self.api._authenticate(username, token)
+
+    async def check(self) -> bool:
+        return await self.api._make_request(Endpoints.Auth.CHECK)
+
+    async def logout(self) -> None:
+        try:
+            await self.api._make_request(Endpoints.Auth.LOGOUT)
+        except MdException:
+            pass
+        self.api._authenticate(None, None)
+
+    async def refresh(self) -> None:
+        ref = self.api._get_refresh_token()
+        if ref is None:
+            raise MdException("Not logged in")
+
+        token = (await self.api._make_request(
+            Endpoints.Auth.REFRESH, {"token": ref}
+        )).get("token")
+
+        self.api._authenticate(None, token)
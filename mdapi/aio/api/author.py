@@ -0,0 +1,63 @@
+from typing import List
+
+from ...util import validate_arguments
+from ...endpoints import Endpoints
+from ...schema import Author, TypeOrId, CanUnset, AuthorSortOrder
+from ..util import AsyncPaginatedRequest
+from .base import AsyncAPIBase
+
+
+class AsyncAuthorAPI(AsyncAPIBase):
+    """
+    Asyncio counterpart of `mdapi.api.author.AuthorAPI`.
+    """
+
+    @validate_arguments
+    async def create(self, name: str) -> Author:
+        return self.api._parse(await self.api._make_request(
+            Endpoints.Author.CREATE,
+            body={"name": name}
+        ))
+
+    @validate_arguments
+    async def get(self, author: TypeOrId[Author]) -> Author:
+        if (cached := self.api._cached("author", author)) is not None:
+            return cached
+        return self.api._parse(await self.api._make_request(
+            Endpoints.Author.GET,
+            urlparams={"author": author}
+        ))
+
+    @validate_arguments
+    def search(
+        self,
+        name: str = None,
+        ids: List[TypeOrId[Author]] = None,
+        order: AuthorSortOrder = None,
+        limit: int = 10,
+        offset: int = 0,
+    ) -> AsyncPaginatedRequest[Author]:
+        return AsyncPaginatedRequest(
+            self.api, Endpoints.Author.SEARCH, params={
+                "name": name, "ids": ids, "order": order
+            }, limit=limit, offset=offset
+        )
+
+    @validate_arguments
+    async def edit(
+        self, author: Author, name: CanUnset[str] = None
+    ) -> None:
+        body = {"version": author.version}
+        if name is not None:
+            body["name"] = name
+        await self.api._make_request(
+            Endpoints.Author.EDIT, body=body, urlparams={"author": author.id}
+        )
+        self.api._invalidate(author.id)
+
+    @validate_arguments
+    async def delete(self, author: TypeOrId[Author]) -> None:
+        await self.api._make_request(
+            Endpoints.Author.DELETE, urlparams={"author": author}
+        )
+        self.api._invalidate(author)
@@ -0,0 +1,11 @@
+class AsyncAPIBase:
+    """
+    The base class for all asyncio API classes.
+    """
+
+    def __init__(self, md, api):
+        # If we import at the root level we have a circular import!
+        from ..mdapi import AsyncAPIHandler, AsyncMdAPI
+
+        self.md: AsyncMdAPI = md
+        self.api: AsyncAPIHandler = api
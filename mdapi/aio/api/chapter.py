@@ -0,0 +1,420 @@
+import os
+import asyncio
+from typing import (
+    AsyncGenerator, Awaitable, BinaryIO, Callable, List, Optional, Tuple
+)
+from datetime import datetime
+
+import aiohttp
+
+from ...util import shadows, validate_arguments
+from ...endpoints import Endpoints
+from ...archive import CbzWriter, comic_info
+from ...download import (
+    ChapterResult, DownloadProgress, DownloadStats, PageRequest, PageResult,
+    PartialPage, fail_over, page_filename, queue_pages
+)
+from ...exceptions import (
+    MdException, DownloadException, NoFollowRedirect, InvalidStatusCode
+)
+from ...schema import (
+    ChapterSortOrder, LanguageCode, Manga, TypeOrId, Chapter,
+    ScanlationGroup, User, CanUnset, ChapterCursor
+)
+from ..util import (
+    AsyncCursorPaginatedRequest, AsyncPaginatedRequest, run_blocking
+)
+from ..download import (
+    download_page_data, download_page_file, plan_chapter
+)
+from .base import AsyncAPIBase
+
+
+class AsyncChapterAPI(AsyncAPIBase):
+    """
+    Asyncio counterpart of `mdapi.api.chapter.ChapterAPI`.
+    """
+
+    def _search(self, limit=None, offset=None, cursor=None, **kwargs):
+        if cursor is not None:
+            return AsyncCursorPaginatedRequest(
+                self.api, Endpoints.Chapter.SEARCH, params=kwargs,
+                limit=limit, offset=offset, cursor=cursor,
+                order_type=ChapterSortOrder,
+            )
+        return AsyncPaginatedRequest(
+            self.api, Endpoints.Chapter.SEARCH, params=kwargs,
+            limit=limit, offset=offset,
+        )
+
+    @validate_arguments
+    @shadows(_search)
+    def search(
+        self,
+        title: str = None,
+        ids: List[TypeOrId[Chapter]] = None,
+        groups: List[TypeOrId[ScanlationGroup]] = None,
+        uploader: TypeOrId[User] = None,
+        manga: TypeOrId[Manga] = None,
+        volume: str = None,
+        chapter: str = None,
+        translatedLanguage: LanguageCode = None,
+        createdAtSince: datetime = None,
+        updatedAtSince: datetime = None,
+        publishAtSince: datetime = None,
+        order: ChapterSortOrder = None,
+        limit: int = 10,
+        offset: int = 0,
+        cursor: ChapterCursor = None,
+    ) -> AsyncPaginatedRequest[Chapter]:
+        ...
+
+    @validate_arguments
+    async def get(self, chapter: TypeOrId[Chapter]) -> Chapter:
+        return self.api._parse(await self.api._make_request(
+            Endpoints.Chapter.GET,
+            urlparams={"chapter": chapter}
+        ))
+
+    async def _edit(self, **kwargs):
+        chapter = kwargs.pop("chapter")
+        kwargs["chapter"] = kwargs.pop("chapterNumber")
+        return await self.api._make_request(
+            Endpoints.Chapter.EDIT, kwargs,
+            urlparams={"chapter": chapter}
+        )
+
+    @validate_arguments
+    @shadows(_edit)
+    def edit(
+        self,
+        chapter: Chapter,
+        title: str,
+        volume: CanUnset[str] = None,
+        chapterNumber: CanUnset[str] = None,
+        translatedLanguage: CanUnset[LanguageCode] = None,
+    ) -> Chapter:
+        ...
+
+    @validate_arguments
+    async def delete(self, chapter: TypeOrId[Chapter]) -> None:
+        await self.api._make_request(Endpoints.Chapter.DELETE, urlparams={
+            "chapter": chapter
+        })
+
+    @validate_arguments
+    async def mark_read(self, chapter: TypeOrId[Chapter]) -> None:
+        await self.api._make_request(Endpoints.Chapter.MARK_READ, urlparams={
+            "chapter": chapter
+        })
+
+    @validate_arguments
+    async def mark_unread(self, chapter: TypeOrId[Chapter]) -> None:
+        await self.api._make_request(
+            Endpoints.Chapter.MARK_UNREAD, urlparams={"chapter": chapter}
+        )
+
+    @validate_arguments
+    async def page_urls_for(
+        self, chapter: Chapter, data_saver: bool = False,
+        base: Optional[str] = None
+    ) -> List[str]:
+        """
+        Get a list of all page image URLs for this chapter. Unlike the
+        synchronous API, this returns a list rather than a generator.
+        """
+        if base is None:
+            # Manual override for testing
+            if "MD_CHAPTER_BASE_URL" in os.environ:
+                base = os.environ.get("MD_CHAPTER_BASE_URL")
+            else:
+                base = await self.api.md.misc.get_md_at_home_url(chapter)
+
+        base += "/data-saver/" if data_saver else "/data/"
+        base += chapter.hash + "/"
+
+        return [
+            base + i
+            for i in (chapter.dataSaver if data_saver else chapter.data)
+        ]
+
+    async def refresh_page_urls(
+        self, chapter: Chapter, data_saver: bool = False,
+        avoid: Optional[str] = None
+    ) -> List[str]:
+        """
+        Get page URLs for a chapter from a fresh MD@H node. See
+        `mdapi.api.chapter.ChapterAPI.refresh_page_urls`.
+        """
+        if "MD_CHAPTER_BASE_URL" in os.environ:
+            return await self.page_urls_for(chapter, data_saver)
+
+        policy = self.api.failover
+        avoid = avoid and self.api.nodes.node_of(avoid)
+        for _ in range(max(1, policy.node_attempts)):
+            self.md.misc.invalidate_md_at_home_url(chapter)
+            base = await self.md.misc.get_md_at_home_url(chapter)
+            if (
+                self.api.nodes.node_of(base) != avoid
+                and self.api.nodes.get(base).healthy(policy)
+            ):
+                break
+        return await self.page_urls_for(chapter, data_saver, base)
+
+    async def download_page(
+        self, url: str, follow_redirect: bool = False,
+        report_mdah: bool = True, start: int = 0,
+        timeout: Optional[float] = None,
+        stats: Optional[DownloadStats] = None, restart: bool = False
+    ) -> AsyncGenerator[Tuple[bytes, int], None]:
+        """
+        Download a single page of a manga, as an async generator yielding
+        ``(chunk, total_length)``. See
+        `mdapi.api.chapter.ChapterAPI.download_page`.
+        """
+        page = PageRequest(self.api, url, report_mdah, start, stats, restart)
+        options = {}
+        if timeout is not None:
+            options["timeout"] = aiohttp.ClientTimeout(
+                sock_connect=timeout, sock_read=timeout
+            )
+        try:
+            req = await self.api.session.get(
+                url, allow_redirects=follow_redirect, headers=page.headers,
+                **options
+            )
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            page.report(False)
+            raise DownloadException
+        page.stats.responded()
+
+        async with req:
+            if not follow_redirect and 300 <= req.status < 400:
+                page.report(False)
+                raise NoFollowRedirect(
+                    req.headers.get("Location", str(req.url))
+                )
+
+            if page.is_complete(req.status, req.headers):
+                # We already have the whole page
+                return
+
+            if req.status not in (200, 206):
+                page.report(False)
+                raise InvalidStatusCode(req.status, await req.read())
+
+            total_length = page.begin(req.status, req.headers)
+            try:
+                async for chunk in req.content.iter_chunked(page.CHUNK_SIZE):
+                    if chunk := page.received(chunk):
+                        yield (chunk, total_length)
+            except (aiohttp.ClientError, asyncio.TimeoutError):
+                page.report(False)
+                raise DownloadException()
+
+            page.report(True)
+
+    async def download_page_to(
+        self,
+        url: str, output: BinaryIO, follow_redirect: bool = False,
+        report_mdah: bool = True
+    ) -> int:
+        """
+        Download a page into a file-like. Unlike the synchronous API,
+        this always downloads the whole page.
+
+        :returns: The number of bytes written
+        """
+        downloaded = 0
+        async for chunk, _ in self.download_page(
+            url, follow_redirect, report_mdah
+        ):
+            downloaded += len(chunk)
+            output.write(chunk)
+        return downloaded
+
+    async def download_page_to_path(
+        self,
+        url: str, path: str, follow_redirect: bool = False,
+        report_mdah: bool = True, attempts: int = 3,
+        timeout: Optional[float] = None,
+        stats: Optional[DownloadStats] = None
+    ) -> AsyncGenerator[Tuple[bytes, int], None]:
+        """
+        Download a page to a file, resuming where a previous attempt left
+        off, as an async generator yielding ``(chunk, total_length)`` for
+        every chunk written. File I/O runs in the loop's default executor.
+        See `mdapi.api.chapter.ChapterAPI.download_page_to_path`.
+        """
+        if stats is None:
+            stats = DownloadStats(url)
+        part = PartialPage(path, stats)
+        for attempt in range(max(1, attempts)):
+            start = await run_blocking(part.open)
+            try:
+                try:
+                    async for chunk, total_length in self.download_page(
+                        url, follow_redirect, report_mdah, start=start,
+                        timeout=timeout, stats=stats, restart=True
+                    ):
+                        await run_blocking(part.write, chunk)
+                        yield (chunk, total_length)
+                    await run_blocking(part.ended)
+                finally:
+                    await run_blocking(part.close)
+            except DownloadException as e:
+                if await run_blocking(part.failed, e, attempt < attempts - 1):
+                    continue
+                raise
+
+            if await run_blocking(part.complete):
+                return
+
+        raise DownloadException()
+
+    async def download_chapter(
+        self,
+        chapter: Chapter, dest: str, concurrency: int = 4,
+        data_saver: bool = False, follow_redirect: bool = False,
+        report_mdah: bool = True, incremental: bool = True,
+        progress: Optional[Callable[[DownloadProgress], None]] = None,
+    ) -> ChapterResult:
+        """
+        Download every page of a chapter into a directory, several pages
+        at a time. See `mdapi.api.chapter.ChapterAPI.download_chapter`.
+
+        Partial pages are kept as ``.part`` files and resumed, and file
+        I/O runs in the loop's default executor.
+        """
+        results, manifest = await plan_chapter(
+            self, chapter, dest, data_saver, incremental
+        )
+        tracker = DownloadProgress(len(results), progress)
+        queued = queue_pages(results, tracker)
+
+        async def fetch(result: PageResult):
+            await download_page_file(
+                self, result, tracker, follow_redirect, report_mdah,
+                manifest, self.api.failover.timeout
+            )
+
+        async def finished(result: PageResult):
+            tracker.finished(result)
+
+        await self._download_pages(
+            chapter, queued, concurrency, data_saver, fetch, finished
+        )
+        return ChapterResult(chapter, results)
+
+    async def download_chapter_archive(
+        self,
+        chapter: Chapter, path: str, concurrency: int = 4,
+        data_saver: bool = False, follow_redirect: bool = False,
+        report_mdah: bool = True, manga: Optional[Manga] = None,
+        info: bool = True,
+        progress: Optional[Callable[[DownloadProgress], None]] = None,
+    ) -> ChapterResult:
+        """
+        Download every page of a chapter straight into a CBZ archive.
+        See `mdapi.api.chapter.ChapterAPI.download_chapter_archive`.
+
+        The archive is written in the loop's default executor.
+        """
+        urls = await self.page_urls_for(chapter, data_saver)
+        if info and manga is None and chapter.manga is not None:
+            manga = await self.md.manga.get(chapter.manga.id)
+
+        results = [
+            PageResult(n, url, page_filename(n, url))
+            for n, url in enumerate(urls)
+        ]
+        tracker = DownloadProgress(len(results), progress)
+        if os.path.dirname(path):
+            await run_blocking(
+                os.makedirs, os.path.dirname(path), exist_ok=True
+            )
+
+        writer = await run_blocking(CbzWriter, path)
+
+        async def fetch(result: PageResult):
+            data = await download_page_data(
+                self, result, tracker, follow_redirect, report_mdah,
+                self.api.failover.timeout
+            )
+            if data is not None:
+                await run_blocking(
+                    writer.add, result.index, result.path, data
+                )
+
+        async def finished(result: PageResult):
+            if not result.ok:
+                await run_blocking(writer.skip, result.index)
+            tracker.finished(result)
+
+        # CbzWriter's context manager, with its I/O off the loop
+        try:
+            await self._download_pages(
+                chapter, results, concurrency, data_saver, fetch, finished
+            )
+            if info:
+                writer.info = comic_info(
+                    chapter, manga, sum(i.ok for i in results)
+                )
+        except BaseException:
+            await run_blocking(writer.abort)
+            raise
+        await run_blocking(writer.close)
+
+        return ChapterResult(chapter, results)
+
+    async def _download_pages(
+        self, chapter: Chapter, queued: List[PageResult], concurrency: int,
+        data_saver: bool, fetch: Callable[[PageResult], Awaitable[None]],
+        finished: Callable[[PageResult], Awaitable[None]]
+    ):
+        """
+        Await ``fetch`` for each page, several at a time, retrying the
+        pages that failed on a fresh MD@H node. ``finished`` is awaited
+        once a page won't be retried again. Errors are handled as in
+        `mdapi.api.chapter.ChapterAPI._download_pages`.
+        """
+        policy = self.api.failover
+        errors = []
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+
+        async def finish(result: PageResult):
+            try:
+                await finished(result)
+            except Exception as e:
+                errors.append(e)
+
+        async def download(result: PageResult):
+            async with semaphore:
+                try:
+                    await fetch(result)
+                except Exception as e:
+                    result.error = e
+            if not policy.retry_page(result):
+                await finish(result)
+
+        while queued:
+            await asyncio.gather(*(download(i) for i in queued))
+
+            # Retry only the pages that failed, on a fresh node
+            failed = [i for i in queued if policy.retry_page(i)]
+            if not failed:
+                break
+            await asyncio.sleep(policy.delay(failed[0].retries))
+            try:
+                urls = await self.refresh_page_urls(
+                    chapter, data_saver, failed[0].url
+                )
+            except (MdException, aiohttp.ClientError, asyncio.TimeoutError):
+                for result in failed:
+                    await finish(result)
+                break
+            fail_over(failed, urls)
+            queued = failed
+
+        if errors:
+            raise errors[0]
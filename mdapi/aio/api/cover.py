@@ -0,0 +1,64 @@
+from typing import List, BinaryIO
+
+from ...util import validate_arguments
+from ...endpoints import Endpoints
+from ...schema import (
+    TypeOrId, CanUnset, CoverSortOrder, Cover, Manga, User
+)
+from ..util import AsyncPaginatedRequest
+from .base import AsyncAPIBase
+
+
+class AsyncCoverAPI(AsyncAPIBase):
+    """
+    Asyncio counterpart of `mdapi.api.cover.CoverAPI`.
+    """
+
+    @validate_arguments
+    def search(
+        self,
+        manga: List[TypeOrId[Manga]] = None,
+        ids: List[TypeOrId[Cover]] = None,
+        uploaders: List[TypeOrId[User]] = None,
+        order: CoverSortOrder = None,
+        limit: int = 10,
+        offset: int = 0,
+    ) -> AsyncPaginatedRequest[Cover]:
+        return AsyncPaginatedRequest(
+            self.api, Endpoints.Cover.SEARCH, params={
+                "manga": manga, "ids": ids, "uploaders": uploaders,
+                "order": order
+            }, limit=limit, offset=offset
+        )
+
+    async def upload(
+        self, manga: TypeOrId[Manga], file_: BinaryIO
+    ) -> Cover:
+        manga = TypeOrId.return_type(manga)
+        return self.api._parse(await self.api._make_request(
+            Endpoints.Cover.UPLOAD, urlparams={"manga": manga},
+            files={"file": file_}
+        ))
+
+    @validate_arguments
+    async def edit(
+        self, cover: Cover, volume: CanUnset[str] = None,
+        description: CanUnset[str] = None
+    ) -> Cover:
+        body = {"version": cover.version}
+        if volume is not None:
+            body["volume"] = volume
+        if description is not None:
+            body["description"] = description
+        resp = await self.api._make_request(
+            Endpoints.Cover.EDIT, body=body, urlparams={"cover": cover.id}
+        )
+        self.api._invalidate(cover.id)
+        return self.api._parse(resp)
+
+    @validate_arguments
+    async def delete(self, cover: TypeOrId[Cover]) -> None:
+        await self.api._make_request(
+            Endpoints.Cover.DELETE, urlparams={"cover": cover}
+        )
+        self.api._invalidate(cover)
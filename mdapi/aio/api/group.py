@@ -0,0 +1,92 @@
+from typing import List
+
+from ...util import validate_arguments
+from ...endpoints import Endpoints
+from ...schema import TypeOrId, User, ScanlationGroup
+from ..util import AsyncPaginatedRequest
+from .base import AsyncAPIBase
+
+
+class AsyncGroupAPI(AsyncAPIBase):
+    """
+    Asyncio counterpart of `mdapi.api.group.GroupAPI`.
+    """
+
+    @validate_arguments
+    def search(
+        self,
+        name: str = None,
+        ids: List[TypeOrId[ScanlationGroup]] = None,
+        limit: int = 10,
+        offset: int = 0,
+    ) -> AsyncPaginatedRequest[ScanlationGroup]:
+        return AsyncPaginatedRequest(
+            self.api, Endpoints.Group.SEARCH, params={
+                "name": name, "ids": ids
+            }, limit=limit, offset=offset
+        )
+
+    @validate_arguments
+    async def create(
+        self,
+        name: str,
+        leader: TypeOrId[User],
+        members: List[TypeOrId[User]]
+    ) -> ScanlationGroup:
+        return self.api._parse(await self.api._make_request(
+            Endpoints.Group.CREATE, body={
+                "name": name,
+                "leader": leader,
+                "members": members,
+            }
+        ))
+
+    @validate_arguments
+    async def get(self, group: TypeOrId[ScanlationGroup]) -> ScanlationGroup:
+        if (cached := self.api._cached("scanlation_group", group)) is not None:
+            return cached
+        return self.api._parse(await self.api._make_request(
+            Endpoints.Group.GET, urlparams={
+                "group": group
+            }
+        ))
+
+    @validate_arguments
+    async def edit(
+        self,
+        group: ScanlationGroup,
+        name: str,
+        leader: TypeOrId[User],
+        members: List[TypeOrId[User]]
+    ) -> ScanlationGroup:
+        resp = await self.api._make_request(
+            Endpoints.Group.EDIT, body={
+                "name": name,
+                "leader": leader,
+                "members": members,
+                "version": group.version,
+            }, urlparams={
+                "group": group.id
+            }
+        )
+        self.api._invalidate(group.id)
+        return self.api._parse(resp)
+
+    @validate_arguments
+    async def delete(self, group: TypeOrId[ScanlationGroup]):
+        await self.api._make_request(
+            Endpoints.Group.DELETE, urlparams={"group": group}
+        )
+        self.api._invalidate(group)
+
+    @validate_arguments
+    async def follow(self, group: TypeOrId[ScanlationGroup]):
+        await self.api._make_request(
+            Endpoints.Group.FOLLOW, urlparams={"group": group}
+        )
+
+    @validate_arguments
+    async def unfollow(self, group: TypeOrId[ScanlationGroup]):
+        await self.api._make_request(
+            Endpoints.Group.UNFOLLOW, urlparams={"group": group}
+        )
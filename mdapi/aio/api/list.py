@@ -0,0 +1,77 @@
+from typing import List
+
+from ...util import validate_arguments
+from ...endpoints import Endpoints
+from ...schema import TypeOrId, CustomListVisibility, Manga, CustomList
+from ..util import AsyncPaginatedRequest
+from .base import AsyncAPIBase
+
+
+class AsyncListAPI(AsyncAPIBase):
+    """
+    Asyncio counterpart of `mdapi.api.list.ListAPI`.
+    """
+
+    @validate_arguments
+    async def create(
+        self,
+        name: str,
+        visibility: CustomListVisibility,
+        manga: List[TypeOrId[Manga]]
+    ) -> CustomList:
+        return self.api._parse(await self.api._make_request(
+            Endpoints.List.CREATE,
+            body={
+                "name": name,
+                "visibility": visibility,
+                "manga": manga,
+                "version": 1,
+            }
+        ))
+
+    @validate_arguments
+    async def edit(
+        self,
+        custom_list: CustomList,
+        name: str,
+        visibility: CustomListVisibility,
+        manga: List[TypeOrId[Manga]]
+    ):
+        await self.api._make_request(
+            Endpoints.List.EDIT, body={
+                "name": name,
+                "visibility": visibility,
+                "manga": manga,
+                "version": custom_list.version,
+            }, urlparams={"list": custom_list.id}
+        )
+
+    @validate_arguments
+    async def get(self, list_id: TypeOrId[CustomList]) -> CustomList:
+        return self.api._parse(await self.api._make_request(
+            Endpoints.List.GET, urlparams={
+                "list": list_id
+            }
+        ))
+
+    @validate_arguments
+    async def delete(self, list_id: TypeOrId[CustomList]) -> None:
+        await self.api._make_request(
+            Endpoints.List.DELETE, urlparams={
+                "list": list_id
+            }
+        )
+
+    @validate_arguments
+    def get_feed(
+        self,
+        list_id: TypeOrId[CustomList],
+        limit: int = 10,
+        offset: int = 0,
+    ) -> AsyncPaginatedRequest:
+        return AsyncPaginatedRequest(
+            self.api,
+            Endpoints.List.GET_FEED,
+            urlparams={"list": list_id},
+            limit=limit, offset=offset
+        )
@@ -0,0 +1,225 @@
+from uuid import UUID
+from typing import Dict, List
+from datetime import datetime
+
+from ...util import shadows, validate_arguments
+from ...endpoints import Endpoints
+from ...schema import (
+    MultiMode, Status, LanguageCode, PublicationDemographic, Tag, Year,
+    ContentRating, TypeOrId, MangaSortOrder, ReadingStatus, Author, Manga,
+    LinksKey, Version, CustomList, LocalizedString, CanUnset,
+    ChapterSortOrder, MangaCursor, ChapterCursor
+)
+from ..util import AsyncCursorPaginatedRequest, AsyncPaginatedRequest
+from .base import AsyncAPIBase
+
+
+class AsyncMangaAPI(AsyncAPIBase):
+    """
+    Asyncio counterpart of `mdapi.api.manga.MangaAPI`.
+    """
+
+    def _search(self, limit=None, offset=None, cursor=None, **kwargs):
+        if cursor is not None:
+            return AsyncCursorPaginatedRequest(
+                self.api, Endpoints.Manga.SEARCH, params=kwargs,
+                limit=limit, offset=offset, cursor=cursor,
+                order_type=MangaSortOrder,
+            )
+        return AsyncPaginatedRequest(
+            self.api, Endpoints.Manga.SEARCH, params=kwargs,
+            limit=limit, offset=offset,
+        )
+
+    @validate_arguments
+    @shadows(_search)
+    def search(
+        self,
+        title: str = None,
+        authors: List[TypeOrId[Author]] = None,
+        artists: List[TypeOrId] = None,
+        year: Year = None,
+        includedTags: List[TypeOrId[Tag]] = None,
+        includedTagsMode: MultiMode = None,
+        excludedTags: List[TypeOrId[Tag]] = None,
+        excludedTagsMode: MultiMode = None,
+        status: Status = None,
+        originalLanguage: LanguageCode = None,
+        publicationDemographic: PublicationDemographic = None,
+        ids: List[TypeOrId[Manga]] = None,
+        contentRating: ContentRating = None,
+        createdAtSince: datetime = None,
+        updatedAtSince: datetime = None,
+        order: MangaSortOrder = None,
+        limit: int = 10,
+        offset: int = 0,
+        cursor: MangaCursor = None,
+    ) -> AsyncPaginatedRequest[Manga]:
+        ...
+
+    @validate_arguments
+    async def get(self, manga: TypeOrId[Manga]) -> Manga:
+        if (cached := self.api._cached("manga", manga)) is not None:
+            return cached
+        return self.api._parse(await self.api._make_request(
+            Endpoints.Manga.GET,
+            urlparams={"manga": manga}
+        ))
+
+    @validate_arguments
+    async def delete(self, manga: TypeOrId[Manga]) -> None:
+        await self.api._make_request(
+            Endpoints.Manga.DELETE,
+            urlparams={"manga": manga}
+        )
+        self.api._invalidate(manga)
+
+    @validate_arguments
+    async def follow(self, manga: TypeOrId[Manga]) -> None:
+        await self.api._make_request(
+            Endpoints.Manga.FOLLOW,
+            urlparams={"manga": manga}
+        )
+
+    @validate_arguments
+    async def unfollow(self, manga: TypeOrId[Manga]) -> None:
+        await self.api._make_request(
+            Endpoints.Manga.UNFOLLOW,
+            urlparams={"manga": manga}
+        )
+
+    async def all_tags(self) -> List[Tag]:
+        return [
+            self.api._parse(i.get("data"))
+            for i in await self.api._make_request(Endpoints.Manga.TAGS)
+        ]
+
+    @validate_arguments
+    async def get_batch_read(self, ids: List[TypeOrId[Manga]]) -> List[UUID]:
+        if len(ids) == 0:
+            return []
+        return await self.api._make_request(
+            Endpoints.Manga.BATCH_GET_READ, params={"ids": ids}
+        )
+
+    async def random(self) -> Manga:
+        return self.api._parse(
+            await self.api._make_request(Endpoints.Manga.RANDOM)
+        )
+
+    async def _create(self, **kwargs):
+        kwargs["version"] = 1
+        return await self.api._make_request(Endpoints.Manga.CREATE, kwargs)
+
+    @validate_arguments
+    @shadows(_create)
+    def create(
+        self,
+        title: LocalizedString,
+        altTitles: List[LocalizedString],
+        description: LocalizedString,
+        authors: List[TypeOrId[Author]],
+        artists: List[TypeOrId],
+        links: List[Dict[LinksKey, str]],
+        originalLanguage: LanguageCode,
+        year: Year,
+        lastVolume: str = None,
+        lastChapter: str = None,
+        publicationDemographic: PublicationDemographic = None,
+        status: Status = None,
+        contentRating: ContentRating = None,
+    ) -> Manga:
+        ...
+
+    async def _edit(self, **kwargs):
+        manga = kwargs.pop("manga")
+        resp = await self.api._make_request(
+            Endpoints.Manga.EDIT, kwargs,
+            urlparams={"manga": manga}
+        )
+        self.api._invalidate(manga)
+        return resp
+
+    @validate_arguments
+    @shadows(_edit)
+    def edit(
+        self,
+        manga: TypeOrId[Manga],
+        title: LocalizedString,
+        altTitles: List[LocalizedString],
+        description: LocalizedString,
+        authors: List[TypeOrId[Author]],
+        artists: List[TypeOrId],
+        links: Dict[LinksKey, str],
+        originalLanguage: LanguageCode,
+        version: Version,
+        year: CanUnset[Year] = None,
+        lastVolume: CanUnset[str] = None,
+        lastChapter: CanUnset[str] = None,
+        publicationDemographic: CanUnset[PublicationDemographic] = None,
+        status: CanUnset[Status] = None,
+        contentRating: CanUnset[ContentRating] = None,
+    ) -> Manga:
+        ...
+
+    def _get_chapters(self, limit=None, offset=None, cursor=None, **kwargs):
+        manga = kwargs.pop("manga")
+        if cursor is not None:
+            return AsyncCursorPaginatedRequest(
+                self.api, Endpoints.Manga.CHAPTERS, params=kwargs,
+                urlparams={"manga": manga}, limit=limit, offset=offset,
+                cursor=cursor, order_type=ChapterSortOrder,
+            )
+        return AsyncPaginatedRequest(
+            self.api, Endpoints.Manga.CHAPTERS, params=kwargs,
+            urlparams={"manga": manga}, limit=limit, offset=offset,
+        )
+
+    @validate_arguments
+    @shadows(_get_chapters)
+    def get_chapters(
+        self,
+        manga: TypeOrId[Manga],
+        translatedLanguage: List[LanguageCode] = None,
+        createdAtSince: datetime = None,
+        updatedAtSince: datetime = None,
+        publishAtSince: datetime = None,
+        order: ChapterSortOrder = None,
+        limit: int = 10,
+        offset: int = 0,
+        cursor: ChapterCursor = None,
+    ) -> AsyncPaginatedRequest:
+        ...
+
+    @validate_arguments
+    async def get_read(self, manga: TypeOrId[Manga]):
+        return await self.api._make_request(
+            Endpoints.Manga.MARK_READ,
+            urlparams={"manga": manga}
+        )
+
+    @validate_arguments
+    async def set_status(self, manga: TypeOrId[Manga], status: ReadingStatus):
+        return await self.api._make_request(
+            Endpoints.Manga.SET_STATUS,
+            urlparams={"manga": manga},
+            body={"status": status}
+        )
+
+    @validate_arguments
+    async def add_to_list(
+        self, manga: TypeOrId[Manga], list: TypeOrId[CustomList]
+    ):
+        await self.api._make_request(
+            Endpoints.Manga.ADD_TO_LIST,
+            urlparams={"manga": manga, "list": list}
+        )
+
+    @validate_arguments
+    async def remove_from_list(
+        self, manga: TypeOrId[Manga], list: TypeOrId[CustomList]
+    ):
+        await self.api._make_request(
+            Endpoints.Manga.REMOVE_FROM_LIST,
+            urlparams={"manga": manga, "list": list}
+        )
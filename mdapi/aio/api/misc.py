@@ -0,0 +1,78 @@
+from typing import List
+
+from ...util import TTLCache, validate_arguments
+from ...endpoints import Endpoints
+from ...nodes import AT_HOME_TTL, at_home_ttl
+from ...schema import TypeOrId, Chapter, LegacyType, MappingID
+from .base import AsyncAPIBase
+
+
+class AsyncMiscAPI(AsyncAPIBase):
+    """
+    Asyncio counterpart of `mdapi.api.misc.MiscAPI`.
+    """
+
+    def __init__(self, md, api):
+        super().__init__(md, api)
+        self._at_home = TTLCache(AT_HOME_TTL)
+
+    @validate_arguments
+    async def get_md_at_home_url(
+        self, chapter: TypeOrId[Chapter], force_port_443: bool = False
+    ):
+        """
+        Get an MD@H base URL for a chapter. See
+        `mdapi.api.misc.MiscAPI.get_md_at_home_url`.
+        """
+        key = (chapter, force_port_443)
+        if (base := self._at_home.get(key)) is not None:
+            return base
+
+        resp, headers = await self.api._make_request(
+            Endpoints.GET_MD_AT_HOME, urlparams={
+                "chapter": chapter
+            }, params={
+                "forcePort443": True if force_port_443 else None
+            }, with_headers=True
+        )
+        base = resp["baseUrl"]
+        self._at_home.set(key, base, at_home_ttl(headers))
+        return base
+
+    @validate_arguments
+    def invalidate_md_at_home_url(self, chapter: TypeOrId[Chapter]):
+        """
+        Forget the cached MD@H base URLs for a chapter.
+        """
+        self._at_home.pop((chapter, False))
+        self._at_home.pop((chapter, True))
+
+    @validate_arguments
+    async def solve_captcha(self, challenge: str):
+        await self.api._make_request(Endpoints.SOLVE_CAPTCHA, body={
+            "captchaChallenge": challenge
+        })
+
+    @validate_arguments
+    async def legacy_mapping(
+        self, manga_ids: List[int], type: LegacyType = "manga"
+    ) -> List[MappingID]:
+        return [
+            self.api._parse(i.get("data", i))
+            for i in await self.api._make_request(
+                Endpoints.LEGACY_MAPPING, body={
+                    "type": type,
+                    "ids": manga_ids
+                }
+            )
+        ]
+
+    @validate_arguments
+    async def report_mdah(
+        self, url: str, success: bool, cached: bool, num_bytes: int,
+        duration: int
+    ):
+        await self.api._make_request(Endpoints.MDAH_REPORT, body={
+            "url": url, "success": success, "cached": cached,
+            "bytes": num_bytes, "duration": duration
+        })
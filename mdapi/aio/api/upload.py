@@ -0,0 +1,87 @@
+from typing import List, BinaryIO
+
+from ...util import validate_arguments
+from ...endpoints import Endpoints
+from ...schema import (
+    TypeOrId, Manga, ScanlationGroup, UploadSession, UploadSessionFile
+)
+from .base import AsyncAPIBase
+
+
+class AsyncUploadAPI(AsyncAPIBase):
+    """
+    Asyncio counterpart of `mdapi.api.upload.UploadAPI`.
+    """
+
+    async def get_session(self):
+        return self.api._parse(
+            await self.api._make_request(Endpoints.Upload.GET_SESSION)
+        )
+
+    @validate_arguments
+    async def begin(
+        self,
+        manga: TypeOrId[Manga],
+        groups: List[TypeOrId[ScanlationGroup]]
+    ):
+        return self.api._parse(
+            await self.api._make_request(Endpoints.Upload.BEGIN, body={
+                "manga": manga, "groups": groups
+            })
+        )
+
+    async def upload_images(
+        self,
+        session: TypeOrId[UploadSession],
+        files: List[BinaryIO]
+    ):
+        session = TypeOrId.return_type(session)
+        files = {f"file{n + 1}": i for n, i in enumerate(files)}
+        return [
+            self.api._parse(i.get("data"))
+            for i in await self.api._make_request(
+                Endpoints.Upload.ADD_IMAGE, urlparams={"session": session},
+                files=files
+            )
+        ]
+
+    @validate_arguments
+    async def delete_image(
+        self,
+        session: TypeOrId[UploadSession],
+        file: TypeOrId[UploadSessionFile]
+    ):
+        await self.api._make_request(
+            Endpoints.Upload.DELETE_IMAGE, urlparams={
+                "session": session, "file": file
+            }
+        )
+
+    @validate_arguments
+    async def abandon(self, session: TypeOrId[UploadSession]):
+        await self.api._make_request(
+            Endpoints.Upload.ABADON, urlparams={"session": session}
+        )
+
+    @validate_arguments
+    async def commit(
+        self,
+        session: TypeOrId[UploadSession],
+        page_order: TypeOrId[UploadSessionFile],
+        volume: str,
+        chapter: str,
+        title: str,
+        translated_language: str
+    ):
+        return self.api._parse(await self.api._make_request(
+            Endpoints.Upload.COMMIT, urlparams={"session": session},
+            body={
+                "chapterDraft": {
+                    "volume": volume,
+                    "chapter": chapter,
+                    "title": title,
+                    "translatedLanguage": translated_language,
+                },
+                "pageOrder": page_order
+            }
+        ))
@@ -0,0 +1,54 @@
+from ...util import validate_arguments
+from ...endpoints import Endpoints
+from ...schema import TypeOrId, User
+from ..util import AsyncPaginatedRequest
+from .base import AsyncAPIBase
+
+
+class AsyncUserAPI(AsyncAPIBase):
+    """
+    Asyncio counterpart of `mdapi.api.user.UserAPI`.
+    """
+
+    @validate_arguments
+    def get_list(self, limit: int = 10, offset: int = 0):
+        return AsyncPaginatedRequest(
+            self.api, Endpoints.User.LIST, limit=limit, offset=offset
+        )
+
+    @validate_arguments
+    def get_list_for(
+        self, user: TypeOrId[User], limit: int = 10, offset: int = 0
+    ):
+        return AsyncPaginatedRequest(
+            self.api,
+            Endpoints.User.OTHER_LIST,
+            urlparams={
+                "user": user
+            },
+            limit=limit, offset=offset
+        )
+
+    async def get_self(self) -> User:
+        return self.api._parse(
+            await self.api._make_request(Endpoints.User.GET_ME)
+        )
+
+    @validate_arguments
+    def get_followed_groups(self, limit: int = 10, offset: int = 0):
+        return AsyncPaginatedRequest(
+            self.api, Endpoints.User.FOLLOWS_GROUP, limit=limit, offset=offset
+        )
+
+    @validate_arguments
+    def get_followed_chapters(self, limit: int = 10, offset: int = 0):
+        return AsyncPaginatedRequest(
+            self.api, Endpoints.User.FOLLOWS_CHAPTERS,
+            limit=limit, offset=offset
+        )
+
+    @validate_arguments
+    def get_followed_manga(self, limit: int = 10, offset: int = 0):
+        return AsyncPaginatedRequest(
+            self.api, Endpoints.User.FOLLOWS_MANGA, limit=limit, offset=offset
+        )
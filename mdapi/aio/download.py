@@ -0,0 +1,84 @@
+from typing import List, Optional, Tuple
+
+from ..download import (
+    ChapterManifest, DownloadProgress, PageProgress, PageResult,
+    chapter_pages, link_stored_page, prepare_chapter, read_stored_page,
+    save_page_data, save_page_file
+)
+from .util import run_blocking
+
+
+async def plan_chapter(
+    chapter_api, chapter, dest: str, data_saver: bool = False,
+    incremental: bool = True
+) -> Tuple[List[PageResult], Optional[ChapterManifest]]:
+    """
+    The asyncio counterpart of `mdapi.download.plan_chapter`. Reading
+    ``dest`` runs in the loop's default executor.
+    """
+    pages, manifest = await run_blocking(
+        prepare_chapter, chapter, dest, data_saver, incremental
+    )
+    if pages is None:
+        urls = await chapter_api.page_urls_for(chapter, data_saver)
+        pages = await run_blocking(chapter_pages, urls, dest, manifest)
+    return pages, manifest
+
+
+async def download_page_file(
+    chapter_api, result: PageResult, tracker: DownloadProgress,
+    follow_redirect: bool = False, report_mdah: bool = True,
+    manifest: Optional[ChapterManifest] = None,
+    timeout: Optional[float] = None
+):
+    """
+    The asyncio counterpart of `mdapi.download.download_page_file`. File
+    I/O runs in the loop's default executor.
+    """
+    progress = PageProgress(result, tracker)
+    store = chapter_api.api.page_store
+    try:
+        if await run_blocking(link_stored_page, store, result, manifest):
+            return
+        async for chunk, total_length in chapter_api.download_page_to_path(
+            result.url, result.path, follow_redirect, report_mdah,
+            timeout=timeout, stats=result.stats
+        ):
+            progress.advance(chunk, total_length)
+        await run_blocking(save_page_file, store, result, manifest)
+    except Exception as e:
+        progress.failed(e)
+
+
+async def download_page_data(
+    chapter_api, result: PageResult, tracker: DownloadProgress,
+    follow_redirect: bool = False, report_mdah: bool = True,
+    timeout: Optional[float] = None
+) -> Optional[bytes]:
+    """
+    The asyncio counterpart of `mdapi.download.download_page_data`. The
+    client's `mdapi.store.PageStore` is used in the loop's default
+    executor.
+    """
+    progress = PageProgress(result, tracker)
+    store = chapter_api.api.page_store
+    data = bytearray()
+    try:
+        if (
+            stored := await run_blocking(read_stored_page, store, result)
+        ) is not None:
+            return stored
+        async for chunk, total_length in chapter_api.download_page(
+            result.url, follow_redirect, report_mdah, timeout=timeout,
+            stats=result.stats
+        ):
+            progress.advance(chunk, total_length)
+            data += chunk
+        progress.check_length()
+        return await run_blocking(save_page_data, store, result, data)
+    except Exception as e:
+        progress.failed(e)
+        return None
+
+
+__all__ = ("plan_chapter", "download_page_file", "download_page_data")
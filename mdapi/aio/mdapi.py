@@ -0,0 +1,247 @@
+import os
+import asyncio
+import functools
+from enum import Enum
+
+import aiohttp
+
+from ..exceptions import MdException, RefreshTokenFailed
+from ..endpoints import Endpoints
+from ..mdapi import APIHandler
+from ..util import _is_token_expired
+from .api import (
+    AsyncAccountAPI, AsyncAuthAPI, AsyncAuthorAPI, AsyncChapterAPI,
+    AsyncGroupAPI, AsyncListAPI, AsyncMangaAPI, AsyncMiscAPI, AsyncUserAPI,
+    AsyncCoverAPI, AsyncUploadAPI
+)
+from .util import AsyncMdahReporter, AsyncSingleFlight
+
+
+def _query_pairs(params):
+    """
+    Flatten a query dict into the ``(key, value)`` pairs ``requests``
+    would have sent for it. ``aiohttp`` only accepts strings and
+    numbers, and doesn't expand lists.
+    """
+    pairs = []
+    for k, v in (params or {}).items():
+        for i in (v if isinstance(v, (list, tuple)) else (v, )):
+            if i is None:
+                continue
+            if isinstance(i, Enum):
+                i = i.value
+            pairs.append((k, str(i)))
+    return pairs
+
+
+class AsyncAPIHandler(APIHandler):
+    """
+    An `mdapi.mdapi.APIHandler` that performs requests with ``aiohttp``.
+    Request serialisation and response handling are inherited, so this
+    only swaps out the transport.
+    """
+
+    def __init__(self, md, **kwargs):
+        super().__init__(md, **kwargs)
+        self._check_pending = False
+        self.reporter = AsyncMdahReporter(md)
+        self.flights = AsyncSingleFlight()
+
+    def _create_session(self) -> aiohttp.ClientSession:
+        # aiohttp has no notion of non-blocking pool overflow, so the pool
+        # sizes are always treated as hard limits.
+        connector = aiohttp.TCPConnector(
+            limit=self.pool_connections * self.pool_maxsize,
+            limit_per_host=self.pool_maxsize,
+            force_close=not self.keep_alive,
+        )
+        return aiohttp.ClientSession(
+            connector=connector, headers={"User-Agent": self.UA}
+        )
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        """
+        The pooled ``aiohttp`` session shared by every request this
+        client makes. It is created on first use, so must be accessed
+        from within a running event loop.
+        """
+        pid = os.getpid()
+        if (
+            self._session is None or self._session_pid != pid
+            or self._session.closed
+        ):
+            self._session = self._create_session()
+            self._session_pid = pid
+        return self._session
+
+    async def close(self) -> None:
+        await self.reporter.flush(self.reporter.FLUSH_TIMEOUT)
+        if self._session is not None and self._session_pid == os.getpid():
+            await self._session.close()
+        self._session = None
+        self._session_pid = None
+
+    def _load_auth(self):
+        # Refreshing needs a request, so defer it to the first call
+        self._check_pending = self._read_auth()
+
+    async def _check_expired(self, silent_error=False):
+        silent_error = silent_error or self._check_pending
+        self._check_pending = False
+
+        if self._auth is None:
+            return
+
+        if _is_token_expired(self._auth["session"]):
+            try:
+                await self.md.auth.refresh()
+            except MdException:
+                if silent_error:
+                    self.user = self._auth = None
+                else:
+                    raise RefreshTokenFailed()
+
+    async def _make_request(
+        self, action, body=None, params=None, urlparams=None, auth=True,
+        files=None, with_headers=False
+    ):
+        """
+        Make a request to ``action``, returning its decoded response. If
+        ``with_headers`` is set, ``(response, headers)`` is returned
+        instead.
+        """
+        if action != Endpoints.Auth.REFRESH:
+            await self._check_expired()
+
+        method, url, json_body, query, headers = self._prepare_request(
+            action, body, params, urlparams, auth
+        )
+        fetch = functools.partial(
+            self._fetch, action, method, url, json_body, query, headers, files
+        )
+        flight = self._flight_key(method, url, query, headers, files)
+        if flight is None:
+            response = await fetch()
+        else:
+            response, shared = await self.flights.do(flight, fetch)
+            if shared:
+                self.metrics.add(coalesced=1)
+        resp = self._decode(*response)
+        return (resp, response[1]) if with_headers else resp
+
+    async def _fetch(
+        self, action, method, url, json_body, query, headers, files
+    ):
+        key, cached = self._cache_lookup(method, url, query, headers)
+        if self.retry:
+            self.retry_budget.deposit()
+
+        data = None
+        if files:
+            data = aiohttp.FormData()
+            for name, file_ in files.items():
+                data.add_field(name, file_)
+
+        retry = 0
+        while True:
+            if self.rate_limiter:
+                delay = self.rate_limiter.reserve(action)
+                if delay:
+                    await asyncio.sleep(delay)
+            self.metrics.add(requests=1)
+            try:
+                async with self.session.request(
+                    method, url,
+                    json=None if data is not None else json_body,
+                    data=data,
+                    params=_query_pairs(query),
+                    headers=headers
+                ) as req:
+                    self._log_response(method, str(req.url), req.headers)
+                    if self.rate_limiter:
+                        self.rate_limiter.update(
+                            action, req.status, req.headers
+                        )
+                    delay = None if req.ok else self._retry_delay(
+                        method, retry, files, req.status, req.headers,
+                        action
+                    )
+                    if delay is None:
+                        status, body = self._cache_response(
+                            key, cached, req.status, req.headers,
+                            await req.read()
+                        )
+                        return status, req.headers, body
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+                delay = self._retry_delay(method, retry, files)
+                if delay is None:
+                    raise
+            retry += 1
+            await asyncio.sleep(delay)
+
+
+class AsyncMdAPI:
+    """
+    An asyncio counterpart to `mdapi.MdAPI`. Every API group is present
+    with the same methods, but they must be awaited, and paginated
+    results are `mdapi.aio.AsyncPaginatedRequest` async iterators.
+    Options are the same as for `mdapi.MdAPI`.
+
+    Requires ``aiohttp``.
+    """
+
+    DEBUG = False
+
+    def __init__(
+        self, pool_connections=None, pool_maxsize=None, pool_block=None,
+        keep_alive=None, prefetch=None, lazy_results=None,
+        trusted_responses=None, validate_arguments=None, failover=None,
+        page_store=None, rate_limiter=None, retry=None,
+        response_cache=None, entity_cache=None, coalesce=None
+    ):
+        self.api = AsyncAPIHandler(
+            self,
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+            keep_alive=keep_alive,
+            prefetch=prefetch,
+            lazy_results=lazy_results,
+            trusted_responses=trusted_responses,
+            validate_arguments=validate_arguments,
+            failover=failover,
+            page_store=page_store,
+            rate_limiter=rate_limiter,
+            retry=retry,
+            response_cache=response_cache,
+            entity_cache=entity_cache,
+            coalesce=coalesce,
+        )
+        self.api.DEBUG = self.DEBUG
+
+        self.account = AsyncAccountAPI(self, self.api)
+        self.auth = AsyncAuthAPI(self, self.api)
+        self.author = AsyncAuthorAPI(self, self.api)
+        self.chapter = AsyncChapterAPI(self, self.api)
+        self.cover = AsyncCoverAPI(self, self.api)
+        self.group = AsyncGroupAPI(self, self.api)
+        self.list = AsyncListAPI(self, self.api)
+        self.manga = AsyncMangaAPI(self, self.api)
+        self.misc = AsyncMiscAPI(self, self.api)
+        self.user = AsyncUserAPI(self, self.api)
+        self.upload = AsyncUploadAPI(self, self.api)
+
+        self.api._load_auth()
+
+    async def close(self) -> None:
+        """
+        Release any pooled connections held by this client.
+        """
+        await self.api.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
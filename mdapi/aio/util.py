@@ -0,0 +1,363 @@
+import asyncio
+import functools
+from collections import deque
+from typing import (
+    AsyncIterator, Awaitable, Callable, Dict, Generic, Hashable, List,
+    Optional, Tuple, TypeVar
+)
+
+from ..schema import LazyType
+from ..util import (
+    CursorPaginatedRequest, _format_timestamp, _page_results
+)
+
+
+T = TypeVar("T")
+
+
+async def run_blocking(fn: Callable[..., T], *args, **kwargs) -> T:
+    """
+    Call ``fn`` in the running loop's default executor, so blocking file
+    I/O doesn't hold up the loop.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        None, functools.partial(fn, *args, **kwargs)
+    )
+
+
+class AsyncMdahReporter:
+    """
+    The asyncio counterpart of `mdapi.nodes.MdahReporter`. Reports are
+    sent as tasks on the running loop, ``num_workers`` at a time. At most
+    ``maxsize`` are held; when full, the oldest is cancelled. There's no
+    exit hook, as the loop is gone by then; closing the client flushes
+    instead.
+    """
+
+    MAXSIZE = 1000
+    FLUSH_TIMEOUT = 5
+
+    def __init__(self, md, num_workers: int = 2, maxsize: int = MAXSIZE):
+        self.md = md
+        self.maxsize = maxsize
+        self.dropped = 0
+        self._num_workers = num_workers
+        self._semaphore = None
+        # Used as an ordered set, oldest first
+        self._tasks: Dict[asyncio.Task, None] = {}
+
+    async def _send(self, report):
+        async with self._semaphore:
+            try:
+                await self.md.misc.report_mdah(*report)
+            except Exception:
+                # Reports are best effort
+                pass
+
+    def report(
+        self, url: str, success: bool, cached: bool, num_bytes: int,
+        duration: int
+    ):
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self._num_workers)
+        while self._tasks and len(self._tasks) >= self.maxsize:
+            oldest = next(iter(self._tasks))
+            del self._tasks[oldest]
+            oldest.cancel()
+            self.dropped += 1
+
+        task = asyncio.ensure_future(
+            self._send((url, success, cached, num_bytes, duration))
+        )
+        self._tasks[task] = None
+        task.add_done_callback(lambda t: self._tasks.pop(t, None))
+
+    async def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait for every queued report to be sent.
+
+        :returns: ``False`` if ``timeout`` ran out first
+        """
+        if not self._tasks:
+            return True
+        _, pending = await asyncio.wait(list(self._tasks), timeout=timeout)
+        return not pending
+
+
+class AsyncSingleFlight:
+    """
+    The asyncio counterpart of `mdapi.flight.SingleFlight`. The first
+    call for a key runs as a task on the running loop, which every call
+    made for the same key while it's running awaits. Cancelling one
+    waiter doesn't cancel the task, so the others still get its result.
+    """
+
+    def __init__(self):
+        self._tasks: Dict[Hashable, asyncio.Task] = {}
+
+    def _done(self, key, task):
+        if self._tasks.get(key) is task:
+            del self._tasks[key]
+        if not task.cancelled():
+            # Mark it retrieved, as every waiter may have been cancelled
+            task.exception()
+
+    async def do(
+        self, key: Hashable, fn: Callable[[], Awaitable[T]]
+    ) -> Tuple[T, bool]:
+        """
+        Await ``fn()``, unless a call for ``key`` is already running.
+
+        :returns: ``(result, shared)``. ``shared`` is ``True`` if the
+            result came from another call.
+        """
+        task = self._tasks.get(key)
+        shared = task is not None
+        if not shared:
+            task = self._tasks[key] = asyncio.ensure_future(fn())
+            task.add_done_callback(functools.partial(self._done, key))
+        return await asyncio.shield(task), shared
+
+
+class AsyncPaginatedRequest(Generic[T]):
+    """
+    The asyncio counterpart of `mdapi.util.PaginatedRequest`. Nothing is
+    requested until the first item or page is awaited. Prefetched pages
+    are requested as tasks on the running loop, as are the pages
+    requested concurrently by `fetch_all` and `iter_unordered`.
+    """
+
+    _LIMIT = 10
+
+    def __init__(
+        self, api, *args, limit=None, offset=None, params=None,
+        prefetch=None, lazy=None, trusted=None, **kwargs
+    ):
+        self.total = None
+        self.offset = offset if offset is not None else 0
+        self._limit = limit if limit is not None else self._LIMIT
+        self.has_more = True
+
+        self._results = None
+        self._params = params or {}
+        self._api = api
+        self._args = args
+        self._kwargs = kwargs
+
+        self.prefetch = api.prefetch if prefetch is None else prefetch
+        self.lazy = api.lazy_results if lazy is None else lazy
+        self.trusted = api.trusted_responses if trusted is None else trusted
+        self._pending = deque()
+        self._next_offset = None
+        self._step = 0
+
+    def _request(self, offset):
+        return self._api._make_request(*self._args, **self._kwargs, params={
+            **self._params,
+            "offset": offset,
+            "limit": self._limit
+        })
+
+    def _schedule_prefetch(self, step) -> None:
+        if self.prefetch <= 0 or step <= 0:
+            return
+
+        if self._next_offset is None or self._next_offset < self.offset:
+            self._next_offset = self.offset
+
+        while (
+            len(self._pending) < self.prefetch
+            and self._next_offset < self.total
+        ):
+            self._pending.append(
+                asyncio.ensure_future(self._request(self._next_offset))
+            )
+            self._next_offset += step
+
+    async def _get_next(self) -> None:
+        if self._pending:
+            results = await self._pending.popleft()
+        else:
+            results = await self._request(self.offset)
+
+        self.total = results.get("total", 0)
+        self._step = results.get("limit", 0)
+        self.offset += self._step
+        self._results = _page_results(results)
+        self.has_more = self.offset < self.total
+
+        if self.has_more:
+            self._schedule_prefetch(self._step)
+        else:
+            self.close()
+
+    def close(self) -> None:
+        """
+        Cancel any outstanding prefetches.
+        """
+        while self._pending:
+            self._pending.pop().cancel()
+
+    def __aiter__(self) -> AsyncIterator[T]:
+        return self
+
+    async def _ensure_populated(self) -> bool:
+        if self._results is None or len(self._results) == 0:
+            if self.total is not None and self.offset >= self.total:
+                return False
+            await self._get_next()
+        return True
+
+    async def __anext__(self) -> T:
+        if not await self._ensure_populated() or len(self._results) == 0:
+            raise StopAsyncIteration
+
+        return self._parse(self._results.popleft())
+
+    def _parse(self, result) -> T:
+        if self.lazy:
+            return LazyType(result, self._parse_model)
+        return self._parse_model(result)
+
+    def _parse_model(self, result) -> T:
+        return self._api._parse(result, self.trusted)
+
+    async def next_page(self) -> List[T]:
+        if not await self._ensure_populated():
+            return []
+        res, self._results = self._results, deque()
+        return [self._parse(i) for i in res]
+
+    async def _iter_pages(
+        self, concurrency: int, ordered: bool
+    ) -> AsyncIterator[deque]:
+        """
+        Yield the unparsed results of every remaining page, fetching them
+        ``concurrency`` at a time. See
+        `mdapi.util.PaginatedRequest._iter_pages`.
+        """
+        # The first page tells us how many there are
+        if not await self._ensure_populated():
+            return
+        if self._results:
+            yield self._results
+            self._results = deque()
+
+        # Pages already being prefetched are in order, so come first
+        pending, self._pending = self._pending, deque()
+        while pending:
+            yield _page_results(await pending.popleft())
+
+        start = self.offset if self._next_offset is None else max(
+            self.offset, self._next_offset
+        )
+        offsets = range(start, self.total or 0, self._step or self._limit)
+
+        self.offset = self._next_offset = max(self.total or 0, self.offset)
+        self.has_more = False
+        self.close()
+
+        if not offsets:
+            return
+
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+
+        async def fetch(offset):
+            async with semaphore:
+                return _page_results(await self._request(offset))
+
+        tasks = [asyncio.ensure_future(fetch(offset)) for offset in offsets]
+        try:
+            for task in (tasks if ordered else asyncio.as_completed(tasks)):
+                yield await task
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def iter_unordered(self, concurrency: int = 4) -> AsyncIterator[T]:
+        """
+        Iterate over every remaining result, requesting all remaining
+        pages concurrently. Pages are yielded as soon as they arrive, so
+        results are not in order.
+
+        :param concurrency: The maximum number of requests in flight
+        """
+        async for page in self._iter_pages(concurrency, ordered=False):
+            for result in page:
+                yield self._parse(result)
+
+    async def fetch_all(self, concurrency: int = 4) -> List[T]:
+        """
+        Fetch every remaining result, requesting all remaining pages
+        concurrently.
+
+        :param concurrency: The maximum number of requests in flight
+
+        :returns: Every remaining result, in order
+        """
+        return [
+            self._parse(result)
+            async for page in self._iter_pages(concurrency, ordered=True)
+            for result in page
+        ]
+
+
+class AsyncCursorPaginatedRequest(AsyncPaginatedRequest[T]):
+    """
+    The asyncio counterpart of `mdapi.util.CursorPaginatedRequest`. As
+    each page depends on the last, prefetching is unavailable and
+    `fetch_all` and `iter_unordered` fetch pages one at a time.
+    """
+
+    def __init__(
+        self, api, *args, cursor, order_type, limit=None, offset=None,
+        params=None, **kwargs
+    ):
+        params, since = CursorPaginatedRequest._cursor_params(
+            cursor, order_type, offset, params
+        )
+
+        self.cursor = cursor
+        self.watermark = None if since is None else _format_timestamp(since)
+        # IDs of the results seen with the watermark's timestamp
+        self._seen = set()
+
+        super().__init__(
+            api, *args, limit=limit, offset=0, params=params, prefetch=0,
+            **kwargs
+        )
+
+    # Neither touches the transport, so they're shared with the
+    # synchronous request
+    _request = CursorPaginatedRequest._request
+    _advance = CursorPaginatedRequest._advance
+
+    async def _get_next(self) -> None:
+        while True:
+            results = await self._request(self.offset)
+            page = _page_results(results)
+            if self.total is None:
+                self.total = results.get("total", 0)
+
+            self.has_more = results.get("total", 0) > self.offset + len(page)
+            self._results = self._advance(page)
+            if self._results or not self.has_more:
+                return
+
+    async def _ensure_populated(self) -> bool:
+        if self._results is None or len(self._results) == 0:
+            if self._results is not None and not self.has_more:
+                return False
+            await self._get_next()
+        return True
+
+    async def _iter_pages(
+        self, concurrency: int, ordered: bool
+    ) -> AsyncIterator[deque]:
+        while await self._ensure_populated():
+            page, self._results = self._results, deque()
+            yield page
+
+
+__all__ = ("AsyncPaginatedRequest", "AsyncCursorPaginatedRequest")
@@ -1,5 +1,4 @@
-from pydantic.decorator import validate_arguments
-
+from ..util import validate_arguments
 from ..endpoints import Endpoints
 from ..exceptions import MdException
 from .base import APIBase
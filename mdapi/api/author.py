@@ -1,10 +1,8 @@
 from typing import List
 
-from pydantic.decorator import validate_arguments
-
-from ..util import PaginatedRequest
+from ..util import PaginatedRequest, validate_arguments
 from ..endpoints import Endpoints
-from ..schema import Author, Type, TypeOrId, CanUnset, AuthorSortOrder
+from ..schema import Author, TypeOrId, CanUnset, AuthorSortOrder
 from .base import APIBase
 
 
@@ -23,7 +21,7 @@ class AuthorAPI(APIBase):
 
         :returns: The newly created author
         """
-        return Type.parse_obj(self.api._make_request(
+        return self.api._parse(self.api._make_request(
             Endpoints.Author.CREATE,
             body={"name": name}
         ))
@@ -38,7 +36,9 @@ class AuthorAPI(APIBase):
 
         :returns: The author, if found
         """
-        return Type.parse_obj(self.api._make_request(
+        if (cached := self.api._cached("author", author)) is not None:
+            return cached
+        return self.api._parse(self.api._make_request(
             Endpoints.Author.GET,
             urlparams={"author": author}
         ))
@@ -86,6 +86,7 @@ class AuthorAPI(APIBase):
         self.api._make_request(
             Endpoints.Author.EDIT, body=body, urlparams={"author": author.id}
         )
+        self.api._invalidate(author.id)
 
     @validate_arguments
     def delete(self, author: TypeOrId[Author]) -> None:
@@ -96,5 +97,6 @@ class AuthorAPI(APIBase):
             `mdapi.schema.Author` object, or their UUID.
         """
         self.api._make_request(
-            Endpoints.Author.delete, urlparams={"author": author}
+            Endpoints.Author.DELETE, urlparams={"author": author}
         )
+        self.api._invalidate(author)
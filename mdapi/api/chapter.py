@@ -1,18 +1,27 @@
 import os
-from typing import BinaryIO, Generator, List, Tuple
+import time
+from typing import BinaryIO, Callable, Generator, List, Optional, Tuple
 from datetime import datetime
 
-from pydantic.decorator import validate_arguments
 import requests
 
-from ..util import PaginatedRequest, shadows
+from ..util import (
+    CursorPaginatedRequest, PaginatedRequest, Worker, shadows,
+    validate_arguments
+)
+from ..archive import CbzWriter, comic_info
+from ..download import (
+    ChapterResult, DownloadProgress, DownloadStats, PageRequest, PageResult,
+    PartialPage, download_page_data, download_page_file, fail_over,
+    page_filename, plan_chapter, queue_pages
+)
 from ..endpoints import Endpoints
 from ..exceptions import (
-    DownloadException, NoFollowRedirect, InvalidStatusCode, InvalidFileLength
+    MdException, DownloadException, NoFollowRedirect, InvalidStatusCode
 )
 from ..schema import (
-    ChapterSortOrder, LanguageCode, Type, Manga, TypeOrId, Chapter,
-    ScanlationGroup, User, CanUnset
+    ChapterSortOrder, LanguageCode, Manga, TypeOrId, Chapter,
+    ScanlationGroup, User, CanUnset, ChapterCursor
 )
 from .base import APIBase
 
@@ -23,7 +32,13 @@ class ChapterAPI(APIBase):
     to the ``/chapter`` endpoints.
     """
 
-    def _search(self, limit=None, offset=None, **kwargs):
+    def _search(self, limit=None, offset=None, cursor=None, **kwargs):
+        if cursor is not None:
+            return CursorPaginatedRequest(
+                self.api, Endpoints.Chapter.SEARCH, params=kwargs,
+                limit=limit, offset=offset, cursor=cursor,
+                order_type=ChapterSortOrder,
+            )
         return PaginatedRequest(
             self.api, Endpoints.Chapter.SEARCH, params=kwargs,
             limit=limit, offset=offset,
@@ -47,6 +62,7 @@ class ChapterAPI(APIBase):
         order: ChapterSortOrder = None,
         limit: int = 10,
         offset: int = 0,
+        cursor: ChapterCursor = None,
     ):
         """
         Search for a manga.
@@ -65,6 +81,9 @@ class ChapterAPI(APIBase):
         :param order: The search order
         :param limit: The number of results per page
         :param offset: The offset to start from
+        :param cursor: Paginate by advancing this timestamp rather than
+            the offset. Results are ordered by it, ascending, so it
+            can't be combined with ``order`` or ``offset``.
         """
         ...
 
@@ -79,7 +98,7 @@ class ChapterAPI(APIBase):
 
         :returns: The chapter, if found
         """
-        return Type.parse_obj(self.api._make_request(
+        return self.api._parse(self.api._make_request(
             Endpoints.Chapter.GET,
             urlparams={"chapter": chapter}
         ))
@@ -154,7 +173,8 @@ class ChapterAPI(APIBase):
 
     @validate_arguments
     def page_urls_for(
-        self, chapter: Chapter, data_saver: bool = False
+        self, chapter: Chapter, data_saver: bool = False,
+        base: Optional[str] = None
     ) -> Generator[str, None, None]:
         """
         Get a list of all page image URLs for this chapter.
@@ -167,14 +187,16 @@ class ChapterAPI(APIBase):
 
         :param chater: The chapter to get the pages for
         :param data_saver: Should data-saver URLs be provided instead?
+        :param base: The MD@H node to use, rather than requesting one
 
         :returns: A generator that produces page URLs
         """
-        # Manual override for testing
-        if "MD_CHAPTER_BASE_URL" in os.environ:
-            base = os.environ.get("MD_CHAPTER_BASE_URL")
-        else:
-            base = self.api.md.misc.get_md_at_home_url(chapter)
+        if base is None:
+            # Manual override for testing
+            if "MD_CHAPTER_BASE_URL" in os.environ:
+                base = os.environ.get("MD_CHAPTER_BASE_URL")
+            else:
+                base = self.api.md.misc.get_md_at_home_url(chapter)
 
         base += "/data-saver/" if data_saver else "/data/"
         base += chapter.hash + "/"
@@ -182,9 +204,43 @@ class ChapterAPI(APIBase):
         for i in chapter.dataSaver if data_saver else chapter.data:
             yield base + i
 
+    def refresh_page_urls(
+        self, chapter: Chapter, data_saver: bool = False,
+        avoid: Optional[str] = None
+    ) -> List[str]:
+        """
+        Get page URLs for a chapter from a fresh MD@H node, after the
+        node serving ``avoid`` failed. Nodes that the client's
+        `mdapi.nodes.NodeTracker` knows to be unhealthy are skipped, up
+        to the failover policy's ``node_attempts``.
+
+        :param chater: The chapter to get the pages for
+        :param data_saver: Should data-saver URLs be provided instead?
+        :param avoid: A URL from the node being replaced
+
+        :returns: A list of page URLs
+        """
+        if "MD_CHAPTER_BASE_URL" in os.environ:
+            return list(self.page_urls_for(chapter, data_saver))
+
+        policy = self.api.failover
+        avoid = avoid and self.api.nodes.node_of(avoid)
+        for _ in range(max(1, policy.node_attempts)):
+            self.md.misc.invalidate_md_at_home_url(chapter)
+            base = self.md.misc.get_md_at_home_url(chapter)
+            if (
+                self.api.nodes.node_of(base) != avoid
+                and self.api.nodes.get(base).healthy(policy)
+            ):
+                break
+        return list(self.page_urls_for(chapter, data_saver, base))
+
     @validate_arguments
     def download_page(
-        self, url: str, follow_redirect: bool = False, report_mdah: bool = True
+        self, url: str, follow_redirect: bool = False,
+        report_mdah: bool = True, start: int = 0,
+        timeout: Optional[float] = None,
+        stats: Optional[DownloadStats] = None, restart: bool = False
     ) -> Generator[Tuple[bytes, int], None, None]:
         """
         Download a single page of a manga.
@@ -192,67 +248,62 @@ class ChapterAPI(APIBase):
         :param url: The URL for the page
         :param follow_redirect: Should redirects be followed?
         :param report_mdah: Report node statistics to MD@H.
+        :param start: The byte offset to start from, for resuming a
+            partial download. This is requested with a ``Range`` header;
+            if the server ignores it, the skipped bytes are discarded.
+        :param restart: If the server ignores ``start``, yield the whole
+            page instead. ``stats.offset`` tells the two apart.
+        :param timeout: Seconds to wait for the node to connect, or
+            between bytes, before giving up
+        :param stats: A `mdapi.download.DownloadStats` to record this
+            request's timings in. One is always recorded internally, for
+            MD@H reports and node health.
 
         .. note::
             Unless there is a good reason, it is recommended to always
             leave ``report_mdah`` set to ``True``, to ensure faulty
-            nodes are accurately monitored.
+            nodes are accurately monitored. Reports are sent in the
+            background by the client's `mdapi.nodes.MdahReporter`. The
+            same numbers are always recorded in its
+            `mdapi.nodes.NodeTracker`.
 
         :returns: A generator that yields ``(chunk, total_length)``.
+            ``total_length`` is the length of the whole page, even when
+            starting part way through.
         """
+        page = PageRequest(self.api, url, report_mdah, start, stats, restart)
         try:
-            req = requests.get(url, stream=True)
+            req = self.api.session.get(
+                url, stream=True, headers=page.headers, timeout=timeout
+            )
         except requests.RequestException:
-            if report_mdah:
-                self.md.misc.report_mdah(url, False, False, 0, 0)
+            page.report(False)
             raise DownloadException
+        page.stats.responded()
 
         if req.url != url and not follow_redirect:
-            if report_mdah:
-                self.md.misc.report_mdah(
-                    url, False, False, 0, req.elapsed.microseconds // 1000
-                )
+            page.report(False)
             raise NoFollowRedirect(req.url)
 
-        if req.status_code != 200:
-            if report_mdah:
-                self.md.misc.report_mdah(
-                    url, False, False, 0, req.elapsed.microseconds // 1000
-                )
+        if page.is_complete(req.status_code, req.headers):
+            # We already have the whole page
+            req.close()
+            return
 
+        if req.status_code not in (200, 206):
+            page.report(False)
             raise InvalidStatusCode(req.status_code, req.content)
 
-        is_cached = req.headers.get("X-Cache", "").startswith("HIT")
-        total_length = int(req.headers.get("Content-Length"))
-
-        if not total_length:
-            if report_mdah:
-                self.md.misc.report_mdah(
-                    url, False, is_cached, 0, req.elapsed.microseconds // 1000
-                )
-
-            raise InvalidFileLength(total_length)
-
-        chunk_size = 131072  # 0.125 MB
-        bytes_downloaded = 0
-
+        total_length = page.begin(req.status_code, req.headers)
         try:
-            for chunk in req.iter_content(chunk_size=chunk_size):
-                bytes_downloaded += len(chunk)
-                yield (chunk, total_length)
+            for chunk in req.iter_content(chunk_size=page.CHUNK_SIZE):
+                if chunk := page.received(chunk):
+                    yield (chunk, total_length)
         except requests.RequestException:
-            if report_mdah:
-                self.md.misc.report_mdah(
-                    url, False, is_cached, bytes_downloaded,
-                    req.elapsed.microseconds // 1000
-                )
+            page.report(False)
             raise DownloadException()
 
-        if report_mdah:
-            self.md.misc.report_mdah(
-                url, True, is_cached, bytes_downloaded,
-                req.elapsed.microseconds // 1000
-            )
+        page.report(True)
 
     def download_page_to(
         self,
@@ -280,3 +331,238 @@ class ChapterAPI(APIBase):
             output.write(chunk)
             if is_iter:
                 yield (downloaded, total_length)
+
+    def download_page_to_path(
+        self,
+        url: str, path: str, follow_redirect: bool = False,
+        report_mdah: bool = True, attempts: int = 3,
+        timeout: Optional[float] = None,
+        stats: Optional[DownloadStats] = None
+    ) -> Generator[Tuple[bytes, int], None, None]:
+        """
+        Download a page to a file, resuming where a previous attempt left
+        off. Data is written to ``<path>.part``, which is renamed to
+        ``path`` once its size matches the page's ``Content-Length``.
+
+        If the connection drops part way through, the request is reissued
+        with a ``Range`` header, up to ``attempts`` times in total. Any
+        ``.part`` file left behind by an earlier failure is resumed too.
+        If the server ignores the ``Range`` and sends the whole page, the
+        ``.part`` file is started over.
+
+        :param url: The URL for the page
+        :param path: The path to save the page to
+        :param follow_redirect: Should redirects be followed?
+        :param report_mdah: Report node statistics to MD@H.
+        :param attempts: The maximum number of requests to make
+        :param timeout: Seconds to wait for the node to connect, or
+            between bytes, before giving up on a request
+        :param stats: A `mdapi.download.DownloadStats` to record the
+            timings of the last request in
+
+        :returns: A generator that yields ``(chunk, total_length)`` for
+            every chunk written. It must be iterated to completion.
+        """
+        if stats is None:
+            stats = DownloadStats(url)
+        part = PartialPage(path, stats)
+        for attempt in range(max(1, attempts)):
+            start = part.open()
+            try:
+                try:
+                    for chunk, total_length in self.download_page(
+                        url, follow_redirect, report_mdah, start=start,
+                        timeout=timeout, stats=stats, restart=True
+                    ):
+                        part.write(chunk)
+                        yield (chunk, total_length)
+                    part.ended()
+                finally:
+                    part.close()
+            except DownloadException as e:
+                if part.failed(e, attempt < attempts - 1):
+                    continue
+                raise
+
+            if part.complete():
+                return
+
+        raise DownloadException()
+
+    def download_chapter(
+        self,
+        chapter: Chapter, dest: str, concurrency: int = 4,
+        data_saver: bool = False, follow_redirect: bool = False,
+        report_mdah: bool = True, incremental: bool = True,
+        progress: Optional[Callable[[DownloadProgress], None]] = None,
+    ) -> ChapterResult:
+        """
+        Download every page of a chapter into a directory, several pages
+        at a time. Pages are saved as ``001.png``, ``002.png``, etc.,
+        alongside a `mdapi.download.ChapterManifest` recording them.
+
+        A page that fails to download doesn't stop the others; its error
+        is recorded on its `mdapi.download.PageResult`. Pages that fail
+        are retried on a fresh MD@H node, as configured by the client's
+        `mdapi.nodes.FailoverPolicy`.
+
+        :param chapter: The chapter to download
+        :param dest: The directory to save pages into. It is created if
+            it doesn't exist.
+        :param concurrency: The number of pages to download at once
+        :param data_saver: Should data-saver pages be downloaded instead?
+        :param follow_redirect: Should redirects be followed?
+        :param report_mdah: Report node statistics to MD@H.
+        :param incremental: Skip pages already downloaded into ``dest``
+            by an earlier call, as long as the chapter hasn't changed.
+            If every page is there, nothing is requested at all.
+        :param progress: Called with a `mdapi.download.DownloadProgress`
+            whenever data arrives or a page finishes. This is called
+            from worker threads.
+
+        :returns: The result of every page, in chapter order
+        """
+        results, manifest = plan_chapter(
+            self, chapter, dest, data_saver, incremental
+        )
+        tracker = DownloadProgress(len(results), progress)
+        queued = queue_pages(results, tracker)
+
+        def fetch(result: PageResult):
+            download_page_file(
+                self, result, tracker, follow_redirect, report_mdah,
+                manifest, self.api.failover.timeout
+            )
+
+        self._download_pages(
+            chapter, queued, concurrency, data_saver, fetch,
+            tracker.finished
+        )
+        return ChapterResult(chapter, results)
+
+    def download_chapter_archive(
+        self,
+        chapter: Chapter, path: str, concurrency: int = 4,
+        data_saver: bool = False, follow_redirect: bool = False,
+        report_mdah: bool = True, manga: Optional[Manga] = None,
+        info: bool = True,
+        progress: Optional[Callable[[DownloadProgress], None]] = None,
+    ) -> ChapterResult:
+        """
+        Download every page of a chapter straight into a CBZ archive,
+        using `mdapi.archive.CbzWriter`. Pages are held in memory until
+        they're complete, rather than written to their own files first.
+        Pages are retried as in `download_chapter`, and any that still
+        fail are left out of the archive.
+
+        :param chapter: The chapter to download
+        :param path: The path to save the archive to
+        :param concurrency: The number of pages to download at once
+        :param data_saver: Should data-saver pages be downloaded instead?
+        :param follow_redirect: Should redirects be followed?
+        :param report_mdah: Report node statistics to MD@H.
+        :param manga: The chapter's manga, for ``ComicInfo.xml``. It's
+            requested if not given.
+        :param info: Should ``ComicInfo.xml`` be included?
+        :param progress: Called with a `mdapi.download.DownloadProgress`
+            whenever data arrives or a page finishes. This is called
+            from worker threads.
+
+        :returns: The result of every page, in chapter order. Each page's
+            ``path`` is its name within the archive.
+        """
+        urls = list(self.page_urls_for(chapter, data_saver))
+        if info and manga is None and chapter.manga is not None:
+            manga = self.md.manga.get(chapter.manga.id)
+
+        results = [
+            PageResult(n, url, page_filename(n, url))
+            for n, url in enumerate(urls)
+        ]
+        tracker = DownloadProgress(len(results), progress)
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        with CbzWriter(path) as writer:
+            def fetch(result: PageResult):
+                data = download_page_data(
+                    self, result, tracker, follow_redirect, report_mdah,
+                    self.api.failover.timeout
+                )
+                if data is not None:
+                    writer.add(result.index, result.path, data)
+
+            def finished(result: PageResult):
+                if not result.ok:
+                    writer.skip(result.index)
+                tracker.finished(result)
+
+            self._download_pages(
+                chapter, results, concurrency, data_saver, fetch, finished
+            )
+            if info:
+                writer.info = comic_info(
+                    chapter, manga, sum(i.ok for i in results)
+                )
+
+        return ChapterResult(chapter, results)
+
+    def _download_pages(
+        self, chapter: Chapter, queued: List[PageResult], concurrency: int,
+        data_saver: bool, fetch: Callable[[PageResult], None],
+        finished: Callable[[PageResult], None]
+    ):
+        """
+        Call ``fetch`` for each page, several at a time, retrying the
+        pages that failed on a fresh MD@H node as configured by the
+        client's `mdapi.nodes.FailoverPolicy`. ``finished`` is called
+        once a page won't be retried again.
+
+        An exception from ``fetch`` is recorded on the page's result. One
+        from ``finished`` (such as a progress callback failing) is raised
+        once every page has finished.
+        """
+        policy = self.api.failover
+        errors = []
+
+        def finish(result: PageResult):
+            try:
+                finished(result)
+            except Exception as e:
+                errors.append(e)
+
+        def download(result: PageResult):
+            try:
+                fetch(result)
+            except Exception as e:
+                result.error = e
+            if not policy.retry_page(result):
+                finish(result)
+
+        while queued:
+            worker = Worker(download, num_workers=max(1, min(
+                concurrency, len(queued)
+            )))
+            for result in queued:
+                worker.enqueue(result)
+            worker.start()
+            worker.join()
+
+            # Retry only the pages that failed, on a fresh node
+            failed = [i for i in queued if policy.retry_page(i)]
+            if not failed:
+                break
+            time.sleep(policy.delay(failed[0].retries))
+            try:
+                urls = self.refresh_page_urls(
+                    chapter, data_saver, failed[0].url
+                )
+            except (MdException, requests.RequestException):
+                for result in failed:
+                    finish(result)
+                break
+            fail_over(failed, urls)
+            queued = failed
+
+        if errors:
+            raise errors[0]
@@ -1,11 +1,9 @@
 from typing import List, BinaryIO
 
-from pydantic.decorator import validate_arguments
-
-from ..util import PaginatedRequest
+from ..util import PaginatedRequest, validate_arguments
 from ..endpoints import Endpoints
 from ..schema import (
-    Author, TypeOrId, CanUnset, CoverSortOrder, Cover, Manga, User, Type
+    Author, TypeOrId, CanUnset, CoverSortOrder, Cover, Manga, User
 )
 from .base import APIBase
 
@@ -29,7 +27,7 @@ class CoverAPI(APIBase):
         self, manga: TypeOrId[Manga], file_: BinaryIO
     ) -> Cover:
         manga = TypeOrId.return_type(manga)
-        return Type.parse_obj(self.api._make_request(
+        return self.api._parse(self.api._make_request(
             Endpoints.Cover.UPLOAD, urlparams={"manga": manga},
             files={"file": file_}
         ))
@@ -44,12 +42,15 @@ class CoverAPI(APIBase):
             body["volume"] = volume
         if description is not None:
             body["description"] = volume
-        return Type.parse_obj(self.api._make_request(
+        resp = self.api._make_request(
             Endpoints.Cover.EDIT, body=body, urlparams={"cover": cover.id}
-        ))
+        )
+        self.api._invalidate(cover.id)
+        return self.api._parse(resp)
 
     @validate_arguments
     def delete(self, cover: TypeOrId[Author]) -> None:
         self.api._make_request(
             Endpoints.Cover.DELETE, urlparams={"cover": cover}
         )
+        self.api._invalidate(cover)
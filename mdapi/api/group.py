@@ -1,10 +1,8 @@
 from typing import List, Optional
 
-from pydantic.decorator import validate_arguments
-
-from ..util import PaginatedRequest
+from ..util import PaginatedRequest, validate_arguments
 from ..endpoints import Endpoints
-from ..schema import Type, TypeOrId, User, ScanlationGroup
+from ..schema import TypeOrId, User, ScanlationGroup
 from .base import APIBase
 
 
@@ -28,7 +26,7 @@ class GroupAPI(APIBase):
         leader: TypeOrId[User],
         members: List[TypeOrId[User]]
     ) -> ScanlationGroup:
-        return Type.parse_obj(self.api._make_request(
+        return self.api._parse(self.api._make_request(
             Endpoints.Group.CREATE, body={
                 "name": name,
                 "leader": leader,
@@ -38,7 +36,9 @@ class GroupAPI(APIBase):
 
     @validate_arguments
     def get(self, group: TypeOrId[ScanlationGroup]) -> ScanlationGroup:
-        return Type.parse_obj(self.api._make_request(
+        if (cached := self.api._cached("scanlation_group", group)) is not None:
+            return cached
+        return self.api._parse(self.api._make_request(
             Endpoints.Group.GET, urlparams={
                 "group": group
             }
@@ -52,7 +52,7 @@ class GroupAPI(APIBase):
         leader: TypeOrId[User],
         members: List[TypeOrId[User]]
     ) -> ScanlationGroup:
-        return Type.parse_obj(self.api._make_request(
+        resp = self.api._make_request(
             Endpoints.Group.EDIT, body={
                 "name": name,
                 "leader": leader,
@@ -61,13 +61,16 @@ class GroupAPI(APIBase):
             }, urlparams={
                 "group": group.id
             }
-        ))
+        )
+        self.api._invalidate(group.id)
+        return self.api._parse(resp)
 
     @validate_arguments
     def delete(self, group: TypeOrId[ScanlationGroup]):
         self.api._make_request(
             Endpoints.Group.DELETE, urlparams={"group": group}
         )
+        self.api._invalidate(group)
 
     @validate_arguments
     def follow(self, group: TypeOrId[ScanlationGroup]):
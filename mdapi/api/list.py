@@ -1,10 +1,8 @@
 from typing import List
 
-from pydantic import validate_arguments
-
-from ..util import PaginatedRequest
+from ..util import PaginatedRequest, validate_arguments
 from ..endpoints import Endpoints
-from ..schema import TypeOrId, Type, CustomListVisibility, Manga, CustomList
+from ..schema import TypeOrId, CustomListVisibility, Manga, CustomList
 from .base import APIBase
 
 
@@ -16,7 +14,7 @@ class ListAPI(APIBase):
         visibility: CustomListVisibility,
         manga: List[TypeOrId[Manga]]
     ) -> CustomList:
-        return Type.parse_obj(self.api._make_request(
+        return self.api._parse(self.api._make_request(
             Endpoints.List.CREATE,
             body={
                 "name": name,
@@ -45,7 +43,7 @@ class ListAPI(APIBase):
 
     @validate_arguments
     def get(self, list_id: TypeOrId[CustomList]) -> CustomList:
-        return Type.parse_obj(self.api._make_request(
+        return self.api._parse(self.api._make_request(
             Endpoints.List.GET, urlparams={
                 "list": list_id
             }
@@ -3,20 +3,27 @@ from mdapi.schema.search import ChapterSortOrder
 from typing import Dict, List
 from datetime import datetime
 
-from pydantic import validate_arguments
-
-from ..util import PaginatedRequest, shadows
+from ..util import (
+    CursorPaginatedRequest, PaginatedRequest, shadows, validate_arguments
+)
 from ..endpoints import Endpoints
 from ..schema import (
-    MultiMode, Status, LanguageCode, PublicationDemographic, Type, Tag, Year,
+    MultiMode, Status, LanguageCode, PublicationDemographic, Tag, Year,
     ContentRating, TypeOrId, MangaSortOrder, ReadingStatus, Author, Manga,
-    LinksKey, Version, CustomList, LocalizedString, CanUnset
+    LinksKey, Version, CustomList, LocalizedString, CanUnset, MangaCursor,
+    ChapterCursor
 )
 from .base import APIBase
 
 
 class MangaAPI(APIBase):
-    def _search(self, limit=None, offset=None, **kwargs):
+    def _search(self, limit=None, offset=None, cursor=None, **kwargs):
+        if cursor is not None:
+            return CursorPaginatedRequest(
+                self.api, Endpoints.Manga.SEARCH, params=kwargs,
+                limit=limit, offset=offset, cursor=cursor,
+                order_type=MangaSortOrder,
+            )
         return PaginatedRequest(
             self.api, Endpoints.Manga.SEARCH, params=kwargs,
             limit=limit, offset=offset,
@@ -44,6 +51,7 @@ class MangaAPI(APIBase):
         order: MangaSortOrder = None,
         limit: int = 10,
         offset: int = 0,
+        cursor: MangaCursor = None,
     ):
         """
         :param title:
@@ -64,12 +72,17 @@ class MangaAPI(APIBase):
         :param order:
         :param limit:
         :param offset:
+        :param cursor: Paginate by advancing this timestamp rather than
+            the offset. Results are ordered by it, ascending, so it
+            can't be combined with ``order`` or ``offset``.
         """
         ...
 
     @validate_arguments
     def get(self, manga: TypeOrId[Manga]) -> Manga:
-        return Type.parse_obj(self.api._make_request(
+        if (cached := self.api._cached("manga", manga)) is not None:
+            return cached
+        return self.api._parse(self.api._make_request(
             Endpoints.Manga.GET,
             urlparams={"manga": manga}
         ))
@@ -80,6 +93,7 @@ class MangaAPI(APIBase):
             Endpoints.Manga.DELETE,
             urlparams={"manga": manga}
         )
+        self.api._invalidate(manga)
 
     @validate_arguments
     def follow(self, manga: TypeOrId[Manga]) -> None:
@@ -97,7 +111,7 @@ class MangaAPI(APIBase):
 
     def all_tags(self) -> List[Tag]:
         return [
-            Type.parse_obj(i.get("data"))
+            self.api._parse(i.get("data"))
             for i in self.api._make_request(Endpoints.Manga.TAGS)
         ]
 
@@ -110,7 +124,7 @@ class MangaAPI(APIBase):
         })
 
     def random(self) -> Manga:
-        return Type.parse_obj(self.api._make_request(Endpoints.Manga.RANDOM))
+        return self.api._parse(self.api._make_request(Endpoints.Manga.RANDOM))
 
     def _create(self, **kwargs):
         kwargs["version"] = 1
@@ -138,10 +152,12 @@ class MangaAPI(APIBase):
 
     def _edit(self, **kwargs):
         manga = kwargs.pop("manga")
-        return self.api._make_request(
+        resp = self.api._make_request(
             Endpoints.Manga.EDIT, kwargs,
             urlparams={"manga": manga}
         )
+        self.api._invalidate(manga)
+        return resp
 
     @validate_arguments
     @shadows(_edit)
@@ -165,8 +181,14 @@ class MangaAPI(APIBase):
     ) -> Manga:
         ...
 
-    def _get_chapters(self, limit=None, offset=None, **kwargs):
+    def _get_chapters(self, limit=None, offset=None, cursor=None, **kwargs):
         manga = kwargs.pop("manga")
+        if cursor is not None:
+            return CursorPaginatedRequest(
+                self.api, Endpoints.Manga.CHAPTERS, params=kwargs,
+                urlparams={"manga": manga}, limit=limit, offset=offset,
+                cursor=cursor, order_type=ChapterSortOrder,
+            )
         return PaginatedRequest(
             self.api, Endpoints.Manga.CHAPTERS, params=kwargs,
             urlparams={"manga": manga}, limit=limit, offset=offset,
@@ -184,8 +206,15 @@ class MangaAPI(APIBase):
         order: ChapterSortOrder = None,
         limit: int = 10,
         offset: int = 0,
+        cursor: ChapterCursor = None,
     ) -> PaginatedRequest:
-        ...
+        """
+        Get the chapter feed for a manga.
+
+        :param cursor: Paginate by advancing this timestamp rather than
+            the offset. Results are ordered by it, ascending, so it
+            can't be combined with ``order`` or ``offset``.
+        """
 
     @validate_arguments
     def get_read(self, manga: TypeOrId[Manga]):
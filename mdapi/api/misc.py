@@ -1,21 +1,55 @@
 from typing import List
-from pydantic import validate_arguments
 
+from ..util import TTLCache, validate_arguments
 from ..endpoints import Endpoints
-from ..schema import TypeOrId, Chapter, LegacyType, MappingID, Type
+from ..nodes import AT_HOME_TTL, at_home_ttl
+from ..schema import TypeOrId, Chapter, LegacyType, MappingID
 from .base import APIBase
 
 
 class MiscAPI(APIBase):
+    def __init__(self, md, api):
+        super().__init__(md, api)
+        self._at_home = TTLCache(AT_HOME_TTL)
+
     @validate_arguments
     def get_md_at_home_url(
         self, chapter: TypeOrId[Chapter], force_port_443: bool = False
     ):
-        return self.api._make_request(Endpoints.GET_MD_AT_HOME, urlparams={
-            "chapter": chapter
-        }, params={
-            "forcePort443": True if force_port_443 else None
-        })["baseUrl"]
+        """
+        Get an MD@H base URL for a chapter. URLs are cached per chapter
+        until a little before the server says they expire, as given by
+        `mdapi.nodes.at_home_ttl`.
+
+        :param chapter: The chapter to get a base URL for
+        :param force_port_443: Only use nodes that serve on port 443
+        """
+        key = (chapter, force_port_443)
+        if (base := self._at_home.get(key)) is not None:
+            return base
+
+        resp, headers = self.api._make_request(
+            Endpoints.GET_MD_AT_HOME, urlparams={
+                "chapter": chapter
+            }, params={
+                "forcePort443": True if force_port_443 else None
+            }, with_headers=True
+        )
+        base = resp["baseUrl"]
+        self._at_home.set(key, base, at_home_ttl(headers))
+        return base
+
+    @validate_arguments
+    def invalidate_md_at_home_url(self, chapter: TypeOrId[Chapter]):
+        """
+        Forget the cached MD@H base URLs for a chapter, so the next call
+        to `get_md_at_home_url` asks for a fresh node. Used when a node
+        fails.
+
+        :param chapter: The chapter to forget base URLs for
+        """
+        self._at_home.pop((chapter, False))
+        self._at_home.pop((chapter, True))
 
     @validate_arguments
     def solve_captcha(self, challenge: str):
@@ -28,7 +62,7 @@ class MiscAPI(APIBase):
         self, manga_ids: List[int], type: LegacyType = "manga"
     ) -> List[MappingID]:
         return [
-            Type.parse_obj(i.get("data", i))
+            self.api._parse(i.get("data", i))
             for i in self.api._make_request(Endpoints.LEGACY_MAPPING, body={
                 "type": type,
                 "ids": manga_ids
@@ -1,17 +1,16 @@
 from typing import List, BinaryIO
-from pydantic.decorator import validate_arguments
 
 from ..endpoints import Endpoints
 from ..schema import (
-    TypeOrId, Type, Manga, ScanlationGroup, UploadSession, UploadSessionFile
+    TypeOrId, Manga, ScanlationGroup, UploadSession, UploadSessionFile
 )
-from ..util import _type_id
+from ..util import _type_id, validate_arguments
 from .base import APIBase
 
 
 class UploadAPI(APIBase):
     def get_session(self):
-        return Type.parse_obj(
+        return self.api._parse(
             self.api._make_request(Endpoints.Upload.GET_SESSION)
         )
 
@@ -21,7 +20,7 @@ class UploadAPI(APIBase):
         manga: TypeOrId[Manga],
         groups: List[TypeOrId[ScanlationGroup]]
     ):
-        return Type.parse_obj(
+        return self.api._parse(
             self.api._make_request(Endpoints.Upload.BEGIN, body={
                 "manga": manga, "groups": groups
             })
@@ -34,7 +33,7 @@ class UploadAPI(APIBase):
     ):
         files = {f"file{n + 1}": i for n, i in enumerate(files)}
         return [
-            Type.parse_obj(i.get("data"))
+            self.api._parse(i.get("data"))
             for i in self.api._make_request(
                 Endpoints.Upload.ADD_IMAGE.format(session=_type_id(session)),
                 files=files
@@ -65,7 +64,7 @@ class UploadAPI(APIBase):
         title: str,
         translated_language: str
     ):
-        return Type.parse_obj(self.api._make_request(
+        return self.api._parse(self.api._make_request(
             Endpoints.Upload.COMMIT.format(session=session),
             body={
                 "chapterDraft": {
@@ -1,8 +1,6 @@
-from pydantic.decorator import validate_arguments
-
 from ..endpoints import Endpoints
-from ..util import PaginatedRequest
-from ..schema import TypeOrId, User, Type
+from ..util import PaginatedRequest, validate_arguments
+from ..schema import TypeOrId, User
 from .base import APIBase
 
 
@@ -27,7 +25,7 @@ class UserAPI(APIBase):
         )
 
     def get_self(self) -> User:
-        return Type.parse_obj(self.api._make_request(Endpoints.User.GET_ME))
+        return self.api._parse(self.api._make_request(Endpoints.User.GET_ME))
 
     @validate_arguments
     def get_followed_groups(self, limit: int = 10, offset: int = 0):
@@ -0,0 +1,161 @@
+import os
+import zipfile
+from threading import Lock
+from typing import Dict, Iterable, Optional, Tuple
+from xml.etree import ElementTree
+
+from .download import PART_SUFFIX
+
+COMIC_INFO_NAME = "ComicInfo.xml"
+SITE = "https://mangadex.org"
+
+
+def _value(value):
+    return getattr(value, "value", value)
+
+
+def comic_info(
+    chapter, manga=None, page_count: Optional[int] = None,
+    writers: Iterable[str] = (), pencillers: Iterable[str] = ()
+) -> bytes:
+    """
+    Build a ``ComicInfo.xml`` for a chapter, as read by most CBZ readers.
+    Anything not known is left out.
+
+    :param chapter: The `mdapi.schema.Chapter` the archive holds
+    :param manga: The `mdapi.schema.Manga` the chapter belongs to
+    :param page_count: The number of pages in the archive
+    :param writers: Names of the manga's authors
+    :param pencillers: Names of the manga's artists
+    """
+    root = ElementTree.Element("ComicInfo", {
+        "xmlns:xsd": "http://www.w3.org/2001/XMLSchema",
+        "xmlns:xsi": "http://www.w3.org/2001/XMLSchema-instance",
+    })
+
+    def add(tag, value):
+        if value is not None and value != "":
+            ElementTree.SubElement(root, tag).text = str(value)
+
+    # ComicInfo's schema expects its elements in this order
+    add("Title", chapter.title)
+    if manga is not None:
+        add("Series", manga.title)
+    add("Number", chapter.chapter)
+    # Volume is an integer, which not every MangaDex volume is
+    if chapter.volume and chapter.volume.isdigit():
+        add("Volume", chapter.volume)
+    if manga is not None:
+        add("Summary", manga.description)
+    published = chapter.publishAt
+    add("Year", published.year)
+    add("Month", published.month)
+    add("Day", published.day)
+    add("Writer", ", ".join(writers))
+    add("Penciller", ", ".join(pencillers))
+    if manga is not None:
+        add("Genre", ", ".join(str(i) for i in manga.tag_names))
+    add("Web", f"{SITE}/chapter/{chapter.id}")
+    add("PageCount", page_count)
+    add("LanguageISO", _value(chapter.translatedLanguage))
+    add("Manga", "YesAndRightToLeft" if manga is not None and (
+        _value(manga.originalLanguage) == "ja"
+    ) else "Yes")
+
+    return ElementTree.tostring(root, "utf-8", xml_declaration=True)
+
+
+class CbzWriter:
+    """
+    Writes pages into a CBZ (ZIP) archive as they finish downloading,
+    so they never touch the disk on their own. Pages are stored without
+    compression, as images don't compress any further.
+
+    Pages can be added from several threads, in any order; they're
+    written in page order, holding back any that arrive early. The
+    archive is written to ``<path>.part``, and only moved to ``path``
+    once `close` is called. ``ComicInfo.xml``, if given, is written
+    last.
+
+    :param path: The path to write the archive to
+    :param info: The contents of ``ComicInfo.xml``, from `comic_info`
+    """
+
+    def __init__(self, path: str, info: Optional[bytes] = None):
+        self.path = path
+        self.info = info
+        self.pages = 0
+
+        self._zip = zipfile.ZipFile(
+            path + PART_SUFFIX, "w", zipfile.ZIP_STORED
+        )
+        self._next = 0
+        self._pending: Dict[int, Optional[Tuple[str, bytes]]] = {}
+        self._lock = Lock()
+
+    def _write(self, name: str, data: bytes):
+        self._zip.writestr(name, data)
+        self.pages += 1
+
+    def _flush(self):
+        """
+        Write every page that's no longer held back by an earlier one.
+        """
+        while self._next in self._pending:
+            if (page := self._pending.pop(self._next)) is not None:
+                self._write(*page)
+            self._next += 1
+
+    def add(self, index: int, name: str, data: bytes):
+        """
+        Add page ``index`` (counting from zero) to the archive as ``name``.
+        """
+        with self._lock:
+            self._pending[index] = (name, data)
+            self._flush()
+
+    def skip(self, index: int):
+        """
+        Give up on page ``index``, so later pages aren't held back for it.
+        """
+        with self._lock:
+            self._pending[index] = None
+            self._flush()
+
+    def close(self):
+        """
+        Write any pages still held back, then finish the archive.
+        """
+        with self._lock:
+            for index in sorted(self._pending):
+                if (page := self._pending[index]) is not None:
+                    self._write(*page)
+            self._pending.clear()
+            if self.info is not None:
+                self._zip.writestr(COMIC_INFO_NAME, self.info)
+            self._zip.close()
+        os.replace(self.path + PART_SUFFIX, self.path)
+
+    def abort(self):
+        """
+        Stop writing, and remove the partial archive.
+        """
+        with self._lock:
+            self._zip.close()
+            self._pending.clear()
+        try:
+            os.remove(self.path + PART_SUFFIX)
+        except OSError:
+            pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+
+__all__ = ("COMIC_INFO_NAME", "comic_info", "CbzWriter")
@@ -0,0 +1,296 @@
+import os
+import json
+import time
+import hashlib
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from threading import Lock
+from typing import Collection, Optional
+
+from pydantic import BaseModel
+
+
+class CacheEntry:
+    """
+    A cached response body, with the validators needed to revalidate it.
+
+    :ivar body: The raw response body
+    :ivar etag: The response's ``ETag``, if any
+    :ivar last_modified: The response's ``Last-Modified``, if any
+    """
+
+    __slots__ = ("body", "etag", "last_modified")
+
+    def __init__(
+        self, body: bytes, etag: Optional[str] = None,
+        last_modified: Optional[str] = None
+    ):
+        self.body = body
+        self.etag = etag
+        self.last_modified = last_modified
+
+    def conditional_headers(self) -> dict:
+        """
+        The headers that ask the server for this response only if it has
+        changed.
+        """
+        headers = {}
+        if self.etag is not None:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified is not None:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class CacheBackend(ABC):
+    """
+    Where a `ResponseCache` keeps its entries. Backends must be safe to
+    use from several threads.
+    """
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[CacheEntry]:
+        """
+        The entry stored under ``key``, or ``None``.
+        """
+
+    @abstractmethod
+    def set(self, key: str, entry: CacheEntry):
+        """
+        Store ``entry`` under ``key``, replacing any entry already there.
+        """
+
+    @abstractmethod
+    def delete(self, key: str):
+        """
+        Drop the entry stored under ``key``, if there is one.
+        """
+
+    @abstractmethod
+    def clear(self):
+        """
+        Drop every entry.
+        """
+
+
+class MemoryCache(CacheBackend):
+    """
+    Keeps entries in memory, evicting the least recently used once there
+    are more than ``maxsize``.
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: str, entry: CacheEntry):
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: str):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+class DiskCache(CacheBackend):
+    """
+    Keeps entries as files in a directory, so they survive restarts and
+    can be shared between processes. Each file holds a line of JSON with
+    the entry's validators, followed by the body.
+
+    :param path: The directory to keep entries in. It is created if it
+        doesn't exist.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        os.makedirs(path, exist_ok=True)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.path, key)
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        try:
+            with open(self._path(key), "rb") as f:
+                meta = json.loads(f.readline())
+                return CacheEntry(
+                    f.read(), meta.get("etag"), meta.get("last_modified")
+                )
+        except (OSError, ValueError):
+            return None
+
+    def set(self, key: str, entry: CacheEntry):
+        path = self._path(key)
+        # Unique per process and entry, so concurrent writers don't clash
+        tmp = f"{path}.{os.getpid()}.{id(entry)}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(json.dumps({
+                "etag": entry.etag, "last_modified": entry.last_modified
+            }).encode() + b"\n")
+            f.write(entry.body)
+        os.replace(tmp, path)
+
+    def delete(self, key: str):
+        try:
+            os.remove(self._path(key))
+        except FileNotFoundError:
+            pass
+
+    def clear(self):
+        for name in os.listdir(self.path):
+            try:
+                os.remove(self._path(name))
+            except FileNotFoundError:
+                pass
+
+
+class ResponseCache:
+    """
+    Caches the bodies of ``GET`` responses that carry an ``ETag`` or
+    ``Last-Modified``, and revalidates them with ``If-None-Match`` and
+    ``If-Modified-Since``, so a resource that hasn't changed costs only a
+    ``304 Not Modified``.
+
+    Entries are keyed by URL, query and the identity of the logged in
+    user, so authenticated and unauthenticated responses are never mixed
+    up.
+
+    :param backend: Where to keep entries. Defaults to a `MemoryCache`.
+    """
+
+    def __init__(self, backend: Optional[CacheBackend] = None):
+        self.backend = MemoryCache() if backend is None else backend
+
+    @staticmethod
+    def key(
+        method: str, url: str, query: Optional[dict],
+        identity: Optional[str]
+    ) -> str:
+        raw = json.dumps(
+            [method, url, query or {}, identity], sort_keys=True, default=str
+        )
+        return hashlib.sha256(raw.encode()).hexdigest()
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        return self.backend.get(key)
+
+    def store(self, key: str, headers, body: bytes):
+        """
+        Cache a ``200`` response, if it can be revalidated later.
+        """
+        etag = headers.get("ETag")
+        last_modified = headers.get("Last-Modified")
+        if etag is None and last_modified is None:
+            return
+        self.backend.set(key, CacheEntry(body, etag, last_modified))
+
+    def clear(self):
+        self.backend.clear()
+
+
+class EntityCache:
+    """
+    Caches parsed models by ID, so looking up the same manga, author or
+    group again touches neither the network nor pydantic.
+
+    Every model the client parses is added, including those in paginated
+    results and models nested inside others, such as a manga's tags.
+    ``get`` methods for manga, authors and groups check the cache first,
+    and their ``edit`` and ``delete`` methods invalidate what they
+    change. Cached models are shared, so should be treated as read-only.
+
+    Entries expire ``ttl`` seconds after they're added, and the least
+    recently used are evicted once there are more than ``maxsize``.
+
+    :param ttl: Seconds to keep each entry for
+    :param maxsize: The most entries to keep
+    :param types: The object types to cache
+    """
+
+    TYPES = frozenset(
+        ("manga", "author", "scanlation_group", "tag", "cover_art")
+    )
+
+    def __init__(
+        self, ttl: float = 300, maxsize: int = 4096,
+        types: Collection[str] = TYPES
+    ):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.types = types
+
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, type_: str, id_: str):
+        """
+        The cached ``type_`` object with ID ``id_``, or ``None``.
+        """
+        with self._lock:
+            entry = self._entries.get(id_)
+            if entry is None:
+                return None
+            if entry[0] <= time.monotonic():
+                del self._entries[id_]
+                return None
+            if type(entry[1])._type != type_:
+                return None
+            self._entries.move_to_end(id_)
+            return entry[1]
+
+    def add(self, obj):
+        """
+        Cache ``obj``, and any models nested inside it.
+        """
+        if isinstance(obj, (list, tuple)):
+            for i in obj:
+                self.add(i)
+            return
+        if not isinstance(obj, BaseModel):
+            return
+
+        for value in obj.__dict__.values():
+            if isinstance(value, (BaseModel, list, tuple)):
+                self.add(value)
+
+        id_ = getattr(obj, "id", None)
+        if id_ is None or getattr(type(obj), "_type", None) not in self.types:
+            return
+        expires = time.monotonic() + self.ttl
+        with self._lock:
+            self._entries[id_] = (expires, obj)
+            self._entries.move_to_end(id_)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, id_: str):
+        with self._lock:
+            self._entries.pop(id_, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+__all__ = (
+    "CacheEntry", "CacheBackend", "MemoryCache", "DiskCache", "ResponseCache",
+    "EntityCache",
+)
@@ -5,6 +5,7 @@ import os
 
 import click
 
+from .download import DownloadScheduler
 from .mdapi import MdAPI, MdException, NotLoggedIn
 
 
@@ -122,19 +123,22 @@ def chapters(md: MdAPI, manga, locales):
 
 
 def download_chapter(md: MdAPI, chapter, path):
-    for n, page in enumerate(md.chapter.page_urls_for(chapter)):
-        ext = page.split(".")[-1]
-        filename = f"{n + 1:03}.{ext}"
-        with open(os.path.join(path, filename), "wb") as f:
-            with click.progressbar(label=filename, length=1) as bar:
-                bar.update(0)
-                for downloaded, total_length in (
-                    md.chapter.download_page_to(page, f, is_iter=True)
-                ):
-                    bar.pos = downloaded / total_length
-                    bar.update(0)
-                bar.pos = 1
-                bar.update(0)
+    with click.progressbar(
+        label="Downloading", length=len(chapter.data)
+    ) as bar:
+        def progress(status):
+            bar.pos = status.pages_done
+            bar.update(0)
+
+        result = md.chapter.download_chapter(
+            chapter, path, progress=progress
+        )
+
+    for page in result.errors:
+        click.echo(click.style(
+            f"Failed to download {os.path.basename(page.path)}: "
+            f"{page.error!r}", fg="red"
+        ))
 
 
 def read_manga(manga, locales=("en", )):
@@ -147,17 +151,38 @@ def read_manga(manga, locales=("en", )):
     ):
         return
 
+    path = f"Manga/{sanitize(str(manga.title) or 'No title')}/"
+    click.echo(click.style(f"Downloading to {path}", fg="green"))
+
+    scheduler = DownloadScheduler(md)
     for chapter in results:
-        click.echo(
-            click.style(f"Downloading chapter {chapter.chapter}", fg="green")
-        )
-        path = (
-            f"Manga/{sanitize(str(manga.title) or 'No title')}/"
-            f"{chapter.translatedLanguage}-{chapter.chapter}/"
+        scheduler.add_chapter(
+            chapter, path + f"{chapter.translatedLanguage}-{chapter.chapter}/",
+            manga.id
         )
-        click.echo(click.style(f"Downloading to {path}", fg="green"))
-        os.makedirs(path, exist_ok=True)
-        download_chapter(md, chapter, path)
+
+    with click.progressbar(
+        label="Downloading", length=results.total
+    ) as bar:
+        def progress(stats):
+            bar.pos = stats.chapters_done
+            bar.label = f"Downloading ({stats.throughput / 1048576:.1f}MB/s)"
+            bar.update(0)
+
+        chapters = scheduler.run(progress)
+
+    for result in chapters:
+        if result.error is not None:
+            click.echo(click.style(
+                f"Failed to download chapter {result.chapter.chapter}: "
+                f"{result.error!r}", fg="red"
+            ))
+        for page in result.errors:
+            click.echo(click.style(
+                f"Failed to download chapter {result.chapter.chapter} "
+                f"page {os.path.basename(page.path)}: {page.error!r}",
+                fg="red"
+            ))
 
 
 @cli.command()
@@ -0,0 +1,1241 @@
+import os
+import json
+import time
+from collections import deque
+from datetime import datetime
+from threading import Condition, Lock, Thread
+from typing import Callable, Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+
+from .exceptions import DownloadException, InvalidFileLength
+
+
+#: Appended to the path of a page while it's being downloaded
+PART_SUFFIX = ".part"
+#: The name of the manifest file kept in each chapter directory
+MANIFEST_NAME = ".manifest.json"
+
+
+def page_filename(index: int, url: str) -> str:
+    """
+    The filename a page is saved under within a chapter directory. Pages
+    are numbered from one, and keep the extension of their URL.
+
+    :param index: The zero-based index of the page within its chapter
+    :param url: The URL the page is downloaded from
+    """
+    return f"{index + 1:03}.{url.split('.')[-1]}"
+
+
+def content_range_total(value: Optional[str]) -> Optional[int]:
+    """
+    The complete length from a ``Content-Range`` header, such as
+    ``bytes 200-999/1000`` or ``bytes */1000``.
+    """
+    if not value or "/" not in value:
+        return None
+    total = value.rsplit("/", 1)[1].strip()
+    return int(total) if total.isdigit() else None
+
+
+class DownloadStats:
+    """
+    Timings for a single page request, measured with a monotonic clock.
+    Times are in milliseconds from when the request was started.
+
+    :ivar url: The URL requested
+    :ivar bytes: The number of bytes received
+    :ivar success: Did the page download completely? ``None`` while
+        it's still in progress.
+    :ivar cached: Did the node serve the page from its cache?
+    :ivar total: The length of the whole page, once the response has
+        arrived
+    :ivar offset: Where in the page the bytes downloaded start. This is
+        0 unless a partial download was resumed.
+    """
+
+    def __init__(self, url: Optional[str] = None):
+        self.reset(url)
+
+    def reset(self, url: Optional[str] = None):
+        """
+        Start timing a new request, discarding anything recorded so far.
+        """
+        self.url = url
+        self.bytes = 0
+        self.success: Optional[bool] = None
+        self.cached = False
+        self.total: Optional[int] = None
+        self.offset = 0
+        self._started = time.monotonic()
+        self._responded: Optional[float] = None
+        self._finished: Optional[float] = None
+
+    def responded(self):
+        """
+        Called once the response's headers have arrived.
+        """
+        self._responded = time.monotonic()
+
+    def received(self, num_bytes: int):
+        self.bytes += num_bytes
+
+    def finish(self, success: bool, cached: bool = False):
+        self._finished = time.monotonic()
+        self.success = success
+        self.cached = cached
+
+    @property
+    def ttfb(self) -> Optional[float]:
+        """
+        The time until the response's headers arrived, or ``None`` if
+        the node never responded.
+        """
+        if self._responded is None:
+            return None
+        return (self._responded - self._started) * 1000
+
+    @property
+    def duration(self) -> float:
+        """
+        The time taken for the whole request, so far if it's unfinished.
+        """
+        end = self._finished if self._finished is not None else (
+            time.monotonic()
+        )
+        return (end - self._started) * 1000
+
+    @property
+    def throughput(self) -> float:
+        """
+        The transfer rate of the body, in bytes per second.
+        """
+        if self._responded is None:
+            return 0.0
+        end = self._finished if self._finished is not None else (
+            time.monotonic()
+        )
+        elapsed = end - self._responded
+        return self.bytes / elapsed if elapsed > 0 else 0.0
+
+    @classmethod
+    def __get_validators__(cls):
+        yield cls.validate
+
+    @classmethod
+    def validate(cls, value):
+        if not isinstance(value, cls):
+            raise TypeError(f"Expected {cls.__name__}, got {value!r}")
+        return value
+
+    def __repr__(self):
+        ttfb = "?" if self.ttfb is None else f"{self.ttfb:.0f}ms"
+        return (
+            f"<DownloadStats ttfb={ttfb} duration={self.duration:.0f}ms "
+            f"bytes={self.bytes} {self.throughput / 1048576:.2f}MB/s>"
+        )
+
+
+class PageResult:
+    """
+    The outcome of downloading a single page of a chapter.
+
+    :ivar index: The zero-based index of the page within its chapter
+    :ivar url: The URL the page was downloaded from
+    :ivar path: The path the page was written to
+    :ivar size: The number of bytes written
+    :ivar error: The exception that stopped this page downloading, if any
+    :ivar skipped: Was the page already on disk, from an earlier download
+        or the client's `mdapi.store.PageStore`?
+    :ivar retries: How many times the page was retried on a fresh node
+    :ivar stats: The `DownloadStats` of the last request for this page
+    """
+
+    def __init__(
+        self, index: int, url: str, path: str, size: int = 0,
+        error: Optional[BaseException] = None, skipped: bool = False
+    ):
+        self.index = index
+        self.url = url
+        self.path = path
+        self.size = size
+        self.error = error
+        self.skipped = skipped
+        self.retries = 0
+        self.stats: Optional[DownloadStats] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    def __repr__(self):
+        status = "ok" if self.ok else repr(self.error)
+        if self.skipped:
+            status = "skipped"
+        return f"<PageResult {os.path.basename(self.path)} {status}>"
+
+
+class ChapterResult:
+    """
+    The outcome of downloading every page of a chapter. Pages are listed
+    in chapter order, regardless of the order they finished in.
+    """
+
+    def __init__(
+        self, chapter, pages: List[PageResult],
+        error: Optional[BaseException] = None
+    ):
+        self.chapter = chapter
+        self.pages = pages
+        #: Set if the chapter's page URLs couldn't be fetched
+        self.error = error
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None and all(i.ok for i in self.pages)
+
+    @property
+    def errors(self) -> List[PageResult]:
+        return [i for i in self.pages if not i.ok]
+
+    @property
+    def size(self) -> int:
+        return sum(i.size for i in self.pages)
+
+    @property
+    def skipped(self) -> bool:
+        """
+        Was every page of this chapter already on disk?
+        """
+        return self.ok and all(i.skipped for i in self.pages)
+
+    def __repr__(self):
+        return (
+            f"<ChapterResult {len(self.pages) - len(self.errors)}"
+            f"/{len(self.pages)} pages>"
+        )
+
+
+class DownloadProgress:
+    """
+    Aggregate progress of a chapter download, shared between all of the
+    pages being downloaded. A progress callback is called with this
+    object every time a chunk arrives or a page finishes.
+
+    ``bytes_total`` only counts pages that have started downloading, as
+    the size of a page isn't known until its response arrives.
+    """
+
+    def __init__(
+        self, pages_total: int,
+        callback: Optional[Callable[["DownloadProgress"], None]] = None
+    ):
+        self.pages_total = pages_total
+        self.pages_done = 0
+        self.pages_failed = 0
+        self.pages_skipped = 0
+        self.bytes_downloaded = 0
+        self.bytes_total = 0
+        self._callback = callback
+        self._lock = Lock()
+
+    def _notify(self):
+        if self._callback is not None:
+            self._callback(self)
+
+    def started(self, total_length: int):
+        with self._lock:
+            self.bytes_total += total_length
+            self._notify()
+
+    def abandoned(self, num_bytes: int):
+        """
+        A page failed with ``num_bytes`` of what was expected still to
+        come. It's no longer counted in ``bytes_total``.
+        """
+        with self._lock:
+            self.bytes_total -= num_bytes
+            self._notify()
+
+    def advance(self, num_bytes: int):
+        with self._lock:
+            self.bytes_downloaded += num_bytes
+            self._notify()
+
+    def finished(self, result: PageResult):
+        with self._lock:
+            self.pages_done += 1
+            if not result.ok:
+                self.pages_failed += 1
+            elif result.skipped:
+                self.pages_skipped += 1
+            self._notify()
+
+
+class PageRequest:
+    """
+    The part of downloading a page that doesn't depend on the transport:
+    the ``Range`` to request, what to make of the response, and reporting
+    how it went to the client's `mdapi.nodes.NodeTracker` and MD@H. Both
+    clients' ``download_page`` send the request and read its body around
+    this. See `mdapi.api.chapter.ChapterAPI.download_page`.
+    """
+
+    CHUNK_SIZE = 131072  # 0.125 MB
+
+    def __init__(
+        self, api, url: str, report_mdah: bool = True, start: int = 0,
+        stats: Optional[DownloadStats] = None, restart: bool = False
+    ):
+        if stats is None:
+            stats = DownloadStats(url)
+        else:
+            stats.reset(url)
+        self.api = api
+        self.url = url
+        self.report_mdah = report_mdah
+        self.start = start
+        self.restart = restart
+        self.stats = stats
+        self.cached = False
+        self._skip = 0
+
+    @property
+    def headers(self) -> Optional[Dict[str, str]]:
+        return {"Range": f"bytes={self.start}-"} if self.start else None
+
+    def report(self, success: bool):
+        stats = self.stats
+        stats.finish(success, self.cached)
+        # MD@H expects a duration of 0 when the node never responded
+        duration = 0 if stats.ttfb is None else round(stats.duration)
+        self.api.nodes.record(
+            self.url, success, stats.bytes, duration, stats.ttfb
+        )
+        if self.report_mdah:
+            self.api.reporter.report(
+                self.url, success, self.cached, stats.bytes, duration
+            )
+
+    def is_complete(self, status: int, headers) -> bool:
+        """
+        Does the response, a 416, confirm that the ``start`` bytes we
+        already have are the whole page?
+        """
+        if not self.start or status != 416:
+            return False
+        self.stats.total = content_range_total(headers.get("Content-Range"))
+        if self.stats.total != self.start:
+            return False
+        self.stats.offset = self.start
+        self.stats.finish(True)
+        return True
+
+    def begin(self, status: int, headers) -> int:
+        """
+        Read the headers of a 200 or 206 response.
+
+        :returns: The length of the whole page
+        """
+        self.cached = headers.get("X-Cache", "").startswith("HIT")
+        if status == 206:
+            total_length = content_range_total(
+                headers.get("Content-Range")
+            ) or self.start + int(headers.get("Content-Length") or 0)
+            self.stats.offset = self.start
+        else:
+            total_length = int(headers.get("Content-Length") or 0)
+            self._skip = 0 if self.restart else self.start
+            self.stats.offset = self._skip
+        self.stats.total = total_length
+
+        if not total_length:
+            self.report(False)
+            raise InvalidFileLength(total_length)
+        return total_length
+
+    def received(self, chunk: bytes) -> bytes:
+        """
+        Record a chunk of the body.
+
+        :returns: The part of it to pass on, which is empty while the
+            bytes before ``start`` are being skipped
+        """
+        self.stats.received(len(chunk))
+        if self._skip:
+            if len(chunk) <= self._skip:
+                self._skip -= len(chunk)
+                return b""
+            chunk, self._skip = chunk[self._skip:], 0
+        return chunk
+
+
+class PartialPage:
+    """
+    The ``<path>.part`` file a page is downloaded into, and resumed from,
+    until its length is confirmed. See
+    `mdapi.api.chapter.ChapterAPI.download_page_to_path`. Every method
+    does blocking file I/O, so the asyncio client runs them in an
+    executor.
+    """
+
+    def __init__(self, path: str, stats: DownloadStats):
+        self.path = path
+        self.part = path + PART_SUFFIX
+        self.stats = stats
+        self.written = 0
+        self._resumed = 0
+        self._file = None
+
+    def open(self) -> int:
+        """
+        Open the file for another request.
+
+        :returns: The offset to request the page from
+        """
+        try:
+            self.written = os.path.getsize(self.part)
+        except OSError:
+            self.written = 0
+        self._resumed = self.written
+        self._file = open(self.part, "ab")
+        return self.written
+
+    def _restarted(self) -> bool:
+        return bool(self._resumed) and self.stats.offset != self._resumed
+
+    def write(self, chunk: bytes):
+        if self._restarted():
+            # The server ignored the Range, so start over
+            self._file.truncate(0)
+            self._resumed = self.written = 0
+        self._file.write(chunk)
+        self.written += len(chunk)
+
+    def ended(self):
+        """
+        Called once the response has been read to the end.
+        """
+        if self._restarted():
+            # Nothing came, and what we had can't be trusted
+            self._file.truncate(0)
+            self.written = 0
+
+    def close(self):
+        self._file.close()
+
+    def failed(self, error: BaseException, can_retry: bool) -> bool:
+        """
+        Called when a request fails with a
+        `mdapi.exceptions.DownloadException`.
+
+        :returns: Should the request be made again? If not, and nothing
+            was written, the file is removed.
+        """
+        retry = type(error) is DownloadException
+        if self.stats.total is not None and self.written > self.stats.total:
+            # A stale .part, longer than the page itself
+            os.truncate(self.part, 0)
+            self.written, retry = 0, True
+        if retry and can_retry:
+            return True
+        # Don't leave empty files behind for pages we never got
+        if not self.written:
+            os.remove(self.part)
+        return False
+
+    def complete(self) -> bool:
+        """
+        Move the file into place, if it's the length of the whole page.
+        A 416 for an already-complete page doesn't yield anything, but
+        still confirms the page's length.
+
+        :returns: Is the page complete?
+        """
+        if self.written == self.stats.total:
+            os.replace(self.part, self.path)
+            return True
+        if self.stats.total is not None and self.written > self.stats.total:
+            os.remove(self.part)
+            raise InvalidFileLength(self.written)
+        return False
+
+
+class ChapterManifest:
+    """
+    A record of what has been downloaded into a chapter directory, kept
+    as `MANIFEST_NAME` alongside the pages. It notes the chapter's
+    ``hash``, ``updatedAt`` and ``data`` filenames, and the size of every
+    page written, so later downloads can skip what's already there.
+
+    Pages are only trusted while the chapter's hash, ``updatedAt`` and
+    filenames are unchanged, and the file on disk is the recorded size.
+    """
+
+    def __init__(
+        self, dest: str, id: str, hash: str, updatedAt: Optional[str],
+        data_saver: bool, data: List[str],
+        pages: Optional[Dict[str, int]] = None
+    ):
+        self.dest = dest
+        self.id = id
+        self.hash = hash
+        self.updatedAt = updatedAt
+        self.data_saver = data_saver
+        self.data = data
+        self.pages = pages or {}
+        self._lock = Lock()
+
+    @classmethod
+    def for_chapter(
+        cls, chapter, dest: str, data_saver: bool = False
+    ) -> "ChapterManifest":
+        updated = getattr(chapter, "updatedAt", None)
+        if isinstance(updated, datetime):
+            updated = updated.isoformat()
+        return cls(
+            dest, chapter.id, chapter.hash, updated, data_saver,
+            list(chapter.dataSaver if data_saver else chapter.data)
+        )
+
+    @classmethod
+    def load(cls, dest: str) -> Optional["ChapterManifest"]:
+        """
+        Read the manifest in ``dest``, if there's a readable one.
+        """
+        try:
+            with open(os.path.join(dest, MANIFEST_NAME)) as f:
+                raw = json.load(f)
+            return cls(
+                dest, raw["id"], raw["hash"], raw["updatedAt"],
+                raw["dataSaver"], raw["data"], raw["pages"]
+            )
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    @classmethod
+    def prepare(
+        cls, chapter, dest: str, data_saver: bool = False
+    ) -> "ChapterManifest":
+        """
+        Build the manifest for downloading ``chapter`` into ``dest``,
+        carrying over pages recorded by an earlier download of the same
+        version. If the chapter has changed since, pages that no longer
+        belong to it, and partial downloads of the old version, are
+        removed.
+        """
+        manifest = cls.for_chapter(chapter, dest, data_saver)
+        old = cls.load(dest)
+        if old is None:
+            return manifest
+
+        if old.same_source(manifest):
+            manifest.pages = old.pages
+            return manifest
+
+        current = set(manifest.filenames())
+        for name in old.filenames():
+            stale = [name + PART_SUFFIX]
+            if name not in current:
+                stale.append(name)
+            for path in stale:
+                try:
+                    os.remove(os.path.join(dest, path))
+                except OSError:
+                    pass
+        return manifest
+
+    def same_source(self, other: "ChapterManifest") -> bool:
+        return (
+            self.id == other.id and self.hash == other.hash
+            and self.updatedAt == other.updatedAt
+            and self.data_saver == other.data_saver
+            and self.data == other.data
+        )
+
+    def filenames(self) -> List[str]:
+        return [page_filename(n, i) for n, i in enumerate(self.data)]
+
+    def has_page(self, filename: str) -> bool:
+        """
+        Is ``filename`` on disk, and the size it was when downloaded?
+        """
+        size = self.pages.get(filename)
+        if size is None:
+            return False
+        try:
+            return os.path.getsize(os.path.join(self.dest, filename)) == size
+        except OSError:
+            return False
+
+    def is_complete(self) -> bool:
+        return all(self.has_page(i) for i in self.filenames())
+
+    def skip_existing(self, page: PageResult) -> bool:
+        """
+        Mark ``page`` as skipped if it's already on disk.
+        """
+        name = os.path.basename(page.path)
+        if not self.has_page(name):
+            return False
+        page.size = self.pages[name]
+        page.skipped = True
+        return True
+
+    def existing_pages(self) -> List[PageResult]:
+        """
+        Skipped results for every page, for when the chapter is complete.
+        Their ``url`` is the page's filename on the server.
+        """
+        return [
+            PageResult(
+                n, url, os.path.join(self.dest, name), self.pages[name],
+                skipped=True
+            )
+            for n, (url, name) in enumerate(zip(self.data, self.filenames()))
+        ]
+
+    def record(self, page: PageResult):
+        """
+        Record a freshly downloaded page, and save the manifest.
+        """
+        with self._lock:
+            self.pages[os.path.basename(page.path)] = page.size
+            self.save()
+
+    def save(self):
+        path = os.path.join(self.dest, MANIFEST_NAME)
+        with open(path + ".tmp", "w") as f:
+            json.dump({
+                "id": self.id, "hash": self.hash,
+                "updatedAt": self.updatedAt, "dataSaver": self.data_saver,
+                "data": self.data, "pages": self.pages,
+            }, f)
+        os.replace(path + ".tmp", path)
+
+
+def prepare_chapter(
+    chapter, dest: str, data_saver: bool = False, incremental: bool = True
+) -> Tuple[Optional[List[PageResult]], Optional[ChapterManifest]]:
+    """
+    The part of `plan_chapter` that reads ``dest``, before any request
+    is made.
+
+    :returns: Every page of the chapter if it's already complete,
+        otherwise ``None``, and the manifest to record new pages in (if
+        ``incremental``)
+    """
+    if not incremental:
+        return None, None
+    manifest = ChapterManifest.prepare(chapter, dest, data_saver)
+    if manifest.is_complete():
+        return manifest.existing_pages(), manifest
+    return None, manifest
+
+
+def chapter_pages(
+    urls: List[str], dest: str, manifest: Optional[ChapterManifest] = None
+) -> List[PageResult]:
+    """
+    The part of `plan_chapter` that lays out the chapter's pages once its
+    page URLs are known, marking those already in ``manifest`` skipped.
+    """
+    os.makedirs(dest, exist_ok=True)
+    pages = [
+        PageResult(n, url, os.path.join(dest, page_filename(n, url)))
+        for n, url in enumerate(urls)
+    ]
+    if manifest is not None:
+        for page in pages:
+            manifest.skip_existing(page)
+    return pages
+
+
+def plan_chapter(
+    chapter_api, chapter, dest: str, data_saver: bool = False,
+    incremental: bool = True
+) -> Tuple[List[PageResult], Optional[ChapterManifest]]:
+    """
+    Work out the pages to download for ``chapter`` into ``dest``.
+
+    With ``incremental``, pages already recorded in the directory's
+    `ChapterManifest` are marked as skipped. If the whole chapter is
+    already there, no request is made at all, and the pages' ``url`` is
+    their filename on the server instead.
+
+    :returns: Every page of the chapter, and the manifest to record new
+        pages in (if ``incremental``)
+    """
+    pages, manifest = prepare_chapter(chapter, dest, data_saver, incremental)
+    if pages is None:
+        urls = list(chapter_api.page_urls_for(chapter, data_saver))
+        pages = chapter_pages(urls, dest, manifest)
+    return pages, manifest
+
+
+def queue_pages(
+    pages: List[PageResult], tracker: DownloadProgress
+) -> List[PageResult]:
+    """
+    Count the pages already skipped as finished.
+
+    :returns: The pages left to download
+    """
+    queued = []
+    for page in pages:
+        if page.skipped:
+            tracker.finished(page)
+        else:
+            queued.append(page)
+    return queued
+
+
+def fail_over(pages: List[PageResult], urls: List[str]):
+    """
+    Point failed pages at their URLs on a fresh node, counting a retry.
+    """
+    for page in pages:
+        page.url = urls[page.index]
+        page.retries += 1
+
+
+class PageProgress:
+    """
+    Tracks one attempt at downloading a page of a chapter in the
+    chapter's `DownloadProgress`. Errors are recorded on the page's
+    result rather than raised.
+
+    The caller is responsible for calling ``tracker.finished`` once it
+    has decided not to retry the page.
+    """
+
+    def __init__(self, result: PageResult, tracker: DownloadProgress):
+        result.error = None
+        result.size = 0
+        result.stats = DownloadStats(result.url)
+        self.result = result
+        self.tracker = tracker
+        self.expected = 0
+        self.received = 0
+
+    def advance(self, chunk: bytes, total_length: int):
+        if not self.expected:
+            # Only what this response sends, which is the whole page if
+            # the server ignored the Range
+            self.expected = total_length - self.result.stats.offset
+            self.tracker.started(self.expected)
+        self.received += len(chunk)
+        self.tracker.advance(len(chunk))
+
+    def check_length(self):
+        """
+        Make sure the whole response arrived.
+        """
+        if self.received != self.expected:
+            raise InvalidFileLength(self.received)
+
+    def failed(self, error: BaseException):
+        self.result.error = error
+        if self.expected > self.received:
+            self.tracker.abandoned(self.expected - self.received)
+
+
+def link_stored_page(
+    store, result: PageResult, manifest: Optional[ChapterManifest] = None
+) -> bool:
+    """
+    Link ``result``'s page into place from ``store``, a
+    `mdapi.store.PageStore`, if it's stored there, and record it in
+    ``manifest``.
+
+    :returns: Was the page stored?
+    """
+    if store is None or (
+        size := store.materialize(result.url, result.path)
+    ) is None:
+        return False
+    result.size = size
+    result.skipped = True
+    if manifest is not None:
+        manifest.record(result)
+    return True
+
+
+def save_page_file(
+    store, result: PageResult, manifest: Optional[ChapterManifest] = None
+):
+    """
+    Record a page freshly downloaded to ``result.path`` in ``store`` and
+    ``manifest``.
+    """
+    result.size = os.path.getsize(result.path)
+    if store is not None:
+        store.add(result.url, result.path)
+    if manifest is not None:
+        manifest.record(result)
+
+
+def read_stored_page(store, result: PageResult) -> Optional[bytes]:
+    """
+    Read ``result``'s page from ``store``, if it's stored there.
+    """
+    if store is None or (stored := store.read(result.url)) is None:
+        return None
+    result.size = len(stored)
+    result.skipped = True
+    return stored
+
+
+def save_page_data(store, result: PageResult, data: bytearray) -> bytes:
+    """
+    Record a page freshly downloaded into memory in ``store``.
+    """
+    if store is not None:
+        store.add_bytes(result.url, data)
+    result.size = len(data)
+    return bytes(data)
+
+
+def download_page_file(
+    chapter_api, result: PageResult, tracker: DownloadProgress,
+    follow_redirect: bool = False, report_mdah: bool = True,
+    manifest: Optional[ChapterManifest] = None,
+    timeout: Optional[float] = None
+):
+    """
+    Download a single page to ``result.path`` using
+    `mdapi.api.chapter.ChapterAPI.download_page_to_path`. Errors are
+    recorded on ``result`` rather than raised. A partial download is
+    kept as a ``.part`` file, and resumed next time. Completed pages are
+    recorded in ``manifest``, if given.
+
+    If the client has a `mdapi.store.PageStore`, pages already stored are
+    linked from it instead of downloaded, and new pages are added to it.
+
+    The caller is responsible for calling ``tracker.finished`` once it
+    has decided not to retry the page.
+    """
+    progress = PageProgress(result, tracker)
+    store = chapter_api.api.page_store
+    try:
+        if link_stored_page(store, result, manifest):
+            return
+        for chunk, total_length in chapter_api.download_page_to_path(
+            result.url, result.path, follow_redirect, report_mdah,
+            timeout=timeout, stats=result.stats
+        ):
+            progress.advance(chunk, total_length)
+        save_page_file(store, result, manifest)
+    except Exception as e:
+        progress.failed(e)
+
+
+def download_page_data(
+    chapter_api, result: PageResult, tracker: DownloadProgress,
+    follow_redirect: bool = False, report_mdah: bool = True,
+    timeout: Optional[float] = None
+) -> Optional[bytes]:
+    """
+    Download a single page into memory using
+    `mdapi.api.chapter.ChapterAPI.download_page`, or from the client's
+    `mdapi.store.PageStore` if it's already stored there. Errors are
+    recorded on ``result`` rather than raised.
+
+    The caller is responsible for calling ``tracker.finished`` once it
+    has decided not to retry the page.
+
+    :returns: The page, or ``None`` if it failed
+    """
+    progress = PageProgress(result, tracker)
+    store = chapter_api.api.page_store
+    data = bytearray()
+    try:
+        if (stored := read_stored_page(store, result)) is not None:
+            return stored
+        for chunk, total_length in chapter_api.download_page(
+            result.url, follow_redirect, report_mdah, timeout=timeout,
+            stats=result.stats
+        ):
+            progress.advance(chunk, total_length)
+            data += chunk
+        progress.check_length()
+        return save_page_data(store, result, data)
+    except Exception as e:
+        progress.failed(e)
+        return None
+
+
+class SchedulerStats(DownloadProgress):
+    """
+    Live statistics for a `DownloadScheduler`. ``pages_total`` grows as
+    chapters are resolved into page URLs.
+
+    An exception from the progress callback doesn't interrupt the
+    scheduler's bookkeeping. It's kept in ``errors``, and raised from
+    `DownloadScheduler.run` once everything has finished.
+    """
+
+    def __init__(self, callback=None):
+        super().__init__(0, callback)
+        self.chapters_total = 0
+        self.chapters_done = 0
+        self.chapters_skipped = 0
+        self.chapters_pending = 0
+        self.pages_queued = 0
+        self.in_flight = 0
+        self.hosts: Dict[str, int] = {}
+        self.started_at: Optional[float] = None
+        self.errors: List[Exception] = []
+
+    def _notify(self):
+        try:
+            super()._notify()
+        except Exception as e:
+            self.errors.append(e)
+
+    @property
+    def elapsed(self) -> float:
+        if self.started_at is None:
+            return 0.0
+        return time.monotonic() - self.started_at
+
+    @property
+    def throughput(self) -> float:
+        """
+        The average download rate since the scheduler started, in bytes
+        per second.
+        """
+        elapsed = self.elapsed
+        return self.bytes_downloaded / elapsed if elapsed else 0.0
+
+    @property
+    def queue_depth(self) -> int:
+        """
+        The number of pages waiting to start. Chapters that haven't been
+        resolved into pages yet aren't counted.
+        """
+        return self.pages_queued
+
+    def __repr__(self):
+        return (
+            f"<SchedulerStats {self.pages_done}/{self.pages_total} pages "
+            f"{self.chapters_done}/{self.chapters_total} chapters "
+            f"in_flight={self.in_flight} queued={self.pages_queued} "
+            f"{self.throughput / 1048576:.2f}MB/s>"
+        )
+
+
+class _Series:
+    __slots__ = ("key", "chapters", "pages", "resolving")
+
+    def __init__(self, key):
+        self.key = key
+        # (ChapterResult, dest) waiting to be resolved into pages
+        self.chapters = deque()
+        # (PageResult, ChapterResult, host, manifest, series) to download
+        self.pages = deque()
+        self.resolving = False
+
+    @property
+    def exhausted(self):
+        return not (self.chapters or self.pages or self.resolving)
+
+
+class DownloadScheduler:
+    """
+    Download many chapters at once, across any number of series.
+
+    At most ``concurrency`` pages are downloaded at a time, and at most
+    ``per_host`` of those from any one MD@H node. Work is handed out
+    round-robin between series, so a single long series can't starve
+    the others.
+
+    .. code-block:: python
+
+        scheduler = DownloadScheduler(md, concurrency=16)
+        for chapter in md.manga.get_chapters(manga):
+            scheduler.add_chapter(chapter, f"out/{chapter.chapter}")
+        results = scheduler.run()
+
+    :param md: The `mdapi.MdAPI` client to download with
+    :param concurrency: The maximum number of pages in flight overall
+    :param per_host: The maximum number of pages in flight per host
+    :param data_saver: Should data-saver pages be downloaded instead?
+    :param follow_redirect: Should redirects be followed?
+    :param report_mdah: Report node statistics to MD@H.
+    :param incremental: Skip pages and chapters already downloaded, as
+        recorded in each chapter directory's `ChapterManifest`.
+    """
+
+    def __init__(
+        self, md, concurrency: int = 8, per_host: int = 4,
+        data_saver: bool = False, follow_redirect: bool = False,
+        report_mdah: bool = True, incremental: bool = True
+    ):
+        self.md = md
+        self.concurrency = max(1, concurrency)
+        self.per_host = max(1, per_host)
+        self.data_saver = data_saver
+        self.follow_redirect = follow_redirect
+        self.report_mdah = report_mdah
+        self.incremental = incremental
+
+        self.stats = SchedulerStats()
+
+        self._cond = Condition()
+        self._series: Dict[str, _Series] = {}
+        self._order = deque()
+        self._results: List[ChapterResult] = []
+        self._remaining: Dict[int, int] = {}
+        # The current page URLs of each chapter, replaced on failover
+        self._urls: Dict[int, List[str]] = {}
+
+    def add_chapter(
+        self, chapter, dest: str, series: Optional[str] = None
+    ) -> ChapterResult:
+        """
+        Queue a chapter to be downloaded into ``dest``.
+
+        :param chapter: The `mdapi.schema.Chapter` to download
+        :param dest: The directory to save its pages into
+        :param series: The key to schedule this chapter fairly under.
+            Defaults to the chapter's manga.
+
+        :returns: The chapter's result, filled in as it downloads
+        """
+        if series is None:
+            manga = chapter.relations_to("manga")
+            series = manga[0].id if manga else chapter.id
+
+        result = ChapterResult(chapter, [])
+        with self._cond:
+            if series not in self._series:
+                self._series[series] = _Series(series)
+                self._order.append(self._series[series])
+            self._series[series].chapters.append((result, dest))
+            self._results.append(result)
+            self.stats.chapters_total += 1
+            self.stats.chapters_pending += 1
+            self._cond.notify_all()
+        return result
+
+    def add_manga(self, manga, dest: str, **filters) -> List[ChapterResult]:
+        """
+        Queue every chapter of a manga. Each is saved into its own
+        ``<language>-<chapter>`` directory under ``dest``.
+
+        :param manga: The manga, or its UUID
+        :param dest: The directory to save chapters under
+        :param filters: Passed on to
+            `mdapi.api.manga.MangaAPI.get_chapters`
+        """
+        series = getattr(manga, "id", manga)
+        return [
+            self.add_chapter(chapter, os.path.join(
+                dest, f"{chapter.translatedLanguage}-{chapter.chapter}"
+            ), series)
+            for chapter in self.md.manga.get_chapters(manga, **filters)
+        ]
+
+    def _next_job(self):
+        with self._cond:
+            while True:
+                for _ in range(len(self._order)):
+                    series = self._order[0]
+                    self._order.rotate(-1)
+
+                    if series.exhausted:
+                        self._order.pop()
+                        del self._series[series.key]
+                        continue
+                    # Resolve ahead, so the series doesn't run dry
+                    if (
+                        series.chapters and not series.resolving
+                        and len(series.pages) < self.concurrency
+                    ):
+                        series.resolving = True
+                        return self._resolve, (series, )
+                    if not series.pages:
+                        continue
+
+                    host = series.pages[0][2]
+                    if self.stats.hosts.get(host, 0) >= self.per_host:
+                        continue
+                    job = series.pages.popleft()
+                    self.stats.hosts[host] = self.stats.hosts.get(host, 0) + 1
+                    self.stats.in_flight += 1
+                    self.stats.pages_queued -= 1
+                    return self._download, job
+
+                # Pages in flight may yet fail over and need requeueing
+                if not self._order and not self.stats.in_flight:
+                    return None
+                self._cond.wait()
+
+    def _resolve(self, series: _Series):
+        with self._cond:
+            result, dest = series.chapters.popleft()
+        try:
+            pages, manifest = plan_chapter(
+                self.md.chapter, result.chapter, dest, self.data_saver,
+                self.incremental
+            )
+        except Exception as e:
+            pages, manifest = [], None
+            result.error = e
+
+        with self._cond:
+            try:
+                result.pages.extend(pages)
+                queued = [i for i in pages if not i.skipped]
+                for page in queued:
+                    series.pages.append((
+                        page, result, urlparse(page.url).netloc, manifest,
+                        series
+                    ))
+                self._urls[id(result)] = [i.url for i in pages]
+                series.resolving = False
+                self._remaining[id(result)] = len(queued)
+                self.stats.chapters_pending -= 1
+                self.stats.pages_queued += len(queued)
+                with self.stats._lock:
+                    self.stats.pages_total += len(pages)
+                for page in pages:
+                    if page.skipped:
+                        self.stats.finished(page)
+                if not queued:
+                    self._chapter_done(result)
+            finally:
+                # Workers may be waiting on these pages
+                self._cond.notify_all()
+
+    def _chapter_done(self, result: ChapterResult):
+        del self._remaining[id(result)]
+        self._urls.pop(id(result), None)
+        with self.stats._lock:
+            self.stats.chapters_done += 1
+            if result.skipped:
+                self.stats.chapters_skipped += 1
+            self.stats._notify()
+
+    def _failover(self, page: PageResult, result: ChapterResult) -> bool:
+        """
+        Point a failed page at a fresh node, if the policy allows another
+        attempt. Every page of a chapter is moved to the new node, so
+        only the first page to fail on a node requests a new one.
+        """
+        policy = self.md.api.failover
+        if not policy.retry_page(page):
+            return False
+
+        time.sleep(policy.delay(page.retries))
+        with self._cond:
+            urls = self._urls[id(result)]
+        if urls[page.index] == page.url:
+            try:
+                urls = self.md.chapter.refresh_page_urls(
+                    result.chapter, self.data_saver, page.url
+                )
+            except Exception:
+                return False
+            with self._cond:
+                self._urls[id(result)] = urls
+
+        fail_over([page], urls)
+        return True
+
+    def _download(
+        self, page: PageResult, result: ChapterResult, host: str,
+        manifest: Optional[ChapterManifest], series: _Series
+    ):
+        retry = False
+        try:
+            download_page_file(
+                self.md.chapter, page, self.stats,
+                self.follow_redirect, self.report_mdah, manifest,
+                self.md.api.failover.timeout
+            )
+            retry = not page.ok and self._failover(page, result)
+        finally:
+            # Always settled, or run() would wait on this page forever
+            with self._cond:
+                self.stats.hosts[host] -= 1
+                if not self.stats.hosts[host]:
+                    del self.stats.hosts[host]
+                self.stats.in_flight -= 1
+
+                try:
+                    if retry:
+                        # The series may have been dropped while this was
+                        # in flight
+                        series = self._series.setdefault(series.key, series)
+                        if series not in self._order:
+                            self._order.append(series)
+                        series.pages.appendleft((
+                            page, result, urlparse(page.url).netloc,
+                            manifest, series
+                        ))
+                        self.stats.pages_queued += 1
+                    else:
+                        try:
+                            self.stats.finished(page)
+                        finally:
+                            self._remaining[id(result)] -= 1
+                            if not self._remaining[id(result)]:
+                                self._chapter_done(result)
+                finally:
+                    self._cond.notify_all()
+
+    def _work(self):
+        while (job := self._next_job()) is not None:
+            func, args = job
+            try:
+                func(*args)
+            except Exception as e:
+                # The job's own bookkeeping is done in ``finally`` blocks,
+                # so carry on with the rest, and raise it from run()
+                self.stats.errors.append(e)
+
+    def run(
+        self, progress: Optional[Callable[[SchedulerStats], None]] = None
+    ) -> List[ChapterResult]:
+        """
+        Download everything queued, blocking until it's all finished.
+        If ``progress`` raises, downloading carries on, and the first
+        exception is raised once everything has finished.
+
+        :param progress: Called with `stats` whenever data arrives, or a
+            page or chapter finishes. This is called from worker threads.
+
+        :returns: The result of every chapter, in the order they were
+            added
+        """
+        self.stats._callback = progress
+        self.stats.started_at = time.monotonic()
+
+        threads = [
+            Thread(target=self._work, daemon=True)
+            for _ in range(self.concurrency)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        with self._cond:
+            results, self._results = self._results, []
+        if self.stats.errors:
+            error, self.stats.errors = self.stats.errors[0], []
+            raise error
+        return results
+
+
+__all__ = (
+    "PART_SUFFIX", "MANIFEST_NAME", "content_range_total", "page_filename",
+    "prepare_chapter", "chapter_pages", "plan_chapter", "queue_pages",
+    "fail_over", "link_stored_page", "save_page_file", "read_stored_page",
+    "save_page_data", "download_page_file", "download_page_data",
+    "DownloadStats", "PageResult", "ChapterResult", "DownloadProgress",
+    "PageRequest", "PartialPage", "PageProgress", "ChapterManifest",
+    "SchedulerStats", "DownloadScheduler",
+)
@@ -28,3 +28,16 @@ class InvalidStatusCode(DownloadException):
 
 class InvalidFileLength(DownloadException):
     pass
+
+
+class RateLimited(MdException):
+    """
+    Raised for a ``429 Too Many Requests`` response, or when the client's
+    `mdapi.ratelimit.RateLimiter` would have to wait too long.
+
+    :ivar retry_after: Seconds until requests can be made again, if known
+    """
+
+    def __init__(self, *args, retry_after=None):
+        super().__init__(*args)
+        self.retry_after = retry_after
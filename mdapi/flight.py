@@ -0,0 +1,60 @@
+from threading import Event, Lock
+from typing import Any, Callable, Dict, Hashable, Tuple
+
+
+class _Call:
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """
+    Shares the work of identical calls made at the same time from
+    several threads. The first call for a key runs; any made for the
+    same key while it's running wait for it, and get its result, or its
+    exception, rather than running themselves.
+
+    Results are shared between every waiter, so should be immutable, or
+    copied before use.
+    """
+
+    def __init__(self):
+        self._calls: Dict[Hashable, _Call] = {}
+        self._lock = Lock()
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Tuple[Any, bool]:
+        """
+        Call ``fn``, unless a call for ``key`` is already running.
+
+        :returns: ``(result, shared)``. ``shared`` is ``True`` if the
+            result came from another thread's call.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result, True
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result, False
+
+
+__all__ = ("SingleFlight", )
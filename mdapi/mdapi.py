@@ -1,18 +1,29 @@
 import click
+import functools
 import os
 import platform
+import hashlib
 import json
+import time
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from .exceptions import (
-    MdException, NotLoggedIn, ActionForbidden, RefreshTokenFailed
+    MdException, NotLoggedIn, ActionForbidden, RefreshTokenFailed,
+    RateLimited
 )
 from .api import (
     AccountAPI, AuthAPI, AuthorAPI, ChapterAPI, GroupAPI, ListAPI, MangaAPI,
     MiscAPI, UserAPI, CoverAPI, UploadAPI
 )
+from .flight import SingleFlight
+from .metrics import ClientMetrics
+from .nodes import FailoverPolicy, MdahReporter, NodeTracker
+from .ratelimit import RateLimiter
+from .retry import RetryPolicy
 from .util import _is_token_expired, params_to_query, strip_nulls
+from .schema import Type
 from .endpoints import Endpoints
 
 
@@ -24,13 +35,129 @@ class APIHandler:
 
     DEBUG = False
 
-    def __init__(self, md):
+    POOL_CONNECTIONS = 10
+    POOL_MAXSIZE = 10
+    POOL_BLOCK = False
+    KEEP_ALIVE = True
+
+    PREFETCH = 0
+    LAZY_RESULTS = False
+    TRUSTED_RESPONSES = False
+    VALIDATE_ARGUMENTS = True
+    FAILOVER = FailoverPolicy()
+    PAGE_STORE = None
+    RETRY = RetryPolicy()
+    RESPONSE_CACHE = None
+    ENTITY_CACHE = None
+    COALESCE = True
+
+    # MangaDex allows 5 requests per second from each IP
+    RATE_LIMIT = 5
+    # Set to share one limiter between every client. Otherwise each
+    # client gets its own
+    RATE_LIMITER = None
+
+    def __init__(
+        self, md, pool_connections=None, pool_maxsize=None, pool_block=None,
+        keep_alive=None, prefetch=None, lazy_results=None,
+        trusted_responses=None, validate_arguments=None, failover=None,
+        page_store=None, rate_limiter=None, retry=None,
+        response_cache=None, entity_cache=None, coalesce=None
+    ):
         self.md = md
         self.user = None
         self._auth = None
 
         self.captcha = None
 
+        self.pool_connections = (
+            self.POOL_CONNECTIONS if pool_connections is None
+            else pool_connections
+        )
+        self.pool_maxsize = (
+            self.POOL_MAXSIZE if pool_maxsize is None else pool_maxsize
+        )
+        self.pool_block = self.POOL_BLOCK if pool_block is None else pool_block
+        self.keep_alive = self.KEEP_ALIVE if keep_alive is None else keep_alive
+        self.prefetch = self.PREFETCH if prefetch is None else prefetch
+        self.lazy_results = (
+            self.LAZY_RESULTS if lazy_results is None else lazy_results
+        )
+        self.trusted_responses = (
+            self.TRUSTED_RESPONSES if trusted_responses is None
+            else trusted_responses
+        )
+        self.validate_arguments = (
+            self.VALIDATE_ARGUMENTS if validate_arguments is None
+            else validate_arguments
+        )
+        self.failover = self.FAILOVER if failover is None else failover
+        self.page_store = (
+            self.PAGE_STORE if page_store is None else page_store
+        )
+        self.rate_limiter = (
+            self.RATE_LIMITER if rate_limiter is None else rate_limiter
+        )
+        if self.rate_limiter is None:
+            self.rate_limiter = RateLimiter({"generic": (self.RATE_LIMIT, 1)})
+        self.retry = self.RETRY if retry is None else retry
+        self.retry_budget = self.retry.budget() if self.retry else None
+        self.response_cache = (
+            self.RESPONSE_CACHE if response_cache is None else response_cache
+        )
+        self.entity_cache = (
+            self.ENTITY_CACHE if entity_cache is None else entity_cache
+        )
+        self.coalesce = self.COALESCE if coalesce is None else coalesce
+        self.flights = SingleFlight()
+        self.metrics = ClientMetrics()
+        self.nodes = NodeTracker()
+        self.reporter = MdahReporter(md)
+
+        self._session = None
+        self._session_pid = None
+
+    def _create_session(self) -> requests.Session:
+        session = requests.Session()
+        # ``pool_connections`` is the number of hosts we keep pools for,
+        # ``pool_maxsize`` the number of connections kept per host.
+        adapter = HTTPAdapter(
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            pool_block=self.pool_block,
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        session.headers["User-Agent"] = self.UA
+        if not self.keep_alive:
+            session.headers["Connection"] = "close"
+        return session
+
+    @property
+    def session(self) -> requests.Session:
+        """
+        The pooled HTTP session shared by every request this client
+        makes. Sockets can't be shared between processes, so a forked
+        child transparently gets a session of its own.
+        """
+        pid = os.getpid()
+        if self._session is None or self._session_pid != pid:
+            self._session = self._create_session()
+            self._session_pid = pid
+        return self._session
+
+    def close(self) -> None:
+        """
+        Close every pooled connection. The session will be recreated if
+        any further requests are made. Queued MD@H reports are sent
+        first.
+        """
+        self.reporter.close(self.reporter.FLUSH_TIMEOUT)
+        if self._session is not None and self._session_pid == os.getpid():
+            self._session.close()
+        self._session = None
+        self._session_pid = None
+
     def _save_auth(self):
         with open(self.AUTH_FILE, "w") as auth_file:
             json.dump({
@@ -38,26 +165,29 @@ class APIHandler:
                 "_auth": self._auth
             }, auth_file)
 
-    def _load_auth(self):
+    def _read_auth(self) -> bool:
         if not os.path.exists(self.AUTH_FILE):
-            return
+            return False
 
         with open(self.AUTH_FILE) as auth_file:
             try:
                 auth = json.load(auth_file)
             except json.JSONDecodeError:
-                return
+                return False
 
         try:
             user = auth["user"]
             _auth = auth["_auth"]
         except KeyError:
-            return
+            return False
 
         self.user = user
         self._auth = _auth
+        return True
 
-        self._check_expired(silent_error=True)
+    def _load_auth(self):
+        if self._read_auth():
+            self._check_expired(silent_error=True)
 
     def _check_expired(self, silent_error=False):
         if self._auth is None:
@@ -81,49 +211,55 @@ class APIHandler:
         headers["User-Agent"] = self.UA
         return headers
 
-    def _make_request(
-        self, action, body=None, params=None, urlparams=None, auth=True,
-        files=None
+    def _prepare_request(
+        self, action, body=None, params=None, urlparams=None, auth=True
     ):
+        """
+        Serialise a request into ``(method, url, json, params, headers)``.
+        This is shared by every transport so that all clients produce
+        identical requests.
+        """
         if params is not None:
             params = params_to_query(params)
-        if action != Endpoints.Auth.REFRESH:
-            self._check_expired()
 
         needs_base = not action[1].startswith(("http://", "https://"))
         url = (
             (self.BASE if needs_base else "")
             + action[1].format(**(urlparams or {}))
         )
-        req = requests.request(
+        return (
             action[0], url,
-            json=None if action[0] == "GET" else strip_nulls(body),
-            files=files,
-            params=strip_nulls(params),
-            headers=self._get_headers(auth)
+            None if action[0] == "GET" else strip_nulls(body),
+            strip_nulls(params),
+            self._get_headers(auth)
         )
-        if self.DEBUG:
-            click.echo(click.style(f" -> {action[0]} {req.url}", fg="yellow"))
 
-            correlation = req.headers.get("X-Correlation-ID")
-            if correlation:
-                click.echo(click.style(
-                    f" :: Correlation: {correlation}", fg="yellow"
-                ))
+    def _log_response(self, method, url, headers):
+        if not self.DEBUG:
+            return
+
+        click.echo(click.style(f" -> {method} {url}", fg="yellow"))
 
-        try:
-            resp = {} if req.status_code == 204 else req.json()
-        except json.decoder.JSONDecodeError:
-            resp = None
+        correlation = headers.get("X-Correlation-ID")
+        if correlation:
+            click.echo(click.style(
+                f" :: Correlation: {correlation}", fg="yellow"
+            ))
 
-        if req.status_code == 401:
+    def _handle_response(self, status_code, resp, headers=None):
+        if status_code == 401:
             raise NotLoggedIn(resp)
-        elif req.status_code == 403:
+        elif status_code == 403:
             raise ActionForbidden(resp)
+        elif status_code == 429:
+            raise RateLimited(
+                status_code if resp is None else resp.get("errors", []),
+                retry_after=RateLimiter.retry_after(headers or {})
+            )
 
-        if req.status_code < 200 or req.status_code > 299:
+        if status_code < 200 or status_code > 299:
             if resp is None:
-                raise MdException(req.status_code)
+                raise MdException(status_code)
             raise MdException(resp.get("errors", []))
 
         if not isinstance(resp, dict):
@@ -135,6 +271,210 @@ class APIHandler:
             resp = data
         return resp
 
+    def _identity(self, headers):
+        """
+        Who a request is made as, so responses for different users are
+        never mixed up. ``None`` for unauthenticated requests.
+        """
+        if "Authorization" not in headers:
+            return None
+        return (self.user or {}).get("username") or hashlib.sha256(
+            headers["Authorization"].encode()
+        ).hexdigest()
+
+    def _flight_key(self, method, url, query, headers, files=None):
+        """
+        The key concurrent identical requests are coalesced under, or
+        ``None`` if the request shouldn't be coalesced. Only ``GET``
+        requests are, as they have no side effects to repeat.
+        """
+        if not self.coalesce or method != "GET" or files:
+            return None
+        return (
+            method, url, json.dumps(query or {}, sort_keys=True, default=str),
+            self._identity(headers)
+        )
+
+    def _decode(self, status_code, headers, body):
+        try:
+            resp = {} if status_code == 204 else json.loads(body)
+        except json.decoder.JSONDecodeError:
+            resp = None
+
+        return self._handle_response(status_code, resp, headers)
+
+    def _cache_lookup(self, method, url, query, headers):
+        """
+        Find the cached response for a request, adding the headers that
+        revalidate it to ``headers``.
+
+        :returns: ``(key, entry)``. The key is ``None`` if the request
+            can't be cached, and the entry is ``None`` if nothing is.
+        """
+        if not self.response_cache or method != "GET":
+            return None, None
+
+        key = self.response_cache.key(
+            method, url, query, self._identity(headers)
+        )
+        entry = self.response_cache.get(key)
+        if entry is not None:
+            headers.update(entry.conditional_headers())
+        return key, entry
+
+    def _cache_response(self, key, entry, status_code, headers, body):
+        """
+        Swap a ``304`` for the cached response it revalidated, and cache
+        new responses.
+
+        :returns: ``(status_code, body)``
+        """
+        if key is None:
+            return status_code, body
+        if status_code == 304 and entry is not None:
+            self.metrics.add(cache_hits=1)
+            return 200, entry.body
+        if status_code == 200:
+            self.metrics.add(cache_misses=1)
+            self.response_cache.store(key, headers, body)
+        return status_code, body
+
+    def _retry_delay(
+        self, method, retry, files=None, status=None, headers=None,
+        action=None
+    ):
+        """
+        The time to wait before retrying a failed request, or ``None`` if
+        it shouldn't be retried. ``status`` is ``None`` if the request
+        failed without a response. Retries are taken from the client's
+        retry budget, and counted in its metrics.
+
+        A ``429`` that will be retried holds back ``action``'s route in
+        the rate limiter for as long, so other requests wait too.
+        """
+        if not self.retry or files:
+            return None
+        delay = self.retry.delay(method, retry, status, headers)
+        if delay is None:
+            return None
+        if not self.retry_budget.withdraw():
+            self.metrics.add(retries_denied=1)
+            return None
+        self.metrics.add(retries=1, retry_wait=delay)
+        if status == 429 and action is not None and self.rate_limiter:
+            self.rate_limiter.hold(action, delay)
+        return delay
+
+    def _make_request(
+        self, action, body=None, params=None, urlparams=None, auth=True,
+        files=None, with_headers=False
+    ):
+        """
+        Make a request to ``action``, returning its decoded response. If
+        ``with_headers`` is set, ``(response, headers)`` is returned
+        instead.
+        """
+        if action != Endpoints.Auth.REFRESH:
+            self._check_expired()
+
+        method, url, json_body, query, headers = self._prepare_request(
+            action, body, params, urlparams, auth
+        )
+        fetch = functools.partial(
+            self._fetch, action, method, url, json_body, query, headers, files
+        )
+        flight = self._flight_key(method, url, query, headers, files)
+        if flight is None:
+            response = fetch()
+        else:
+            response, shared = self.flights.do(flight, fetch)
+            if shared:
+                self.metrics.add(coalesced=1)
+        # Each caller decodes the body itself, so none share mutable data
+        resp = self._decode(*response)
+        return (resp, response[1]) if with_headers else resp
+
+    def _fetch(self, action, method, url, json_body, query, headers, files):
+        """
+        Send a request, retrying it if need be.
+
+        :returns: ``(status_code, headers, body)``
+        """
+        key, cached = self._cache_lookup(method, url, query, headers)
+        if self.retry:
+            self.retry_budget.deposit()
+
+        retry = 0
+        while True:
+            if self.rate_limiter:
+                delay = self.rate_limiter.reserve(action)
+                if delay:
+                    time.sleep(delay)
+            self.metrics.add(requests=1)
+            try:
+                req = self.session.request(
+                    method, url,
+                    json=json_body,
+                    files=files,
+                    params=query,
+                    headers=headers
+                )
+            except (requests.ConnectionError, requests.Timeout):
+                delay = self._retry_delay(method, retry, files)
+                if delay is None:
+                    raise
+            else:
+                self._log_response(method, req.url, req.headers)
+                if self.rate_limiter:
+                    self.rate_limiter.update(
+                        action, req.status_code, req.headers
+                    )
+                delay = None if req.ok else self._retry_delay(
+                    method, retry, files, req.status_code, req.headers,
+                    action
+                )
+                if delay is None:
+                    break
+                req.close()
+            retry += 1
+            time.sleep(delay)
+
+        status_code, body = self._cache_response(
+            key, cached, req.status_code, req.headers, req.content
+        )
+        return status_code, req.headers, body
+
+    def _parse(self, obj, trusted=None):
+        """
+        Parse an object from a response into its model. If ``trusted``
+        (by default, the client's ``trusted_responses`` option) is set,
+        the model is constructed without validation.
+        """
+        if self.trusted_responses if trusted is None else trusted:
+            model = Type.construct_obj(obj)
+        else:
+            model = Type.parse_obj(obj)
+        if self.entity_cache:
+            self.entity_cache.add(model)
+        return model
+
+    def _cached(self, type_, id_):
+        """
+        The ``type_`` object with ID ``id_`` from the client's entity
+        cache, or ``None``.
+        """
+        if not self.entity_cache:
+            return None
+        return self.entity_cache.get(type_, id_)
+
+    def _invalidate(self, id_):
+        """
+        Drop the object with ID ``id_`` from the client's entity cache,
+        after it's been changed.
+        """
+        if self.entity_cache:
+            self.entity_cache.invalidate(id_)
+
     def _authenticate(self, username, token):
         self._auth = token
         if token is None or username is not None:
@@ -148,10 +488,74 @@ class APIHandler:
 
 
 class MdAPI:
+    """
+    A MangaDex API client. Every option defaults to the matching class
+    attribute on `APIHandler`.
+
+    :param pool_connections: The number of hosts to keep connection
+        pools for
+    :param pool_maxsize: The number of connections kept per host
+    :param pool_block: Block rather than open extra connections when a
+        host's pool is exhausted
+    :param keep_alive: Reuse connections between requests
+    :param prefetch: How many pages paginated requests fetch ahead in the
+        background
+    :param lazy_results: Yield paginated results as
+        `mdapi.schema.LazyType` views, only parsed when needed
+    :param trusted_responses: Build models from responses without
+        validating them, converting only the fields that need it. The
+        API's responses match its schema, so this is safe unless the
+        schema changes.
+    :param validate_arguments: Validate arguments to API methods with
+        pydantic. When off, only the conversions needed to build requests
+        are made, which is much cheaper for frequently called methods.
+    :param failover: The `mdapi.nodes.FailoverPolicy` for retrying page
+        downloads on fresh MD@H nodes
+    :param page_store: A `mdapi.store.PageStore` to take pages from
+        instead of downloading them when they're already stored, and to
+        store newly downloaded pages in
+    :param rate_limiter: The `mdapi.ratelimit.RateLimiter` to keep
+        requests within MangaDex's rate limits, or ``False`` to send
+        requests as fast as they're made. Each client has its own by
+        default; pass the same one to several clients to share it.
+    :param retry: The `mdapi.retry.RetryPolicy` for retrying requests
+        after transient failures, or ``False`` to never retry them
+    :param response_cache: A `mdapi.cache.ResponseCache` to revalidate
+        ``GET`` responses with, rather than fetching them in full each
+        time
+    :param entity_cache: A `mdapi.cache.EntityCache` to keep parsed
+        models in, so ``get`` methods can skip the request entirely
+    :param coalesce: Have concurrent identical ``GET`` requests wait on
+        one request rather than each being sent. Enabled by default.
+    """
+
     DEBUG = False
 
-    def __init__(self):
-        self.api = APIHandler(self)
+    def __init__(
+        self, pool_connections=None, pool_maxsize=None, pool_block=None,
+        keep_alive=None, prefetch=None, lazy_results=None,
+        trusted_responses=None, validate_arguments=None, failover=None,
+        page_store=None, rate_limiter=None, retry=None,
+        response_cache=None, entity_cache=None, coalesce=None
+    ):
+        self.api = APIHandler(
+            self,
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+            keep_alive=keep_alive,
+            prefetch=prefetch,
+            lazy_results=lazy_results,
+            trusted_responses=trusted_responses,
+            validate_arguments=validate_arguments,
+            failover=failover,
+            page_store=page_store,
+            rate_limiter=rate_limiter,
+            retry=retry,
+            response_cache=response_cache,
+            entity_cache=entity_cache,
+            coalesce=coalesce,
+        )
         self.api.DEBUG = self.DEBUG
 
         self.account = AccountAPI(self, self.api)
@@ -167,3 +571,15 @@ class MdAPI:
         self.upload = UploadAPI(self, self.api)
 
         self.api._load_auth()
+
+    def close(self) -> None:
+        """
+        Release any pooled connections held by this client.
+        """
+        self.api.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,52 @@
+from threading import Lock
+from typing import Dict
+
+
+class ClientMetrics:
+    """
+    Counters for the API requests a client has made. These are updated
+    from whichever thread makes the request.
+
+    :ivar requests: Requests sent, including retries
+    :ivar retries: Requests retried after a transient failure
+    :ivar retry_wait: Seconds spent waiting before retries
+    :ivar retries_denied: Retries not made because the client's retry
+        budget was spent
+    :ivar cache_hits: Cached responses revalidated with a ``304``
+    :ivar cache_misses: Cacheable requests that fetched a new response
+    :ivar coalesced: Requests that waited on an identical one already in
+        flight, rather than being sent
+    """
+
+    FIELDS = (
+        "requests", "retries", "retry_wait", "retries_denied",
+        "cache_hits", "cache_misses", "coalesced",
+    )
+
+    def __init__(self):
+        self._lock = Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            for name in self.FIELDS:
+                setattr(self, name, 0)
+
+    def add(self, **counts):
+        """
+        Add to one or more counters, e.g. ``metrics.add(retries=1)``.
+        """
+        with self._lock:
+            for name, value in counts.items():
+                setattr(self, name, getattr(self, name) + value)
+
+    def snapshot(self) -> Dict[str, float]:
+        with self._lock:
+            return {name: getattr(self, name) for name in self.FIELDS}
+
+    def __repr__(self):
+        counts = " ".join(f"{k}={v:g}" for k, v in self.snapshot().items())
+        return f"<ClientMetrics {counts}>"
+
+
+__all__ = ("ClientMetrics", )
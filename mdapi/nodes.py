@@ -0,0 +1,315 @@
+import os
+import time
+import atexit
+import weakref
+import functools
+from threading import Lock
+from typing import Dict, Mapping, Optional
+from urllib.parse import urlparse
+
+from .exceptions import DownloadException
+from .util import Worker
+
+# MD@H base URLs stay valid for 15 minutes. Stop handing them out a
+# little before they expire, so pages started near the end still finish.
+AT_HOME_MARGIN = 60
+AT_HOME_TTL = 15 * 60 - AT_HOME_MARGIN
+
+
+def at_home_ttl(headers: Mapping[str, str]) -> float:
+    """
+    Seconds an MD@H base URL can be handed out for, from the
+    ``Cache-Control: max-age`` of the response it came in, less
+    `AT_HOME_MARGIN`. `AT_HOME_TTL` if the response doesn't say.
+    """
+    for directive in headers.get("Cache-Control", "").split(","):
+        name, _, value = directive.strip().partition("=")
+        if name.lower() == "max-age":
+            try:
+                return max(0, int(value) - AT_HOME_MARGIN)
+            except ValueError:
+                break
+    return AT_HOME_TTL
+
+
+class FailoverPolicy:
+    """
+    How page downloads recover from failing or slow MD@H nodes.
+
+    Pages that fail are retried on a fresh node from
+    ``/at-home/server/{chapter}``, up to ``retries`` more times. A page
+    that takes longer than ``timeout`` to respond counts as failed. A
+    node is only switched to if it isn't known to be unhealthy, asking
+    for up to ``node_attempts`` nodes before settling for the last one.
+
+    :param retries: How many more times to try a failed page
+    :param timeout: Seconds to wait for a node to connect, or between
+        bytes of a page, before giving up on it
+    :param backoff: Seconds to wait before the first retry. This doubles
+        for every retry after.
+    :param node_attempts: How many nodes to ask for when looking for a
+        healthy one
+    :param max_latency: The average time to first byte, in milliseconds,
+        above which a node is unhealthy
+    :param max_error_rate: The average error rate, from 0 to 1, above
+        which a node is unhealthy
+    """
+
+    def __init__(
+        self, retries: int = 2, timeout: Optional[float] = 30,
+        backoff: float = 1, node_attempts: int = 3,
+        max_latency: float = 10000, max_error_rate: float = 0.5
+    ):
+        self.retries = retries
+        self.timeout = timeout
+        self.backoff = backoff
+        self.node_attempts = node_attempts
+        self.max_latency = max_latency
+        self.max_error_rate = max_error_rate
+
+    def should_retry(self, error: Optional[BaseException]) -> bool:
+        """
+        Could ``error`` be fixed by trying another node? Only download
+        errors are; errors writing to disk, for example, aren't.
+        """
+        return isinstance(error, DownloadException)
+
+    def retry_page(self, page) -> bool:
+        """
+        Should ``page``, a `mdapi.download.PageResult`, be retried on a
+        fresh node?
+        """
+        return page.retries < self.retries and self.should_retry(page.error)
+
+    def delay(self, retry: int) -> float:
+        """
+        The time to wait before the given retry, counting from zero.
+        """
+        return self.backoff * 2 ** retry
+
+
+class NodeHealth:
+    """
+    Running statistics for a single MD@H node. Latency, throughput and
+    error rate are exponentially weighted, so recent requests count the
+    most.
+
+    :ivar latency: The average time to first byte, in milliseconds
+    :ivar throughput: The average transfer rate of successful requests,
+        in bytes per second
+    :ivar error_rate: The average proportion of requests that failed
+    """
+
+    #: The weight given to each new request
+    ALPHA = 0.3
+
+    def __init__(self, base: str):
+        self.base = base
+        self.latency: Optional[float] = None
+        self.throughput: Optional[float] = None
+        self.error_rate = 0.0
+        self.requests = 0
+        self.failures = 0
+        self.bytes = 0
+        self.last_failure: Optional[float] = None
+
+    def record(
+        self, success: bool, num_bytes: int, duration: int,
+        ttfb: Optional[float] = None
+    ):
+        self.requests += 1
+        self.bytes += num_bytes
+        if not success:
+            self.failures += 1
+            self.last_failure = time.monotonic()
+
+        self.error_rate += self.ALPHA * ((not success) - self.error_rate)
+        # Requests that never connected don't tell us anything about speed
+        if not duration:
+            return
+        latency = duration if ttfb is None else ttfb
+        if self.latency is None:
+            self.latency = float(latency)
+        else:
+            self.latency += self.ALPHA * (latency - self.latency)
+
+        transfer = duration - (ttfb or 0)
+        if success and num_bytes and transfer > 0:
+            rate = num_bytes / (transfer / 1000)
+            if self.throughput is None:
+                self.throughput = rate
+            else:
+                self.throughput += self.ALPHA * (rate - self.throughput)
+
+    def healthy(self, policy: FailoverPolicy) -> bool:
+        if self.error_rate > policy.max_error_rate:
+            return False
+        return self.latency is None or self.latency <= policy.max_latency
+
+    def __repr__(self):
+        latency = "?" if self.latency is None else f"{self.latency:.0f}ms"
+        return (
+            f"<NodeHealth {self.base} {latency} "
+            f"errors={self.error_rate:.0%} requests={self.requests}>"
+        )
+
+
+class NodeTracker:
+    """
+    Health statistics for every MD@H node pages have been downloaded
+    from, keyed by the node's scheme and host. This is fed the same
+    numbers that are reported to MD@H.
+    """
+
+    def __init__(self):
+        self._nodes: Dict[str, NodeHealth] = {}
+        self._lock = Lock()
+
+    @staticmethod
+    def node_of(url: str) -> str:
+        parsed = urlparse(url)
+        return f"{parsed.scheme}://{parsed.netloc}"
+
+    def get(self, url: str) -> NodeHealth:
+        """
+        The health of the node serving ``url``.
+        """
+        base = self.node_of(url)
+        with self._lock:
+            if base not in self._nodes:
+                self._nodes[base] = NodeHealth(base)
+            return self._nodes[base]
+
+    def record(
+        self, url: str, success: bool, num_bytes: int, duration: int,
+        ttfb: Optional[float] = None
+    ):
+        node = self.get(url)
+        with self._lock:
+            node.record(success, num_bytes, duration, ttfb)
+
+    def __iter__(self):
+        with self._lock:
+            return iter(list(self._nodes.values()))
+
+
+# Reporters to flush when the interpreter exits. Held weakly, so a
+# client that's dropped can still be garbage collected.
+_reporters = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_reporters():
+    for reporter in list(_reporters):
+        reporter.flush(reporter.FLUSH_TIMEOUT)
+
+
+def _send_report(ref, report):
+    # Worker threads hold the reporter weakly, for the same reason
+    reporter = ref()
+    if reporter is not None:
+        reporter._send(report)
+
+
+class MdahReporter:
+    """
+    Sends MD@H reports from background threads, so downloads don't wait
+    on a request to the report endpoint after every page.
+
+    At most ``maxsize`` reports are held; when full, the oldest is
+    dropped. Anything still queued is flushed when the interpreter exits,
+    waiting no more than `FLUSH_TIMEOUT` seconds.
+
+    :param md: The `mdapi.MdAPI` client to report with
+    :param num_workers: The number of reports to send at once
+    :param maxsize: The maximum number of reports waiting to be sent
+    """
+
+    MAXSIZE = 1000
+    FLUSH_TIMEOUT = 5
+
+    def __init__(self, md, num_workers: int = 2, maxsize: int = MAXSIZE):
+        self.md = md
+        self.num_workers = num_workers
+        self.maxsize = maxsize
+
+        self._worker = None
+        self._worker_pid = None
+        self._finalizer = None
+        self._lock = Lock()
+
+    def _send(self, report):
+        try:
+            self.md.misc.report_mdah(*report)
+        except Exception:
+            # Reports are best effort, and an exception would end the
+            # worker thread
+            pass
+
+    def _get_worker(self) -> Worker:
+        with self._lock:
+            # Threads don't survive a fork, so start afresh in children
+            if self._worker is None or self._worker_pid != os.getpid():
+                self._worker = Worker(
+                    functools.partial(_send_report, weakref.ref(self)),
+                    long_lived=True, num_workers=self.num_workers,
+                    maxsize=self.maxsize
+                )
+                self._worker.start()
+                self._worker_pid = os.getpid()
+                # Stop the threads if the reporter is collected. At exit,
+                # they're flushed instead
+                self._finalizer = weakref.finalize(self, self._worker.kill)
+                self._finalizer.atexit = False
+                _reporters.add(self)
+            return self._worker
+
+    def report(
+        self, url: str, success: bool, cached: bool, num_bytes: int,
+        duration: int
+    ):
+        """
+        Queue a report. Arguments are the same as
+        `mdapi.api.misc.MiscAPI.report_mdah`.
+        """
+        self._get_worker().enqueue(
+            (url, success, cached, num_bytes, duration)
+        )
+
+    @property
+    def dropped(self) -> int:
+        """
+        The number of reports dropped because the queue was full.
+        """
+        return 0 if self._worker is None else self._worker.dropped
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait for every queued report to be sent.
+
+        :returns: ``False`` if ``timeout`` ran out first
+        """
+        worker = self._worker
+        if worker is None or self._worker_pid != os.getpid():
+            return True
+        return worker.join(timeout)
+
+    def close(self, timeout: Optional[float] = None):
+        """
+        Flush queued reports, then stop the background threads. A new
+        report will start them again.
+        """
+        self.flush(timeout)
+        with self._lock:
+            if self._worker is not None and self._worker_pid == os.getpid():
+                self._finalizer.detach()
+                self._worker.kill()
+                _reporters.discard(self)
+            self._worker = None
+            self._worker_pid = None
+
+
+__all__ = (
+    "AT_HOME_MARGIN", "AT_HOME_TTL", "at_home_ttl", "FailoverPolicy",
+    "NodeHealth", "NodeTracker", "MdahReporter"
+)
@@ -0,0 +1,259 @@
+import time
+from threading import Lock
+from typing import Dict, Mapping, Optional, Tuple
+
+from .endpoints import Endpoints
+from .exceptions import RateLimited
+
+
+class TokenBucket:
+    """
+    A thread-safe token bucket, allowing ``rate`` requests per second on
+    average with bursts of up to ``capacity``.
+
+    Rather than blocking, `reserve` takes a token and returns how long
+    to wait before using it. Tokens can be reserved ahead of time, so
+    concurrent callers queue up behind each other.
+
+    :param rate: Tokens added per second
+    :param capacity: The most tokens held at once
+    """
+
+    def __init__(self, rate: float, capacity: float = 1):
+        self.rate = rate
+        self.capacity = capacity
+
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = Lock()
+
+    def _refill(self, now: float):
+        self._tokens = min(
+            self.capacity, self._tokens + (now - self._updated) * self.rate
+        )
+        self._updated = now
+
+    def _delay(self, now: float) -> float:
+        delay = max(0.0, self._blocked_until - now)
+        if self._tokens < 0:
+            delay = max(delay, -self._tokens / self.rate)
+        return delay
+
+    def reserve(self, max_wait: Optional[float] = None) -> float:
+        """
+        Take a token.
+
+        :param max_wait: If waiting would take longer than this, no token
+            is taken, and `mdapi.exceptions.RateLimited` is raised
+
+        :returns: Seconds to wait before the request can be made
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self._tokens -= 1
+            delay = self._delay(now)
+            if max_wait is not None and delay > max_wait:
+                self._tokens += 1
+                raise RateLimited(retry_after=delay)
+            return delay
+
+    def refund(self):
+        """
+        Give back a token taken with `reserve`.
+        """
+        with self._lock:
+            self._tokens = min(self.capacity, self._tokens + 1)
+
+    def limit(self, remaining: int):
+        """
+        Don't allow more than ``remaining`` requests until tokens are
+        next added, as reported by the server.
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens = min(self._tokens, remaining)
+
+    def block(self, seconds: float):
+        """
+        Hold back every request for ``seconds``.
+        """
+        with self._lock:
+            self._blocked_until = max(
+                self._blocked_until, time.monotonic() + seconds
+            )
+
+    def __repr__(self):
+        return (
+            f"<TokenBucket {self.rate:g}/s capacity={self.capacity:g} "
+            f"tokens={self._tokens:.2f}>"
+        )
+
+
+def _family_actions():
+    families = {Endpoints.GET_MD_AT_HOME: "at-home"}
+    for group, family in (
+        (Endpoints.Auth, "auth"), (Endpoints.Account, "auth"),
+        (Endpoints.Upload, "upload"),
+    ):
+        for name, action in vars(group).items():
+            if not name.startswith("_"):
+                families[action] = family
+    return families
+
+
+class RateLimiter:
+    """
+    Keeps requests within MangaDex's rate limits. Every request counts
+    against the ``generic`` bucket, the site-wide limit per IP. Requests
+    to endpoints with stricter limits of their own also count against
+    their family's bucket: ``at-home`` for `Endpoints.GET_MD_AT_HOME`,
+    ``auth`` for `Endpoints.Auth` and `Endpoints.Account`, and
+    ``upload`` for `Endpoints.Upload`. Requests to other hosts, such as
+    MD@H reports, aren't limited.
+
+    When responses carry ``X-RateLimit-Remaining`` and
+    ``X-RateLimit-Retry-After`` headers, the family's bucket is adjusted
+    to match. When a ``429`` is retried, the client holds back its
+    route with `hold` until the retry, or the whole family for families
+    with limits of their own. Holds never last longer than ``max_wait``,
+    so requests wait them out rather than fail.
+
+    Each client has its own limiter by default. As the limits apply to
+    the whole IP, clients in the same process can share one by passing
+    it to each, or by setting `mdapi.mdapi.APIHandler.RATE_LIMITER`. It
+    is safe to use from several threads.
+
+    :param limits: ``(requests per second, burst)`` for each family,
+        overriding `LIMITS`
+    :param max_wait: Raise `mdapi.exceptions.RateLimited` rather than
+        wait longer than this many seconds for a request
+    """
+
+    #: ``(requests per second, burst)`` for each family
+    LIMITS: Dict[str, Tuple[float, float]] = {
+        "generic": (5, 1),
+        "at-home": (40 / 60, 40),
+        "auth": (30 / 3600, 30),
+        "upload": (30 / 60, 30),
+    }
+
+    #: The family of every endpoint with a limit of its own
+    FAMILIES = _family_actions()
+
+    def __init__(
+        self, limits: Optional[Mapping[str, Tuple[float, float]]] = None,
+        max_wait: Optional[float] = 60
+    ):
+        self.max_wait = max_wait
+        self.buckets = {
+            family: TokenBucket(rate, capacity)
+            for family, (rate, capacity) in {
+                **self.LIMITS, **(limits or {})
+            }.items()
+        }
+        # When each held route can next be requested
+        self._held: Dict[tuple, float] = {}
+        self._lock = Lock()
+
+    def family_of(self, action) -> Optional[str]:
+        """
+        The family ``action`` is limited under, or ``None`` if it isn't
+        limited at all.
+        """
+        if action[1].startswith(("http://", "https://")):
+            return None
+        return self.FAMILIES.get(action, "generic")
+
+    def _buckets_for(self, action):
+        family = self.family_of(action)
+        if family is None:
+            return []
+        buckets = [self.buckets["generic"]]
+        if family != "generic" and family in self.buckets:
+            buckets.append(self.buckets[family])
+        return buckets
+
+    def reserve(self, action) -> float:
+        """
+        Take a token for a request to ``action``.
+
+        :returns: Seconds to wait before making the request
+        """
+        with self._lock:
+            delay = self._held.get(action, 0.0) - time.monotonic()
+            if delay <= 0:
+                self._held.pop(action, None)
+                delay = 0.0
+        reserved = []
+        try:
+            for bucket in self._buckets_for(action):
+                delay = max(delay, bucket.reserve(self.max_wait))
+                reserved.append(bucket)
+        except RateLimited:
+            for bucket in reserved:
+                bucket.refund()
+            raise
+        return delay
+
+    @staticmethod
+    def retry_after(headers: Mapping[str, str]) -> Optional[float]:
+        """
+        Seconds until requests can be made again, from a response's
+        ``Retry-After`` (in seconds) or ``X-RateLimit-Retry-After`` (a
+        Unix timestamp) header.
+        """
+        try:
+            if (value := headers.get("Retry-After")) is not None:
+                return max(0.0, float(value))
+            if (value := headers.get("X-RateLimit-Retry-After")) is not None:
+                return max(0.0, float(value) - time.time())
+        except ValueError:
+            pass
+        return None
+
+    def hold(self, action, seconds: float):
+        """
+        Hold back requests to ``action``'s route for ``seconds``, or to
+        its whole family if that has a limit of its own. Holds are cut
+        short at ``max_wait``.
+        """
+        if self.max_wait is not None:
+            seconds = min(seconds, self.max_wait)
+        family = self.family_of(action)
+        if family is None:
+            return
+        if family != "generic" and family in self.buckets:
+            self.buckets[family].block(seconds)
+            return
+        with self._lock:
+            self._held[action] = max(
+                self._held.get(action, 0.0), time.monotonic() + seconds
+            )
+
+    def update(self, action, status_code: int, headers: Mapping[str, str]):
+        """
+        Adjust the buckets for ``action`` from a response's headers.
+
+        A ``429`` doesn't hold anything back here. Only the caller knows
+        whether it will wait out the ``Retry-After``, so it calls `hold`
+        if it does.
+        """
+        buckets = self._buckets_for(action)
+        if not buckets or status_code == 429:
+            return
+
+        try:
+            remaining = int(headers["X-RateLimit-Remaining"])
+        except (KeyError, ValueError):
+            return
+        # The family's own limit is the one the headers describe
+        buckets[-1].limit(remaining)
+        if remaining <= 0 and (
+            retry_after := self.retry_after(headers)
+        ) is not None:
+            self.hold(action, retry_after)
+
+
+__all__ = ("TokenBucket", "RateLimiter")
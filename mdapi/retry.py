@@ -0,0 +1,134 @@
+import random
+from threading import Lock
+from typing import Collection, Mapping, Optional
+
+from .ratelimit import RateLimiter
+
+
+class RetryBudget:
+    """
+    Limits retries to a proportion of the requests a client makes, so a
+    failing API isn't hit with a storm of retries. Every request adds
+    ``ratio`` of a retry to the budget, up to ``capacity``, and every
+    retry takes one away.
+
+    :param ratio: Retries earned per request
+    :param capacity: The most retries that can be saved up
+    """
+
+    def __init__(self, ratio: float = 0.2, capacity: float = 10):
+        self.ratio = ratio
+        self.capacity = capacity
+
+        self._tokens = capacity
+        self._lock = Lock()
+
+    def deposit(self):
+        with self._lock:
+            self._tokens = min(self.capacity, self._tokens + self.ratio)
+
+    def withdraw(self) -> bool:
+        """
+        Take a retry from the budget.
+
+        :returns: ``False`` if the budget is spent
+        """
+        with self._lock:
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            return True
+
+
+class RetryPolicy:
+    """
+    How API requests recover from transient failures: connection errors,
+    ``5xx`` responses and ``429 Too Many Requests``.
+
+    Only idempotent methods are retried, as a ``POST`` that failed part
+    way may still have taken effect. A ``429`` is retried for any
+    method, as the server didn't act on the request. Requests that
+    upload files aren't retried.
+
+    Retries wait with exponential backoff and full jitter: a random
+    time up to ``backoff * 2 ** retry`` seconds, capped at
+    ``max_backoff``. A ``Retry-After`` from the server is waited out
+    instead, unless it's longer than ``max_retry_after``, in which case
+    the request isn't retried.
+
+    :param retries: How many more times to try a failed request
+    :param backoff: Seconds to wait, at most, before the first retry
+    :param max_backoff: The longest backoff before a retry
+    :param jitter: Wait a random proportion of the backoff
+    :param max_retry_after: The longest ``Retry-After`` to wait for
+    :param methods: The HTTP methods that may be retried
+    :param statuses: The status codes that may be retried
+    :param budget_ratio: Retries each client earns per request. See
+        `RetryBudget`.
+    :param budget_capacity: The most retries each client can save up
+    """
+
+    IDEMPOTENT_METHODS = frozenset(
+        ("GET", "HEAD", "OPTIONS", "PUT", "DELETE")
+    )
+    STATUSES = frozenset((429, 500, 502, 503, 504))
+
+    def __init__(
+        self, retries: int = 3, backoff: float = 0.5,
+        max_backoff: float = 30, jitter: bool = True,
+        max_retry_after: float = 60,
+        methods: Collection[str] = IDEMPOTENT_METHODS,
+        statuses: Collection[int] = STATUSES,
+        budget_ratio: float = 0.2, budget_capacity: float = 10
+    ):
+        self.retries = retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.max_retry_after = max_retry_after
+        self.methods = methods
+        self.statuses = statuses
+        self.budget_ratio = budget_ratio
+        self.budget_capacity = budget_capacity
+
+    def budget(self) -> RetryBudget:
+        """
+        A new `RetryBudget` for a client using this policy.
+        """
+        return RetryBudget(self.budget_ratio, self.budget_capacity)
+
+    def retryable(self, method: str, status: Optional[int] = None) -> bool:
+        """
+        Could a request be fixed by sending it again? ``status`` is
+        ``None`` if the request failed without a response.
+        """
+        if status == 429:
+            return status in self.statuses
+        if status is not None and status not in self.statuses:
+            return False
+        return method.upper() in self.methods
+
+    def delay(
+        self, method: str, retry: int, status: Optional[int] = None,
+        headers: Optional[Mapping[str, str]] = None
+    ) -> Optional[float]:
+        """
+        The time to wait before the given retry, counting from zero.
+
+        :returns: ``None`` if the request shouldn't be retried
+        """
+        if retry >= self.retries or not self.retryable(method, status):
+            return None
+
+        if headers is not None and (
+            retry_after := RateLimiter.retry_after(headers)
+        ) is not None:
+            if retry_after > self.max_retry_after:
+                return None
+            return retry_after
+
+        delay = min(self.max_backoff, self.backoff * 2 ** retry)
+        return random.uniform(0, delay) if self.jitter else delay
+
+
+__all__ = ("RetryBudget", "RetryPolicy")
@@ -1,6 +1,6 @@
 from .models import (
     Type, User, Tag, Manga, Chapter, ScanlationGroup, CustomList,
-    MappingID, Author, Cover, UploadSession, UploadSessionFile
+    MappingID, Author, Cover, UploadSession, UploadSessionFile, LazyType
 )
 from .const import (
     PublicationDemographic, Status, ContentRating, ReadingStatus,
@@ -8,7 +8,8 @@ from .const import (
     MultiMode, LegacyType, Year, UnsetValue, CanUnset
 )
 from .search import (
-    AuthorSortOrder, MangaSortOrder, ChapterSortOrder, CoverSortOrder
+    AuthorSortOrder, MangaSortOrder, ChapterSortOrder, CoverSortOrder,
+    MangaCursor, ChapterCursor
 )
 from .util import (
     TypeOrId, LocalizedString
@@ -17,13 +18,14 @@ from .util import (
 __all__ = (
     "TypeOrId", "Type", "User", "Tag", "Manga", "Chapter", "ScanlationGroup",
     "CustomList", "MappingID", "Author", "Cover", "UploadSession",
-    "UploadSessionFile",
+    "UploadSessionFile", "LazyType",
 
     "PublicationDemographic", "Status", "ContentRating", "ReadingStatus",
     "CustomListVisibility", "LinksKey", "LanguageCode", "SortOrder", "Version",
     "MultiMode", "LegacyType", "Year", "UnsetValue", "CanUnset",
 
     "AuthorSortOrder", "MangaSortOrder", "ChapterSortOrder", "CoverSortOrder",
+    "MangaCursor", "ChapterCursor",
 
     "TypeOrId", "LocalizedString",
 )
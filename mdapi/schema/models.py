@@ -1,5 +1,5 @@
 from mdapi.endpoints import Endpoints
-from typing import Dict, List, Optional
+from typing import ClassVar, Dict, List, Optional
 from datetime import datetime
 from pydantic import BaseModel, constr
 from uuid import UUID
@@ -17,10 +17,18 @@ class Relationship(BaseModel):
 
 
 class BaseType(BaseModel):
+    # Every subclass, keyed by its ``_type``. Filled in as they're defined
+    _registry: ClassVar[Dict[str, "BaseType"]] = {}
+
     id: str
     relationships: Optional[List[Relationship]] = []
     version: Version
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if "_type" in cls.__dict__:
+            BaseType._registry[cls._type] = cls
+
     def relations_to(self, type_: str):
         if self.relationships is None:
             return []
@@ -190,3 +198,57 @@ class UploadSessionFile(BaseType):
     fileHash: str
     fileSize: int
     mimeType: str
+
+
+class LazyType:
+    """
+    A lightweight view over an unparsed API object. ``id``, ``type``,
+    ``attributes`` and ``relationships`` are read straight from the raw
+    JSON. Accessing anything else parses the full model, once, and
+    defers to it.
+
+    .. note::
+        ``type`` is always the object type (``"manga"``, ``"chapter"``,
+        ...), even for models that define a ``type`` field of their own.
+    """
+
+    __slots__ = ("raw", "_model", "_parse")
+
+    def __init__(self, raw: dict, parse=None):
+        self.raw = raw
+        self._model = None
+        self._parse = parse or Type.parse_obj
+
+    @property
+    def id(self) -> str:
+        return self.raw["id"]
+
+    @property
+    def type(self) -> str:
+        return self.raw.get("type")
+
+    @property
+    def attributes(self) -> dict:
+        return self.raw.get("attributes", {})
+
+    @property
+    def relationships(self) -> List[dict]:
+        return self.raw.get("relationships") or []
+
+    @property
+    def is_materialized(self) -> bool:
+        return self._model is not None
+
+    def materialize(self) -> BaseType:
+        """
+        Parse and return the full model for this object.
+        """
+        if self._model is None:
+            self._model = self._parse(self.raw)
+        return self._model
+
+    def __getattr__(self, item):
+        return getattr(self.materialize(), item)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.type}:{self.id})"
@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import Literal, Optional
 
 from pydantic import BaseModel
 
@@ -39,3 +39,8 @@ class CoverSortOrder(BaseSortOrder):
     createdAt: Optional[SortOrder]
     updatedAt: Optional[SortOrder]
     volume: Optional[SortOrder]
+
+
+# The timestamp fields that can be used as a pagination cursor
+MangaCursor = Literal["createdAt", "updatedAt"]
+ChapterCursor = Literal["createdAt", "updatedAt", "publishAt"]
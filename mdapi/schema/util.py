@@ -1,6 +1,14 @@
+from datetime import datetime
+from enum import Enum
 from types import FunctionType
-from typing import Generator, List, Tuple
+from typing import Callable, Dict, Generator, List, Optional, Tuple
+from uuid import UUID
+
 from pydantic import BaseModel
+from pydantic.datetime_parse import parse_datetime
+from pydantic.fields import (
+    ModelField, SHAPE_LIST, SHAPE_DICT, SHAPE_MAPPING, SHAPE_SINGLETON
+)
 
 from .const import LanguageCode
 
@@ -46,26 +54,158 @@ class LocalizedString(dict):
         return cls(*list(values.items())[0][::-1])
 
 
+def _to_datetime(value):
+    if isinstance(value, datetime):
+        return value
+    try:
+        return datetime.fromisoformat(value)
+    except (TypeError, ValueError):
+        return parse_datetime(value)
+
+
+def _compile_type(type_, keyed) -> Optional[Callable]:
+    if type_ is datetime:
+        return _to_datetime
+    if type_ is UUID:
+        return UUID
+    if type_ is LocalizedString:
+        return LocalizedString.return_i18n
+    if getattr(type_, "__keyed__", None) is not None:
+        return type_.__keyed__.construct_type
+    if isinstance(type_, type):
+        if issubclass(type_, Enum):
+            return type_
+        if issubclass(type_, BaseModel):
+            return keyed.construct_model(type_)
+    # Everything else (str, int, Literal, constr, ...) is already in the
+    # form we'd validate it into.
+    return None
+
+
+def _compile_field(field: ModelField, keyed) -> Optional[Callable]:
+    convert = _compile_type(field.type_, keyed)
+
+    if field.shape == SHAPE_LIST:
+        if convert is not None:
+            item = convert
+
+            def convert(value):
+                return [item(i) for i in value]
+    elif field.shape in (SHAPE_DICT, SHAPE_MAPPING):
+        convert_key = _compile_type(field.key_field.type_, keyed)
+        convert_value = convert
+        if convert_key is not None or convert_value is not None:
+            convert_key = convert_key or (lambda k: k)
+            convert_value = convert_value or (lambda v: v)
+
+            def convert(value):
+                return {
+                    convert_key(k): convert_value(v) for k, v in value.items()
+                }
+    elif field.shape != SHAPE_SINGLETON:
+        return None
+
+    if convert is not None and field.allow_none:
+        inner = convert
+
+        def convert(value):
+            return None if value is None else inner(value)
+
+    return convert
+
+
 class Keyed:
+    """
+    Validates a ``{"type": ..., "attributes": ...}`` object into the
+    subclass of ``item`` for its type. ``item`` must keep a ``_registry``
+    of its subclasses, keyed by ``_type``.
+
+    `construct_type` builds the same model without validation, converting
+    only the fields that need it (datetimes, enums, localised strings and
+    nested models). This is only safe for data already known to match
+    the schema, such as API responses.
+    """
+
     def __init__(self, item):
         self.item = item
+        self.types = item._registry
+        # Per-model constructors for construct_model, built on demand
+        self._constructors: Dict[type, Callable] = {}
+
+    def construct_model(self, model) -> Callable:
+        """
+        Get a function that builds ``model`` from a dict without
+        validation.
+        """
+        if model in self._constructors:
+            return self._constructors[model]
+
+        # Models can refer to themselves, so the plan is filled in after
+        # the constructor has been cached. Each entry is the field name,
+        # its converter, and how to get its default: not at all (required
+        # fields), from a factory (mutable defaults) or as a constant.
+        plan = []
+
+        # This mirrors BaseModel.construct, without deep-copying every
+        # default on every call.
+        def construct(values):
+            fields = {}
+            for name, convert, required, factory, default in plan:
+                if name in values:
+                    value = values[name]
+                    if convert is not None and value is not None:
+                        value = convert(value)
+                    fields[name] = value
+                elif factory is not None:
+                    fields[name] = factory()
+                elif not required:
+                    fields[name] = default
+
+            model_ = object.__new__(model)
+            object.__setattr__(model_, "__dict__", fields)
+            object.__setattr__(
+                model_, "__fields_set__", values.keys() & fields.keys()
+            )
+            if model.__private_attributes__:
+                model_._init_private_attributes()
+            return model_
+
+        self._constructors[model] = construct
+        for name, field in model.__fields__.items():
+            mutable = field.default_factory is not None or not isinstance(
+                field.default, (type(None), str, int, float, bool, Enum)
+            )
+            plan.append((
+                name, _compile_field(field, self), field.required,
+                field.get_default if mutable and not field.required else None,
+                field.default,
+            ))
+        return construct
+
+    def construct_type(self, values):
+        if "type" not in values:
+            return None
+        type = values["type"]
+
+        if type not in self.types:
+            raise KeyError(f"Incorrect type: {type}")
+        return self.construct_model(self.types[type])({
+            "id": values["id"],
+            "relationships": values.get("relationships"),
+            **values["attributes"]
+        })
 
     def __get_validators__(self):
         yield self.return_type
 
     def return_type(self, values):
-        subclasses = self.item.__subclasses__()
-        types = {
-            i._type: i for i in subclasses
-        }
-
         if "type" not in values:
             return None
         type = values["type"]
 
-        if type not in types:
+        if type not in self.types:
             raise KeyError(f"Incorrect type: {type}")
-        return types[type](
+        return self.types[type](
             id=values["id"],
             relationships=values.get("relationships"),
             **values["attributes"]
@@ -74,8 +214,11 @@ class Keyed:
 
 class KeyedUnion:
     def __class_getitem__(cls, item):
+        keyed = Keyed(item)
+
         class KeyedUnion(BaseModel):
-            __root__: Keyed(item)
+            __root__: keyed
+            __keyed__ = keyed
 
             def __new__(cls, *args, **kwargs):
                 (self := object.__new__(cls)).__init__(*args, **kwargs)
@@ -93,6 +236,26 @@ class KeyedUnion:
             def dict(self):
                 return self.__root__.dict()
 
+            # Decode straight into the keyed type, skipping validation of
+            # this wrapper model, both directly and as a field elsewhere.
+            @classmethod
+            def parse_obj(cls, obj):
+                if not isinstance(obj, dict):
+                    raise TypeError(f"Expected an object, got {obj!r}")
+                return keyed.return_type(obj)
+
+            @classmethod
+            def construct_obj(cls, obj):
+                """
+                Build the keyed type without validation. Only use this
+                with data known to match the schema.
+                """
+                return keyed.construct_type(obj)
+
+            @classmethod
+            def __get_validators__(cls):
+                yield keyed.return_type
+
         return KeyedUnion
 
 
@@ -110,7 +273,7 @@ class TypeOrId:
 
     @classmethod
     def return_type(self, value):
-        from .models import Relationship, Type
+        from .models import Relationship, Type, LazyType
         from uuid import UUID
 
         if isinstance(value, str):
@@ -121,10 +284,10 @@ class TypeOrId:
             else:
                 return value
 
-        if isinstance(value, (Type, BaseModel)):
+        if isinstance(value, (Type, BaseModel, LazyType)):
             if self._type is not None:
                 got_type = (
-                    value.type if isinstance(value, Relationship)
+                    value.type if isinstance(value, (Relationship, LazyType))
                     else value._type
                 )
                 exp_type = self._type._type
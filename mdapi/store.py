@@ -0,0 +1,175 @@
+import os
+import shutil
+import hashlib
+from threading import get_ident
+from typing import Optional, Tuple
+from urllib.parse import urlparse
+
+
+class PageStore:
+    """
+    A content-addressed store of downloaded pages, so a page that turns
+    up again (a re-upload, or a chapter downloaded into another
+    directory) costs neither bandwidth nor disk space.
+
+    Pages are stored once, as ``objects/<digest>`` under ``root``, named
+    by the SHA-256 of their content. Each page is also linked from
+    ``pages/<chapter hash>/<filename>``, the same key MD@H serves it
+    under, so whether a page is stored can be checked from its URL alone
+    with a single ``stat``.
+
+    Pages are materialized into chapter directories as hardlinks to the
+    stored object, falling back to a copy where hardlinks aren't
+    supported (across filesystems, for example). As they're hardlinks,
+    pages should be treated as read-only once downloaded.
+
+    Give a store to the client with its ``page_store`` option to use it
+    for every page download.
+
+    :param root: The directory to keep the store in. It is created if it
+        doesn't exist.
+    """
+
+    #: The size of the blocks files are hashed in
+    BLOCK_SIZE = 1048576  # 1 MB
+
+    def __init__(self, root: str):
+        self.root = root
+        os.makedirs(os.path.join(root, "objects"), exist_ok=True)
+        os.makedirs(os.path.join(root, "pages"), exist_ok=True)
+
+    @staticmethod
+    def key_of(url: str) -> Tuple[str, str]:
+        """
+        The ``(chapter hash, filename)`` a page URL is stored under. Page
+        URLs end in ``/<chapter hash>/<filename>``.
+        """
+        parts = urlparse(url).path.rsplit("/", 2)
+        if len(parts) < 3 or not parts[1] or not parts[2]:
+            raise ValueError(f"Not a page URL: {url}")
+        return parts[1], parts[2]
+
+    def key_path(self, url: str) -> str:
+        return os.path.join(self.root, "pages", *self.key_of(url))
+
+    def object_path(self, digest: str) -> str:
+        return os.path.join(self.root, "objects", digest[:2], digest)
+
+    def __contains__(self, url: str) -> bool:
+        return os.path.exists(self.key_path(url))
+
+    def has_digest(self, digest: str) -> bool:
+        return os.path.exists(self.object_path(digest))
+
+    @classmethod
+    def digest_file(cls, path: str) -> str:
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            while (block := f.read(cls.BLOCK_SIZE)):
+                digest.update(block)
+        return digest.hexdigest()
+
+    @staticmethod
+    def _tmp(path: str) -> str:
+        # Unique per process and thread, so concurrent writers don't clash
+        return f"{path}.{os.getpid()}.{get_ident()}.tmp"
+
+    @classmethod
+    def _link(cls, source: str, dest: str):
+        """
+        Replace ``dest`` with a hardlink to ``source``, or a copy of it.
+        """
+        try:
+            if os.path.samefile(source, dest):
+                # Already linked, perhaps by another thread
+                return
+        except OSError:
+            pass
+
+        tmp = cls._tmp(dest)
+        try:
+            try:
+                os.link(source, tmp)
+            except OSError:
+                shutil.copyfile(source, tmp)
+            os.replace(tmp, dest)
+        except BaseException:
+            try:
+                os.remove(tmp)
+            except OSError:
+                pass
+            raise
+
+    def _add_object(self, path: str, digest: str) -> str:
+        """
+        Make ``path`` the object for ``digest``, unless one is already
+        stored. Either way, ``path`` ends up as the stored object.
+        """
+        obj = self.object_path(digest)
+        os.makedirs(os.path.dirname(obj), exist_ok=True)
+        if os.path.exists(obj):
+            # Stored already, so drop this copy in favour of that one
+            self._link(obj, path)
+        else:
+            self._link(path, obj)
+        return obj
+
+    def add(self, url: str, path: str) -> str:
+        """
+        Store the page downloaded from ``url`` to ``path``. If the same
+        content is already stored, ``path`` is replaced with a link to
+        it.
+
+        :returns: The SHA-256 digest of the page
+        """
+        digest = self.digest_file(path)
+        obj = self._add_object(path, digest)
+        key = self.key_path(url)
+        os.makedirs(os.path.dirname(key), exist_ok=True)
+        self._link(obj, key)
+        return digest
+
+    def add_bytes(self, url: str, data: bytes) -> str:
+        """
+        Store the page downloaded from ``url``.
+
+        :returns: The SHA-256 digest of the page
+        """
+        digest = hashlib.sha256(data).hexdigest()
+        obj = self.object_path(digest)
+        if not os.path.exists(obj):
+            os.makedirs(os.path.dirname(obj), exist_ok=True)
+            tmp = self._tmp(obj)
+            with open(tmp, "wb") as f:
+                f.write(data)
+            os.replace(tmp, obj)
+        key = self.key_path(url)
+        os.makedirs(os.path.dirname(key), exist_ok=True)
+        self._link(obj, key)
+        return digest
+
+    def materialize(self, url: str, path: str) -> Optional[int]:
+        """
+        Link the stored page for ``url`` to ``path``.
+
+        :returns: The size of the page, or ``None`` if it isn't stored
+        """
+        key = self.key_path(url)
+        try:
+            self._link(key, path)
+        except FileNotFoundError:
+            return None
+        return os.path.getsize(path)
+
+    def read(self, url: str) -> Optional[bytes]:
+        """
+        The stored page for ``url``, or ``None`` if it isn't stored.
+        """
+        try:
+            with open(self.key_path(url), "rb") as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+
+
+__all__ = ("PageStore", )
@@ -1,19 +1,51 @@
 from enum import Enum
 import functools
+import inspect
 import base64
 import json
 import time
-from typing import Generic, Iterable, List, TypeVar
-from queue import Queue, Empty
-from threading import Thread
+import re
+from collections import deque
+from datetime import datetime, timezone
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import (
+    Callable, Generic, Iterable, Iterator, List, Optional, TypeVar, Union,
+    get_args, get_origin
+)
+from uuid import UUID
+from queue import Queue, Empty, Full
+from threading import Lock, Thread
 
+from pydantic import validate_arguments as _validate_arguments
 from pydantic.main import BaseModel
 
-from .schema import Type, UnsetValue
+from .schema import UnsetValue, SortOrder, LazyType, TypeOrId
+from .schema.models import BaseType
+
+
+_UUID = re.compile(r"[0-9a-fA-F]{8}(?:-[0-9a-fA-F]{4}){3}-[0-9a-fA-F]{12}")
 
 
-def _type_id(type):
-    raise NotImplementedError
+def _type_id(type, expected=TypeOrId):
+    """
+    A fast equivalent to validating ``type`` as ``expected``, a
+    `mdapi.schema.TypeOrId`. Strings in the usual UUID form are only
+    pattern matched, so anything else, such as a path, never reaches a
+    URL.
+    """
+    if type.__class__ is str and _UUID.fullmatch(type):
+        return type
+    if isinstance(type, UUID):
+        return str(type)
+    if isinstance(type, BaseType):
+        if expected._type is not None and (
+            type._type != expected._type._type
+        ):
+            raise ValueError(
+                f"Expected {expected._type._type}, got {type._type}"
+            )
+        return type.id
+    return expected.return_type(type)
 
 
 def _get_token_expires(jwt):
@@ -28,14 +60,114 @@ def _is_token_expired(jwt):
 
 def shadows(hoc):
     def decorator(func):
+        code = func.__code__
+        names = code.co_varnames[:code.co_argcount]
+
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
-            kwargs.update(zip(func.__code__.co_varnames, args))
+            kwargs.update(zip(names, args))
             return hoc(**kwargs)
         return wrapper
     return decorator
 
 
+def _materialize(value):
+    if isinstance(value, LazyType):
+        return value.materialize()
+    return value
+
+
+def _compile_coercion(
+    annotation, models_only: bool = False
+) -> Optional[Callable]:
+    if isinstance(annotation, type):
+        if issubclass(annotation, TypeOrId) and not models_only:
+            return functools.partial(_type_id, expected=annotation)
+        if issubclass(annotation, BaseType):
+            # pydantic can't validate a LazyType as a model
+            return _materialize
+        return None
+
+    origin, args = get_origin(annotation), get_args(annotation)
+    if origin is Union:
+        # Optional[...] and CanUnset[...]; None and UnsetValue pass through
+        coercions = [
+            _compile_coercion(i, models_only) for i in args
+            if i is not type(None) and i is not UnsetValue
+        ]
+        if len(coercions) == 1:
+            return coercions[0]
+    elif origin is list and args:
+        item = _compile_coercion(args[0], models_only)
+        if item is not None:
+            return lambda value: [item(i) for i in value]
+    return None
+
+
+def _coerce_arguments(args, kwargs, positional, coercions):
+    args = [
+        arg if coerce is None or arg is None else coerce(arg)
+        for arg, coerce in zip(args, positional)
+    ] + list(args[len(positional):])
+    for name in coercions.keys() & kwargs.keys():
+        if kwargs[name] is not None:
+            kwargs[name] = coercions[name](kwargs[name])
+    return args
+
+
+def validate_arguments(func):
+    """
+    Validate a method's arguments with pydantic's ``validate_arguments``.
+
+    When the client's ``validate_arguments`` option is turned off,
+    validation is skipped. Only arguments that must be converted for the
+    request to be built (``TypeOrId`` objects to their IDs) are
+    converted, using converters compiled once from the signature.
+
+    Either way, `mdapi.schema.LazyType` views passed for model-typed
+    parameters are materialized first.
+    """
+    validated = _validate_arguments(func)
+
+    parameters = list(inspect.signature(func).parameters.values())[1:]
+    positional_names = [
+        i.name for i in parameters
+        if i.kind in (i.POSITIONAL_ONLY, i.POSITIONAL_OR_KEYWORD)
+    ]
+    coercions = {
+        i.name: coerce for i in parameters
+        if (coerce := _compile_coercion(i.annotation)) is not None
+    }
+    positional = [coercions.get(i) for i in positional_names]
+    materializers = {
+        i.name: coerce for i in parameters
+        if (coerce := _compile_coercion(i.annotation, True)) is not None
+    }
+    materialize_positional = [materializers.get(i) for i in positional_names]
+    var_positional = any(i.kind == i.VAR_POSITIONAL for i in parameters)
+
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        if self.api.validate_arguments:
+            if materializers:
+                args = _coerce_arguments(
+                    args, kwargs, materialize_positional, materializers
+                )
+            return validated(self, *args, **kwargs)
+
+        if len(args) > len(positional) and not var_positional:
+            # Counting self, as pydantic does
+            raise TypeError(
+                f"{len(positional) + 1} positional arguments expected but "
+                f"{len(args) + 1} given"
+            )
+        if coercions:
+            args = _coerce_arguments(args, kwargs, positional, coercions)
+        return func(self, *args, **kwargs)
+
+    return wrapper
+
+
 def params_to_query(kwargs):
     query = {}
     for k, v in kwargs.items():
@@ -80,12 +212,15 @@ class Worker:
         pass
     KILL = Kill()
 
-    def __init__(self, worker, long_lived=False, num_workers=3):
+    def __init__(self, worker, long_lived=False, num_workers=3, maxsize=0):
         self._worker = worker
         self._long_lived = long_lived
         self._num_workers = num_workers
-        self._queue = Queue()
+        # With a ``maxsize``, the oldest job is dropped to make room
+        self._queue = Queue(maxsize)
         self._killed = False
+        self._errors = []
+        self.dropped = 0
 
     @property
     def killed(self):
@@ -106,6 +241,10 @@ class Worker:
 
             try:
                 self._worker(job)
+            except Exception as e:
+                # Don't let one job take the thread, and the jobs still
+                # queued for it, down with it. It's raised from join
+                self._errors.append(e)
             finally:
                 self._queue.task_done()
 
@@ -128,20 +267,126 @@ class Worker:
     def enqueue(self, job):
         if self._killed:
             return
-        self._queue.put(job)
-
-    def join(self):
-        self._queue.join()
+        while True:
+            try:
+                self._queue.put_nowait(job)
+                return
+            except Full:
+                pass
+            try:
+                self._queue.get_nowait()
+            except Empty:
+                continue
+            self._queue.task_done()
+            self.dropped += 1
+
+    def join(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait for every queued job to finish. If any job raised, the first
+        exception since the last call is raised once they have.
+
+        :returns: ``False`` if ``timeout`` ran out first
+        """
+        if timeout is None:
+            self._queue.join()
+        else:
+            deadline = time.monotonic() + timeout
+            with self._queue.all_tasks_done:
+                while self._queue.unfinished_tasks:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        return False
+                    self._queue.all_tasks_done.wait(remaining)
+
+        if self._errors:
+            error, self._errors = self._errors[0], []
+            raise error
+        return True
+
+
+class TTLCache:
+    """
+    A small thread-safe mapping whose entries expire ``ttl`` seconds
+    after they're set. Expired entries are dropped as they're found.
+    """
+
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self._data = {}
+        self._lock = Lock()
+
+    def get(self, key, default=None):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+            if entry[0] <= time.monotonic():
+                del self._data[key]
+                return default
+            return entry[1]
+
+    def set(self, key, value, ttl: Optional[float] = None):
+        expires = time.monotonic() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            self._data[key] = (expires, value)
+
+    def pop(self, key, default=None):
+        with self._lock:
+            entry = self._data.pop(key, None)
+        return default if entry is None else entry[1]
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self):
+        return len(self._data)
 
 
 T = TypeVar("T")
 
 
+def _page_results(results) -> deque:
+    """
+    Unwrap the results of a paginated response into a queue of objects
+    ready for parsing, attaching each result's relationships to it in
+    place.
+    """
+    page = deque()
+    for result in results.get("results", ()):
+        if "relationships" in result:
+            result["data"]["relationships"] = result["relationships"]
+        page.append(result.get("data", result))
+    return page
+
+
 class PaginatedRequest(Generic[T]):
+    """
+    Lazily iterates over every result of a paginated endpoint.
+
+    If ``prefetch`` is set (it defaults to the client's ``prefetch``
+    option), up to that many following pages are requested in background
+    threads while the current page is consumed. Call `close` or use the
+    request as a context manager to discard outstanding prefetches if
+    iteration is abandoned early.
+
+    Once the first page is known, `fetch_all` and `iter_unordered` can
+    instead request every remaining page concurrently.
+
+    If ``lazy`` is set (it defaults to the client's ``lazy_results``
+    option), results are yielded as `mdapi.schema.LazyType` views that
+    only parse the full model when a field other than ``id``, ``type``,
+    ``attributes`` or ``relationships`` is accessed.
+
+    If ``trusted`` is set (it defaults to the client's
+    ``trusted_responses`` option), models are built without validation.
+    """
+
     _LIMIT = 10
 
     def __init__(
-        self, api, *args, limit=None, offset=None, params=None, **kwargs
+        self, api, *args, limit=None, offset=None, params=None,
+        prefetch=None, lazy=None, trusted=None, **kwargs
     ):
         self.total = None
         self.offset = offset if offset is not None else 0
@@ -154,19 +399,82 @@ class PaginatedRequest(Generic[T]):
         self._args = args
         self._kwargs = kwargs
 
+        self.prefetch = api.prefetch if prefetch is None else prefetch
+        self.lazy = api.lazy_results if lazy is None else lazy
+        self.trusted = api.trusted_responses if trusted is None else trusted
+        self._pending = deque()
+        self._next_offset = None
+        self._executor = None
+        self._step = 0
+
         self._ensure_populated()
 
-    def _get_next(self) -> None:
-        results = self._api._make_request(*self._args, **self._kwargs, params={
+    def _request(self, offset):
+        return self._api._make_request(*self._args, **self._kwargs, params={
             **self._params,
-            "offset": self.offset,
+            "offset": offset,
             "limit": self._limit
         })
+
+    def _schedule_prefetch(self, step) -> None:
+        if self.prefetch <= 0 or step <= 0:
+            return
+
+        if self._next_offset is None or self._next_offset < self.offset:
+            self._next_offset = self.offset
+
+        while (
+            len(self._pending) < self.prefetch
+            and self._next_offset < self.total
+        ):
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.prefetch,
+                    thread_name_prefix="mdapi-prefetch"
+                )
+            self._pending.append(
+                self._executor.submit(self._request, self._next_offset)
+            )
+            self._next_offset += step
+
+    def _get_next(self) -> None:
+        if self._pending:
+            results = self._pending.popleft().result()
+        else:
+            results = self._request(self.offset)
+
         self.total = results.get("total", 0)
-        self.offset += results.get("limit", 0)
-        self._results = results.get("results", [])
+        self._step = results.get("limit", 0)
+        self.offset += self._step
+        self._results = _page_results(results)
         self.has_more = self.offset < self.total
 
+        if self.has_more:
+            self._schedule_prefetch(self._step)
+        else:
+            self.close()
+
+    def close(self) -> None:
+        """
+        Cancel any outstanding prefetches and release their threads.
+        """
+        while self._pending:
+            self._pending.pop().cancel()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __del__(self):
+        # Interpreter shutdown may have already torn down our state
+        if getattr(self, "_executor", None) is not None:
+            self.close()
+
     def __iter__(self) -> Iterable[T]:
         return self
 
@@ -181,28 +489,235 @@ class PaginatedRequest(Generic[T]):
         return self.total
 
     def __next__(self) -> T:
-        self._ensure_populated()
+        if not self._results:
+            self._ensure_populated()
 
-        if len(self._results) == 0:
-            raise StopIteration
+            if not self._results:
+                raise StopIteration
 
-        result = self._results.pop(0)
-        if "relationships" in result:
-            result["data"]["relationships"] = result["relationships"]
-        result = result.get("data", result)
-        return Type.parse_obj(result)
+        return self._parse(self._results.popleft())
+
+    def _parse(self, result) -> T:
+        if self.lazy:
+            return LazyType(result, self._parse_model)
+        return self._parse_model(result)
+
+    def _parse_model(self, result) -> T:
+        return self._api._parse(result, self.trusted)
 
     def next_page(self) -> List[T]:
         try:
             self._ensure_populated()
         except StopIteration:
             return []
-        res = self._results
-        self._results = []
-        res = [i.get("data", i) for i in res]
-        return [Type.parse_obj(i) for i in res]
+        res, self._results = self._results, deque()
+        return [self._parse(i) for i in res]
+
+    def _iter_pages(self, concurrency: int, ordered: bool) -> Iterator[list]:
+        """
+        Yield the unparsed results of every remaining page, fetching them
+        ``concurrency`` at a time. Requests are spaced out by the
+        client's `mdapi.ratelimit.RateLimiter`.
+        """
+        if self._results:
+            yield self._results
+            self._results = deque()
+
+        # Pages already being prefetched are in order, so come first
+        pending, self._pending = self._pending, deque()
+        while pending:
+            yield _page_results(pending.popleft().result())
+
+        start = self.offset if self._next_offset is None else max(
+            self.offset, self._next_offset
+        )
+        offsets = range(start, self.total or 0, self._step or self._limit)
+
+        self.offset = self._next_offset = max(self.total or 0, self.offset)
+        self.has_more = False
+        self.close()
+
+        if not offsets:
+            return
+
+        def fetch(offset):
+            return _page_results(self._request(offset))
+
+        with ThreadPoolExecutor(
+            max_workers=max(1, concurrency),
+            thread_name_prefix="mdapi-paginate"
+        ) as executor:
+            futures = [
+                executor.submit(fetch, offset) for offset in offsets
+            ]
+            try:
+                for future in (futures if ordered else as_completed(futures)):
+                    yield future.result()
+            finally:
+                for future in futures:
+                    future.cancel()
+
+    def iter_unordered(self, concurrency: int = 4) -> Iterator[T]:
+        """
+        Iterate over every remaining result, requesting all remaining
+        pages concurrently. Pages are yielded as soon as they arrive, so
+        results are not in order.
+
+        :param concurrency: The maximum number of requests in flight
+
+        :returns: An iterator over every remaining result
+        """
+        for page in self._iter_pages(concurrency, ordered=False):
+            for result in page:
+                yield self._parse(result)
+
+    def fetch_all(self, concurrency: int = 4) -> List[T]:
+        """
+        Fetch every remaining result, requesting all remaining pages
+        concurrently.
+
+        :param concurrency: The maximum number of requests in flight
+
+        :returns: Every remaining result, in order
+        """
+        return [
+            self._parse(result)
+            for page in self._iter_pages(concurrency, ordered=True)
+            for result in page
+        ]
+
+
+def _format_timestamp(value) -> str:
+    """
+    Format a datetime, or an ISO 8601 string, the way the ``*Since``
+    search parameters expect it.
+    """
+    if isinstance(value, datetime):
+        if value.tzinfo is not None:
+            value = value.astimezone(timezone.utc)
+        return value.strftime("%Y-%m-%dT%H:%M:%S")
+    return str(value)[:19]
+
+
+class CursorPaginatedRequest(PaginatedRequest[T]):
+    """
+    Iterates over a paginated endpoint by advancing a timestamp
+    watermark rather than an offset. Results are ordered by ``cursor``
+    ascending, and each page is requested with ``<cursor>Since`` set to
+    the newest timestamp seen so far, so requests stay cheap however deep
+    into the results they are, and the API's offset cap never applies.
+
+    Results sharing the watermark's timestamp are de-duplicated by id.
+    As each page depends on the last, prefetching is unavailable and
+    `fetch_all` and `iter_unordered` fetch pages one at a time.
+
+    ``order_type`` is the endpoint's sort order model. A ``ValueError`` is
+    raised if ``params`` asks for an order other than ``cursor``
+    ascending, or if ``offset`` is set.
+    """
+
+    def __init__(
+        self, api, *args, cursor, order_type, limit=None, offset=None,
+        params=None, **kwargs
+    ):
+        params, since = self._cursor_params(
+            cursor, order_type, offset, params
+        )
+
+        self.cursor = cursor
+        self.watermark = None if since is None else _format_timestamp(since)
+        # IDs of the results seen with the watermark's timestamp
+        self._seen = set()
+
+        super().__init__(
+            api, *args, limit=limit, offset=0, params=params, prefetch=0,
+            **kwargs
+        )
+
+    @staticmethod
+    def _cursor_params(cursor, order_type, offset, params):
+        """
+        The parameters to paginate by ``cursor`` with, and the timestamp
+        to start after, if any.
+        """
+        if offset:
+            raise ValueError(
+                f"offset can't be used when paginating by {cursor}"
+            )
+        params = dict(params or {})
+        order = params.get("order")
+        if isinstance(order, BaseModel):
+            order = order.dict()
+        order = {
+            k: SortOrder(v) for k, v in (order or {}).items() if v is not None
+        }
+        if order and order != {cursor: SortOrder.asc}:
+            raise ValueError(
+                f"Paginating by {cursor} orders by it ascending, not by "
+                f"{order}"
+            )
+        params["order"] = order_type(**{cursor: SortOrder.asc})
+        return params, params.pop(f"{cursor}Since", None)
+
+    def _request(self, offset):
+        params = {**self._params, "offset": offset, "limit": self._limit}
+        if self.watermark is not None:
+            params[f"{self.cursor}Since"] = self.watermark
+        return self._api._make_request(
+            *self._args, **self._kwargs, params=params
+        )
+
+    def _advance(self, page) -> deque:
+        watermark = self.watermark
+        fresh = deque()
+        for data in page:
+            if data["id"] in self._seen:
+                continue
+            fresh.append(data)
+
+            timestamp = _format_timestamp(data["attributes"][self.cursor])
+            if timestamp != self.watermark:
+                self.watermark = timestamp
+                self._seen = set()
+            self._seen.add(data["id"])
+
+        if self.watermark != watermark:
+            self.offset = 0
+        else:
+            # More results share this timestamp than fit in a page, so
+            # we have to step over the ones we've already seen.
+            self.offset += len(page)
+        return fresh
+
+    def _get_next(self) -> None:
+        while True:
+            results = self._request(self.offset)
+            page = _page_results(results)
+            if self.total is None:
+                self.total = results.get("total", 0)
+
+            self.has_more = results.get("total", 0) > self.offset + len(page)
+            self._results = self._advance(page)
+            if self._results or not self.has_more:
+                return
+
+    def _ensure_populated(self) -> None:
+        if self._results is None or len(self._results) == 0:
+            if self._results is not None and not self.has_more:
+                raise StopIteration
+            self._get_next()
+
+    def _iter_pages(self, concurrency: int, ordered: bool) -> Iterator[list]:
+        while True:
+            try:
+                self._ensure_populated()
+            except StopIteration:
+                return
+            page, self._results = self._results, deque()
+            yield page
 
 
 __all__ = (
-    "_type_id", "_get_token_expires", "_is_token_expired", "PaginatedRequest"
+    "_type_id", "_get_token_expires", "_is_token_expired", "PaginatedRequest",
+    "CursorPaginatedRequest", "TTLCache", "validate_arguments"
 )
@@ -25,7 +25,10 @@ setuptools.setup(
     scripts=[
         "scripts/mdex.py"
     ],
-    packages=["mdapi", "mdapi.api"],
+    packages=["mdapi", "mdapi.api", "mdapi.aio", "mdapi.aio.api"],
     python_requires=">=3.8",
-    install_requires=open("requirements.txt").read().split("\n")
+    install_requires=open("requirements.txt").read().split("\n"),
+    extras_require={
+        "async": ["aiohttp"],
+    },
 )
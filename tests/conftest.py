@@ -0,0 +1,19 @@
+import pytest
+
+from mdapi import MdAPI
+from fakes import FakeServer
+
+
+@pytest.fixture
+def server():
+    server = FakeServer().start()
+    yield server
+    server.stop()
+
+
+@pytest.fixture
+def md(server):
+    md = MdAPI(rate_limiter=False)
+    md.api.BASE = server.base
+    yield md
+    md.close()
@@ -0,0 +1,190 @@
+"""
+A local stand-in for the MangaDex API and MD@H nodes. Each test routes
+the paths it needs to a function building the response.
+"""
+import json
+import threading
+from collections import namedtuple
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+
+Request = namedtuple("Request", "method path query headers body")
+
+PAGE = bytes(range(256)) * 64
+TIMESTAMP = "2021-01-01T00:00:00+00:00"
+
+
+def uuid(n: int) -> str:
+    return f"00000000-0000-0000-0000-{n:012d}"
+
+
+def manga(n: int, **attributes) -> dict:
+    return {
+        "id": uuid(n), "type": "manga",
+        "attributes": {
+            "title": {"en": f"Manga {n}"}, "altTitles": [],
+            "description": {"en": ""}, "isLocked": False,
+            "originalLanguage": "ja", "tags": [], "links": {},
+            "status": "ongoing", "year": 2000, "contentRating": "safe",
+            "publicationDemographic": "shounen", "createdAt": TIMESTAMP,
+            "updatedAt": TIMESTAMP, "version": 1, **attributes
+        },
+        "relationships": [],
+    }
+
+
+def chapter(n: int, pages: int = 3, **attributes) -> dict:
+    return {
+        "id": uuid(n), "type": "chapter",
+        "attributes": {
+            "title": f"Chapter {n}", "volume": "1", "chapter": str(n),
+            "translatedLanguage": "en", "hash": f"hash{n}",
+            "data": [f"{i}.png" for i in range(pages)], "dataSaver": [],
+            "createdAt": TIMESTAMP, "updatedAt": TIMESTAMP,
+            "publishAt": TIMESTAMP, **attributes
+        },
+        "relationships": [{"id": uuid(0), "type": "manga"}],
+    }
+
+
+def author(n: int, **attributes) -> dict:
+    return {
+        "id": uuid(n), "type": "author",
+        "attributes": {
+            "name": f"Author {n}", "biography": [], "imageUrl": None,
+            "createdAt": TIMESTAMP, "updatedAt": TIMESTAMP, **attributes
+        },
+        "relationships": [],
+    }
+
+
+def entity(obj: dict) -> dict:
+    """
+    The response for a single object.
+    """
+    data = {k: v for k, v in obj.items() if k != "relationships"}
+    return {
+        "result": "ok", "data": data,
+        "relationships": obj.get("relationships", [])
+    }
+
+
+def results(objects: list, query: dict) -> dict:
+    """
+    The page of ``objects`` a paginated request for ``query`` asked for.
+    """
+    offset = int(query.get("offset", ["0"])[0])
+    limit = int(query.get("limit", ["10"])[0])
+    return {
+        "results": [entity(i) for i in objects[offset:offset + limit]],
+        "limit": limit, "offset": offset, "total": len(objects),
+    }
+
+
+def page(request: Request, body: bytes = PAGE):
+    """
+    Serve a page image the way an MD@H node does, honouring ``Range``.
+    """
+    range_ = request.headers.get("Range")
+    if range_ is None:
+        return 200, body, {"Content-Type": "image/png"}
+    start = int(range_[len("bytes="):-1])
+    if start >= len(body):
+        return 416, b"", {"Content-Range": f"bytes */{len(body)}"}
+    return 206, body[start:], {
+        "Content-Type": "image/png",
+        "Content-Range": f"bytes {start}-{len(body) - 1}/{len(body)}",
+    }
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def _respond(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        url = urlparse(self.path)
+        request = Request(
+            self.command, url.path, parse_qs(url.query), dict(self.headers),
+            self.rfile.read(length) if length else None
+        )
+        self.server.requests.append(request)
+
+        for method, prefix, respond in reversed(self.server.routes):
+            if method == self.command and url.path.startswith(prefix):
+                response = respond(request)
+                break
+        else:
+            response = 404, {"result": "error", "errors": []}
+
+        if isinstance(response, dict):
+            response = 200, response
+        code, body, headers = (*response, {})[:3]
+        headers = dict(headers)
+        if isinstance(body, (dict, list)):
+            body = json.dumps(body).encode()
+            headers = {"Content-Type": "application/json", **headers}
+
+        # A longer Content-Length than the body simulates a dropped
+        # connection
+        length = int(headers.pop("Content-Length", len(body)))
+        self.send_response(code)
+        self.send_header("Content-Length", str(length))
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+        if length != len(body):
+            self.close_connection = True
+
+    do_GET = do_POST = do_PUT = do_DELETE = _respond
+
+
+class FakeServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), Handler)
+        self.base = f"http://127.0.0.1:{self.server_port}"
+        self.routes = []
+        self.requests = []
+
+    def route(self, method: str, prefix: str, respond):
+        """
+        Answer ``method`` requests for paths starting with ``prefix``
+        with ``respond(request)``. Later routes take priority.
+        """
+        self.routes.append((method, prefix, respond))
+
+    def serve_chapters(self, *chapters: dict, body: bytes = PAGE):
+        """
+        Serve ``chapters``, an MD@H node for them, and their pages.
+        """
+        self.route(
+            "GET", "/chapter", lambda r: results(list(chapters), r.query)
+        )
+        for obj in chapters:
+            self.route(
+                "GET", f"/chapter/{obj['id']}", lambda r, obj=obj: entity(obj)
+            )
+        self.route("GET", "/at-home/server/", lambda r: {
+            "baseUrl": self.base + "/node"
+        })
+        self.route("GET", "/node/", lambda r: page(r, body))
+
+    def requests_to(self, prefix: str, method: str = "GET") -> list:
+        return [
+            i for i in self.requests
+            if i.method == method and i.path.startswith(prefix)
+        ]
+
+    def start(self):
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
@@ -0,0 +1,141 @@
+import asyncio
+import zipfile
+
+import pytest
+
+from mdapi.aio import AsyncMdAPI
+
+from fakes import PAGE, chapter, page
+
+
+def run(server, test):
+    async def main():
+        async with AsyncMdAPI(rate_limiter=False) as md:
+            md.api.BASE = server.base
+            return await test(md)
+    return asyncio.run(main())
+
+
+def test_download_chapter(server, tmp_path):
+    server.serve_chapters(chapter(1, pages=4))
+
+    async def test(md):
+        obj = await md.chapter.get(chapter(1)["id"])
+        first = await md.chapter.download_chapter(
+            obj, str(tmp_path), report_mdah=False
+        )
+        again = await md.chapter.download_chapter(
+            obj, str(tmp_path), report_mdah=False
+        )
+        return first, again
+
+    first, again = run(server, test)
+    assert first.ok and not first.skipped
+    assert again.skipped
+    for n in range(1, 5):
+        assert (tmp_path / f"{n:03d}.png").read_bytes() == PAGE
+    # The second download was answered from the manifest alone
+    assert len(server.requests_to("/node/")) == 4
+
+
+@pytest.mark.parametrize("part", [
+    PAGE[:1000],
+    # A leftover longer than the page is started over
+    b"\0" * (len(PAGE) + 10),
+])
+def test_download_resumes_part_file(server, tmp_path, part):
+    server.serve_chapters(chapter(1, pages=1))
+    (tmp_path / "001.png.part").write_bytes(part)
+
+    async def test(md):
+        obj = await md.chapter.get(chapter(1)["id"])
+        return await md.chapter.download_chapter(
+            obj, str(tmp_path), report_mdah=False, incremental=False
+        )
+
+    assert run(server, test).ok
+    assert (tmp_path / "001.png").read_bytes() == PAGE
+    assert not (tmp_path / "001.png.part").exists()
+    assert server.requests_to("/node/")[0].headers["Range"] \
+        == f"bytes={len(part)}-"
+
+
+def test_download_restarts_when_range_is_ignored(server, tmp_path):
+    server.serve_chapters(chapter(1, pages=1))
+    server.route("GET", "/node/", lambda r: (200, PAGE))
+    (tmp_path / "001.png.part").write_bytes(b"\xff" * 1000)
+
+    async def test(md):
+        obj = await md.chapter.get(chapter(1)["id"])
+        return await md.chapter.download_chapter(
+            obj, str(tmp_path), report_mdah=False, incremental=False
+        )
+
+    assert run(server, test).ok
+    assert (tmp_path / "001.png").read_bytes() == PAGE
+
+
+def test_download_page_to_path_resumes_after_a_drop(server, tmp_path):
+    server.serve_chapters(chapter(1, pages=1))
+    attempts = []
+
+    def dropping(request):
+        attempts.append(request.headers.get("Range"))
+        if len(attempts) == 1:
+            # Claims the whole page, but only sends the start of it
+            return 200, PAGE[:5000], {"Content-Length": str(len(PAGE))}
+        return page(request)
+
+    server.route("GET", "/node/", dropping)
+    path = tmp_path / "page.png"
+
+    async def test(md):
+        url = f"{server.base}/node/data/hash1/0.png"
+        return [
+            chunk async for chunk, _ in md.chapter.download_page_to_path(
+                url, str(path), report_mdah=False
+            )
+        ]
+
+    chunks = run(server, test)
+    assert b"".join(chunks) == PAGE
+    assert path.read_bytes() == PAGE
+    assert attempts[1] is not None and attempts[1].startswith("bytes=")
+
+
+def test_download_chapter_archive(server, tmp_path):
+    server.serve_chapters(chapter(1, pages=3))
+    path = tmp_path / "chapter.cbz"
+
+    async def test(md):
+        obj = await md.chapter.get(chapter(1)["id"])
+        return await md.chapter.download_chapter_archive(
+            obj, str(path), report_mdah=False, info=False
+        )
+
+    assert run(server, test).ok
+    with zipfile.ZipFile(path) as archive:
+        assert archive.namelist() == ["001.png", "002.png", "003.png"]
+        assert archive.read("002.png") == PAGE
+
+
+def test_failing_progress_callback_is_raised_once_finished(
+    server, tmp_path
+):
+    server.serve_chapters(chapter(1, pages=3))
+    done = []
+
+    def progress(tracker):
+        done.append(tracker.pages_done)
+        raise RuntimeError("progress")
+
+    async def test(md):
+        obj = await md.chapter.get(chapter(1)["id"])
+        await md.chapter.download_chapter(
+            obj, str(tmp_path), report_mdah=False, progress=progress
+        )
+
+    with pytest.raises(RuntimeError):
+        run(server, test)
+    # Raised only once every page had finished
+    assert max(done) == 3
@@ -0,0 +1,83 @@
+import threading
+import zipfile
+from xml.etree import ElementTree
+
+import pytest
+
+from mdapi import MdAPI
+from mdapi.archive import COMIC_INFO_NAME, CbzWriter
+from mdapi.nodes import FailoverPolicy
+
+from fakes import PAGE, chapter, entity, manga, uuid
+
+
+def test_writer_keeps_page_order(tmp_path):
+    path = tmp_path / "chapter.cbz"
+    with CbzWriter(str(path), info=b"<ComicInfo/>") as writer:
+        threads = [
+            threading.Thread(
+                target=writer.add, args=(n, f"{n + 1:03d}.png", bytes([n]))
+            )
+            for n in (4, 2, 0, 3)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        writer.skip(1)
+        assert not path.exists()
+
+    with zipfile.ZipFile(path) as archive:
+        assert archive.namelist() == [
+            "001.png", "003.png", "004.png", "005.png", COMIC_INFO_NAME
+        ]
+        assert archive.read("004.png") == bytes([3])
+        assert {i.compress_type for i in archive.infolist()} \
+            == {zipfile.ZIP_STORED}
+    assert writer.pages == 4
+    assert not (tmp_path / "chapter.cbz.part").exists()
+
+
+def test_writer_skips_ahead_of_held_pages(tmp_path):
+    path = tmp_path / "chapter.cbz"
+    with CbzWriter(str(path)) as writer:
+        writer.skip(1)
+        writer.add(2, "003.png", b"3")
+        writer.add(0, "001.png", b"1")
+    with zipfile.ZipFile(path) as archive:
+        assert archive.namelist() == ["001.png", "003.png"]
+
+
+def test_writer_aborts_on_error(tmp_path):
+    path = tmp_path / "chapter.cbz"
+    with pytest.raises(RuntimeError):
+        with CbzWriter(str(path)) as writer:
+            writer.add(0, "001.png", PAGE)
+            raise RuntimeError
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_download_chapter_archive(server, tmp_path):
+    md = MdAPI(rate_limiter=False, failover=FailoverPolicy(retries=0))
+    md.api.BASE = server.base
+    server.serve_chapters(chapter(1, pages=4))
+    server.route("GET", f"/manga/{uuid(0)}", lambda r: entity(manga(0)))
+    server.route("GET", "/node/data/hash1/1.png", lambda r: (500, b"no"))
+    path = tmp_path / "out" / "chapter.cbz"
+
+    result = md.chapter.download_chapter_archive(
+        md.chapter.get(uuid(1)), str(path), report_mdah=False
+    )
+    assert [i.ok for i in result.pages] == [True, False, True, True]
+
+    with zipfile.ZipFile(path) as archive:
+        assert archive.namelist() == [
+            "001.png", "003.png", "004.png", COMIC_INFO_NAME
+        ]
+        assert archive.read("003.png") == PAGE
+        info = ElementTree.fromstring(archive.read(COMIC_INFO_NAME))
+    assert info.find("Title").text == "Chapter 1"
+    assert info.find("Number").text == "1"
+    assert info.find("PageCount").text == "3"
+    assert info.find("Manga").text == "YesAndRightToLeft"
+    assert info.find("Web").text.endswith(f"/chapter/{uuid(1)}")
@@ -0,0 +1,31 @@
+import uuid as uuid_
+
+import pytest
+
+from mdapi import MdAPI
+
+from fakes import entity, manga, uuid
+
+
+@pytest.fixture
+def unvalidated(server):
+    md = MdAPI(rate_limiter=False, validate_arguments=False)
+    md.api.BASE = server.base
+    yield md
+    md.close()
+
+
+@pytest.mark.parametrize("id_", ["../user/me", uuid(1) + "/x", ""])
+def test_unvalidated_ids_must_be_uuids(unvalidated, server, id_):
+    with pytest.raises(ValueError):
+        unvalidated.manga.get(id_)
+    assert server.requests == []
+
+
+@pytest.mark.parametrize("id_", [
+    uuid(1), uuid(1).upper(), uuid_.UUID(uuid(1))
+])
+def test_unvalidated_ids(unvalidated, server, id_):
+    server.route("GET", "/manga/", lambda r: entity(manga(1)))
+    assert unvalidated.manga.get(id_).id == uuid(1)
+    assert server.requests[0].path.lower() == f"/manga/{uuid(1)}"
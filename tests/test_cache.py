@@ -0,0 +1,72 @@
+import pytest
+
+from mdapi import MdAPI
+from mdapi.cache import CacheBackend, CacheEntry, MemoryCache, ResponseCache
+
+from fakes import entity, manga, uuid
+
+LAST_MODIFIED = "Fri, 01 Jan 2021 00:00:00 GMT"
+
+
+@pytest.mark.parametrize("validator, conditional", [
+    ("ETag", "If-None-Match"),
+    ("Last-Modified", "If-Modified-Since"),
+])
+def test_response_cache_revalidates(server, validator, conditional):
+    value = '"v1"' if validator == "ETag" else LAST_MODIFIED
+
+    def respond(request):
+        if request.headers.get(conditional) == value:
+            return 304, b"", {validator: value}
+        return 200, entity(manga(1)), {validator: value}
+
+    server.route("GET", f"/manga/{uuid(1)}", respond)
+    md = MdAPI(rate_limiter=False, response_cache=ResponseCache())
+    md.api.BASE = server.base
+
+    first = md.manga.get(uuid(1))
+    second = md.manga.get(uuid(1))
+    assert second.title.text == first.title.text == "Manga 1"
+
+    requests = server.requests_to("/manga/")
+    assert len(requests) == 2
+    assert conditional not in requests[0].headers
+    assert requests[1].headers[conditional] == value
+    assert md.api.metrics.cache_misses == 1
+    assert md.api.metrics.cache_hits == 1
+
+
+def test_response_cache_skips_unvalidated_responses(server):
+    server.route("GET", f"/manga/{uuid(1)}", lambda r: entity(manga(1)))
+    md = MdAPI(rate_limiter=False, response_cache=ResponseCache())
+    md.api.BASE = server.base
+
+    md.manga.get(uuid(1))
+    md.manga.get(uuid(1))
+    assert len(md.api.response_cache.backend) == 0
+    assert not any(
+        "If-None-Match" in i.headers for i in server.requests_to("/manga/")
+    )
+
+
+def test_memory_cache_evicts_least_recently_used():
+    cache = MemoryCache(maxsize=2)
+    cache.set("a", CacheEntry(b"a"))
+    cache.set("b", CacheEntry(b"b"))
+    # Reading "a" makes "b" the least recently used
+    assert cache.get("a").body == b"a"
+    cache.set("c", CacheEntry(b"c"))
+
+    assert len(cache) == 2
+    assert cache.get("b") is None
+    assert cache.get("a").body == b"a"
+    assert cache.get("c").body == b"c"
+
+
+def test_cache_backend_is_abstract():
+    class Partial(CacheBackend):
+        def get(self, key):
+            return None
+
+    with pytest.raises(TypeError):
+        Partial()
@@ -0,0 +1,76 @@
+import threading
+
+import pytest
+
+from mdapi import MdAPI
+from mdapi.exceptions import InvalidStatusCode
+from mdapi.nodes import FailoverPolicy
+from mdapi.util import Worker
+
+from fakes import PAGE, chapter, page
+
+
+def test_downloads_pages_concurrently(md, server, tmp_path):
+    server.serve_chapters(chapter(1, pages=6))
+    in_flight = peak = 0
+    lock = threading.Lock()
+    gate = threading.Barrier(3, timeout=5)
+
+    def slow_page(request):
+        nonlocal in_flight, peak
+        with lock:
+            in_flight += 1
+            peak = max(peak, in_flight)
+        try:
+            gate.wait()
+        except threading.BrokenBarrierError:
+            pass
+        with lock:
+            in_flight -= 1
+        return page(request)
+
+    server.route("GET", "/node/", slow_page)
+    seen = []
+    result = md.chapter.download_chapter(
+        md.chapter.get(chapter(1)["id"]), str(tmp_path), concurrency=3,
+        report_mdah=False, progress=lambda p: seen.append(p.pages_done)
+    )
+
+    assert result.ok and len(result.pages) == 6
+    assert peak == 3
+    assert seen[-1] == 6
+    assert sorted(i.name for i in tmp_path.iterdir() if i.suffix == ".png") \
+        == [f"{i:03d}.png" for i in range(1, 7)]
+
+
+def test_failed_page_doesnt_stop_the_others(server, tmp_path):
+    md = MdAPI(rate_limiter=False, failover=FailoverPolicy(retries=0))
+    md.api.BASE = server.base
+    server.serve_chapters(chapter(1, pages=4))
+    server.route("GET", "/node/data/hash1/2.png", lambda r: (500, b"no"))
+
+    result = md.chapter.download_chapter(
+        md.chapter.get(chapter(1)["id"]), str(tmp_path), report_mdah=False
+    )
+    assert [i.ok for i in result.pages] == [True, True, False, True]
+    assert isinstance(result.pages[2].error, InvalidStatusCode)
+    assert (tmp_path / "004.png").read_bytes() == PAGE
+    assert not (tmp_path / "003.png").exists()
+
+
+def test_worker_raises_job_errors_from_join():
+    done = []
+
+    def job(n):
+        if n == 1:
+            raise ValueError(n)
+        done.append(n)
+
+    worker = Worker(job, num_workers=1)
+    for n in range(4):
+        worker.enqueue(n)
+    worker.start()
+    with pytest.raises(ValueError):
+        worker.join()
+    # The thread carried on with the jobs after the one that failed
+    assert sorted(done) == [0, 2, 3]
@@ -0,0 +1,49 @@
+import pytest
+
+from mdapi import MdAPI
+from mdapi.cache import EntityCache
+
+from fakes import author, entity, manga, results, uuid
+
+
+@pytest.fixture
+def cached(server):
+    md = MdAPI(rate_limiter=False, entity_cache=EntityCache())
+    md.api.BASE = server.base
+    server.route("GET", "/author/", lambda r: entity(author(1, version=1)))
+    server.route("PUT", "/author/", lambda r: entity(author(1, version=2)))
+    server.route("DELETE", "/author/", lambda r: {"result": "ok"})
+    yield md
+    md.close()
+
+
+def test_get_is_answered_from_the_cache(cached, server):
+    first = cached.author.get(uuid(1))
+    assert cached.author.get(uuid(1)) is first
+    assert len(server.requests_to("/author/")) == 1
+
+
+def test_search_results_are_cached(cached, server):
+    server.route(
+        "GET", "/manga", lambda r: results([manga(1), manga(2)], r.query)
+    )
+    found = {i.id: i for i in cached.manga.search()}
+    assert cached.manga.get(uuid(2)) is found[uuid(2)]
+    assert server.requests_to("/manga/") == []
+
+
+def test_edit_invalidates(cached, server):
+    cached.author.edit(cached.author.get(uuid(1)), name="Renamed")
+    cached.author.get(uuid(1))
+    assert len(server.requests_to("/author/")) == 2
+
+
+def test_delete_invalidates(cached, server):
+    cached.author.get(uuid(1))
+    cached.author.delete(uuid(1))
+    # This used to refer to an endpoint that didn't exist
+    assert [i.path for i in server.requests_to("/author/", "DELETE")] \
+        == [f"/author/{uuid(1)}"]
+
+    cached.author.get(uuid(1))
+    assert len(server.requests_to("/author/")) == 2
@@ -0,0 +1,122 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from mdapi.aio import AsyncMdAPI
+from mdapi.aio.util import AsyncSingleFlight
+from mdapi.flight import SingleFlight
+
+from fakes import entity, manga, uuid
+
+
+def in_threads(count, target):
+    threads = [threading.Thread(target=target) for _ in range(count)]
+    for thread in threads:
+        thread.start()
+    return threads
+
+
+@pytest.mark.parametrize("error", [None, ValueError("failed")])
+def test_identical_calls_share_one_run(error):
+    flight = SingleFlight()
+    started, release = threading.Event(), threading.Event()
+    calls, outcomes = [], []
+
+    def fn():
+        calls.append(1)
+        started.set()
+        release.wait(5)
+        if error is not None:
+            raise error
+        return object()
+
+    def call():
+        try:
+            outcomes.append(flight.do("key", fn))
+        except ValueError as e:
+            outcomes.append(e)
+
+    threads = in_threads(1, call)
+    started.wait(5)
+    threads += in_threads(4, call)
+    time.sleep(0.1)
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    if error is not None:
+        assert outcomes == [error] * 5
+    else:
+        assert len({id(result) for result, _ in outcomes}) == 1
+        assert sorted(shared for _, shared in outcomes) == [False] + [True] * 4
+
+    # Once finished, the next call runs again
+    assert flight.do("key", lambda: 2) == (2, False)
+
+
+def test_different_keys_run_separately():
+    flight = SingleFlight()
+    assert flight.do("a", lambda: 1) == (1, False)
+    assert flight.do("b", lambda: 2) == (2, False)
+
+
+def test_client_coalesces_identical_gets(md, server):
+    def slow(request):
+        time.sleep(0.3)
+        return entity(manga(1))
+
+    server.route("GET", "/manga/", slow)
+    found = []
+    for thread in in_threads(
+        5, lambda: found.append(md.manga.get(uuid(1)))
+    ):
+        thread.join()
+
+    assert len(server.requests_to("/manga/")) == 1
+    assert md.api.metrics.coalesced == 4
+    # Each caller parsed its own copy
+    assert len({id(i) for i in found}) == 5
+
+
+def test_async_client_coalesces_identical_gets(server):
+    def slow(request):
+        time.sleep(0.2)
+        return entity(manga(1))
+
+    server.route("GET", "/manga/", slow)
+
+    async def main():
+        async with AsyncMdAPI(rate_limiter=False) as md:
+            md.api.BASE = server.base
+            found = await asyncio.gather(
+                *(md.manga.get(uuid(1)) for _ in range(5))
+            )
+            return found, md.api.metrics.coalesced
+
+    found, coalesced = asyncio.run(main())
+    assert [i.id for i in found] == [uuid(1)] * 5
+    assert coalesced == 4
+    assert len(server.requests_to("/manga/")) == 1
+
+
+def test_async_waiters_can_be_cancelled():
+    async def main():
+        flight = AsyncSingleFlight()
+        release = asyncio.Event()
+
+        async def fn():
+            await release.wait()
+            return 1
+
+        first = asyncio.ensure_future(flight.do("key", fn))
+        second = asyncio.ensure_future(flight.do("key", fn))
+        await asyncio.sleep(0)
+        first.cancel()
+        release.set()
+        return await second
+
+    # The shared call carried on without the cancelled waiter
+    assert asyncio.run(main()) == (1, True)
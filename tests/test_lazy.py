@@ -0,0 +1,31 @@
+import os
+
+import pytest
+
+from mdapi import MdAPI
+from mdapi.schema import LazyType
+
+from fakes import PAGE, chapter
+
+
+@pytest.mark.parametrize("validate", [True, False])
+def test_lazy_chapters_can_be_downloaded(server, tmp_path, validate):
+    server.serve_chapters(chapter(1))
+    md = MdAPI(
+        rate_limiter=False, lazy_results=True, validate_arguments=validate
+    )
+    md.api.BASE = server.base
+
+    lazy = next(iter(md.chapter.search()))
+    assert isinstance(lazy, LazyType)
+    assert list(md.chapter.page_urls_for(lazy)) == [
+        f"{server.base}/node/data/hash1/{i}.png" for i in range(3)
+    ]
+
+    result = md.chapter.download_chapter(
+        lazy, str(tmp_path), report_mdah=False
+    )
+    assert result.ok
+    for name in ("001.png", "002.png", "003.png"):
+        assert (tmp_path / name).read_bytes() == PAGE
+    assert not any(i.endswith(".part") for i in os.listdir(tmp_path))
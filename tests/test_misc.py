@@ -0,0 +1,50 @@
+import asyncio
+
+import pytest
+
+from mdapi.aio import AsyncMdAPI
+from mdapi.nodes import AT_HOME_TTL, at_home_ttl
+
+from fakes import uuid
+
+
+@pytest.mark.parametrize("headers, ttl", [
+    ({}, AT_HOME_TTL),
+    ({"Cache-Control": "public, max-age=600"}, 540),
+    ({"Cache-Control": "max-age=30"}, 0),
+    ({"Cache-Control": "max-age=soon"}, AT_HOME_TTL),
+])
+def test_at_home_ttl(headers, ttl):
+    assert at_home_ttl(headers) == ttl
+
+
+def serve_at_home(server, cache_control):
+    server.route("GET", "/at-home/server/", lambda r: (
+        200, {"baseUrl": server.base + "/node"},
+        {"Cache-Control": cache_control}
+    ))
+
+
+@pytest.mark.parametrize("cache_control, requests", [
+    ("max-age=900", 1),
+    # Too close to expiry to hand out again
+    ("max-age=60", 2),
+])
+def test_md_at_home_url_lifetime(md, server, cache_control, requests):
+    serve_at_home(server, cache_control)
+    for _ in range(2):
+        assert md.misc.get_md_at_home_url(uuid(1)) == server.base + "/node"
+    assert len(server.requests_to("/at-home/server/")) == requests
+
+
+def test_aio_md_at_home_url_lifetime(server):
+    serve_at_home(server, "max-age=60")
+
+    async def main():
+        async with AsyncMdAPI(rate_limiter=False) as md:
+            md.api.BASE = server.base
+            for _ in range(2):
+                await md.misc.get_md_at_home_url(uuid(1))
+
+    asyncio.run(main())
+    assert len(server.requests_to("/at-home/server/")) == 2
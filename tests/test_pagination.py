@@ -0,0 +1,162 @@
+import threading
+import time
+
+import pytest
+
+from mdapi import MdAPI
+from mdapi.schema import ChapterSortOrder
+
+from fakes import TIMESTAMP, chapter, results, uuid
+
+
+def wait_for(predicate, timeout=5):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.01)
+
+
+def serve_chapters(server, count, respond=None):
+    chapters = [chapter(n) for n in range(count)]
+
+    def page(request):
+        if respond is not None:
+            respond(request)
+        return results(chapters, request.query)
+
+    server.route("GET", "/chapter", page)
+    return [i["id"] for i in chapters]
+
+
+def offsets(server):
+    return sorted(
+        int(i.query["offset"][0]) for i in server.requests_to("/chapter")
+    )
+
+
+def test_prefetch_requests_following_pages_in_the_background(server):
+    md = MdAPI(rate_limiter=False, prefetch=2)
+    md.api.BASE = server.base
+    ids = serve_chapters(server, 45)
+
+    request = md.chapter.search(limit=10)
+    # Nothing has been consumed, but the next two pages are on their way
+    wait_for(lambda: len(server.requests_to("/chapter")) == 3)
+    assert offsets(server) == [0, 10, 20]
+
+    assert [i.id for i in request] == ids
+    assert offsets(server) == [0, 10, 20, 30, 40]
+
+
+def test_closing_discards_prefetched_pages(server):
+    md = MdAPI(rate_limiter=False, prefetch=1)
+    md.api.BASE = server.base
+    release = threading.Event()
+
+    def hold(request):
+        if request.query["offset"] != ["0"]:
+            release.wait(5)
+
+    serve_chapters(server, 30, hold)
+    with md.chapter.search(limit=10) as request:
+        assert next(request).id == uuid(0)
+    release.set()
+
+    wait_for(lambda: not any(
+        i.name.startswith("mdapi-prefetch") for i in threading.enumerate()
+    ))
+    assert offsets(server) == [0, 10]
+
+
+def test_fetch_all_requests_pages_concurrently(md, server):
+    in_flight = peak = 0
+    lock = threading.Lock()
+    gate = threading.Barrier(3, timeout=5)
+
+    def slow(request):
+        nonlocal in_flight, peak
+        if request.query["offset"] == ["0"]:
+            return
+        with lock:
+            in_flight += 1
+            peak = max(peak, in_flight)
+        try:
+            gate.wait()
+        except threading.BrokenBarrierError:
+            pass
+        with lock:
+            in_flight -= 1
+
+    ids = serve_chapters(server, 65, slow)
+    request = md.chapter.search(limit=10)
+    assert next(request).id == ids[0]
+
+    assert [i.id for i in request.fetch_all(concurrency=3)] == ids[1:]
+    assert peak == 3
+    assert offsets(server) == list(range(0, 70, 10))
+    assert next(request, None) is None
+
+
+def test_iter_unordered_yields_every_result(md, server):
+    # Later pages answer first
+    ids = serve_chapters(server, 40, lambda r: time.sleep(
+        (40 - int(r.query["offset"][0])) / 400
+    ))
+    found = [i.id for i in md.chapter.search(limit=10).iter_unordered()]
+    assert sorted(found) == ids
+    assert found[:10] == ids[:10]
+    assert found != ids
+
+
+def serve_by_created_at(server, chapters):
+    """
+    Serve ``chapters`` the way the API does when paginating by
+    ``createdAt``: ordered by it, from ``createdAtSince`` inclusive.
+    """
+    def respond(request):
+        assert request.query["order[createdAt]"] == ["asc"]
+        since = request.query.get("createdAtSince", [""])[0]
+        return results([
+            i for i in sorted(
+                chapters, key=lambda i: i["attributes"]["createdAt"]
+            )
+            if i["attributes"]["createdAt"][:19] >= since
+        ], request.query)
+
+    server.route("GET", "/chapter", respond)
+
+
+def test_cursor_yields_shared_timestamps_once(md, server):
+    later = "2021-01-02T00:00:00+00:00"
+    chapters = [chapter(n) for n in range(25)]
+    chapters += [chapter(n, createdAt=later) for n in range(25, 30)]
+    serve_by_created_at(server, chapters)
+
+    found = [
+        i.id for i in md.chapter.search(cursor="createdAt", limit=10)
+    ]
+    assert sorted(found) == [uuid(n) for n in range(30)]
+    # The 25 sharing a timestamp were stepped over by offset
+    assert all(
+        i.query["createdAtSince"] == [TIMESTAMP[:19]]
+        for i in server.requests_to("/chapter")[1:3]
+    )
+
+
+@pytest.mark.parametrize("kwargs", [
+    {"order": {"createdAt": "desc"}},
+    {"order": {"publishAt": "asc"}},
+    {"order": ChapterSortOrder(createdAt="asc", volume="desc")},
+    {"offset": 10},
+])
+def test_cursor_rejects_conflicting_arguments(md, kwargs):
+    with pytest.raises(ValueError):
+        md.chapter.search(cursor="createdAt", **kwargs)
+
+
+def test_cursor_accepts_its_own_order(md, server):
+    serve_by_created_at(server, [chapter(1)])
+    found = md.chapter.search(
+        cursor="createdAt", order={"createdAt": "asc"}, offset=0
+    )
+    assert [i.id for i in found] == [uuid(1)]
@@ -0,0 +1,122 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from mdapi import MdAPI
+from mdapi.endpoints import Endpoints
+from mdapi.exceptions import RateLimited
+from mdapi.ratelimit import RateLimiter, TokenBucket
+
+from fakes import entity, manga
+
+
+class Handler(BaseHTTPRequestHandler):
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        if self.path.startswith("/manga/limited"):
+            code, headers = 429, {"Retry-After": "500"}
+            body = {"result": "error", "errors": [{"status": 429}]}
+        else:
+            code, headers, body = 200, {}, {"result": "ok"}
+        data = json.dumps(body).encode()
+        self.send_response(code)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+
+@pytest.fixture
+def md():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    md = MdAPI()
+    md.api.BASE = f"http://127.0.0.1:{server.server_port}"
+    yield md
+    server.shutdown()
+
+
+def test_long_retry_after_does_not_hold_back_other_requests(md):
+    # Longer than the retry policy will wait, so the 429 isn't retried
+    with pytest.raises(RateLimited) as e:
+        md.api._make_request(Endpoints.Manga.GET, urlparams={
+            "manga": "limited"
+        })
+    assert e.value.retry_after == 500
+
+    start = time.monotonic()
+    # The same route for another manga, then another route entirely
+    md.api._make_request(Endpoints.Manga.GET, urlparams={"manga": "other"})
+    md.api._make_request(Endpoints.Manga.SEARCH)
+    assert time.monotonic() - start < 2
+
+
+def test_clients_have_their_own_limiter():
+    assert MdAPI().api.rate_limiter is not MdAPI().api.rate_limiter
+
+
+def test_bucket_allows_bursts_then_spaces_out():
+    bucket = TokenBucket(rate=10, capacity=2)
+    delays = [bucket.reserve() for _ in range(4)]
+    assert delays == pytest.approx([0, 0, 0.1, 0.2], abs=0.02)
+
+
+def test_bucket_max_wait():
+    bucket = TokenBucket(rate=1, capacity=1)
+    bucket.reserve()
+    with pytest.raises(RateLimited):
+        bucket.reserve(max_wait=0.5)
+    # The token wasn't taken
+    assert bucket.reserve() == pytest.approx(1, abs=0.02)
+
+
+def test_families_share_the_generic_bucket():
+    limiter = RateLimiter({"generic": (10, 1), "at-home": (1, 1)})
+    assert limiter.family_of(Endpoints.GET_MD_AT_HOME) == "at-home"
+    assert limiter.family_of(Endpoints.Manga.GET) == "generic"
+    assert limiter.family_of(Endpoints.MDAH_REPORT) is None
+
+    assert limiter.reserve(Endpoints.GET_MD_AT_HOME) == 0
+    # Spaced out by the generic bucket the at-home request also took from
+    assert limiter.reserve(Endpoints.Manga.GET) \
+        == pytest.approx(0.1, abs=0.02)
+    assert limiter.reserve(Endpoints.GET_MD_AT_HOME) \
+        == pytest.approx(1, abs=0.02)
+    assert limiter.reserve(Endpoints.MDAH_REPORT) == 0
+
+
+def test_hold_only_affects_its_route():
+    limiter = RateLimiter({"generic": (1000, 1000)})
+    limiter.hold(Endpoints.Manga.GET, 5)
+    assert limiter.reserve(Endpoints.Manga.GET) == pytest.approx(5, abs=0.1)
+    assert limiter.reserve(Endpoints.Chapter.GET) == 0
+
+
+def test_update_follows_rate_limit_headers():
+    limiter = RateLimiter()
+    limiter.update(Endpoints.GET_MD_AT_HOME, 200, {
+        "X-RateLimit-Remaining": "0",
+        "X-RateLimit-Retry-After": str(time.time() + 30),
+    })
+    assert limiter.reserve(Endpoints.GET_MD_AT_HOME) \
+        == pytest.approx(30, abs=1)
+    # Other families aren't held back
+    assert limiter.reserve(Endpoints.Manga.GET) < 1
+
+
+def test_client_spaces_out_requests(server):
+    md = MdAPI(rate_limiter=RateLimiter({"generic": (20, 1)}))
+    md.api.BASE = server.base
+    server.route("GET", "/manga/", lambda r: entity(manga(1)))
+
+    start = time.monotonic()
+    for _ in range(5):
+        md.manga.get(manga(1)["id"])
+    assert time.monotonic() - start >= 0.18
@@ -0,0 +1,93 @@
+import pytest
+
+from mdapi.download import PageRequest
+from mdapi.exceptions import DownloadException
+
+from fakes import PAGE, chapter, page
+
+CHUNK = PageRequest.CHUNK_SIZE
+# Big enough for whole chunks to arrive before a connection drops
+LARGE = PAGE * (CHUNK * 3 // len(PAGE))
+
+
+def download(md, server, path, **kwargs):
+    url = f"{server.base}/node/data/hash1/0.png"
+    return b"".join(
+        chunk for chunk, _ in md.chapter.download_page_to_path(
+            url, str(path), report_mdah=False, **kwargs
+        )
+    )
+
+
+@pytest.mark.parametrize("part", [
+    PAGE[:1000],
+    # Already complete, so the node answers 416
+    PAGE,
+])
+def test_resumes_part_file(md, server, tmp_path, part):
+    server.serve_chapters(chapter(1, pages=1))
+    path = tmp_path / "001.png"
+    (tmp_path / "001.png.part").write_bytes(part)
+
+    assert download(md, server, path) == PAGE[len(part):]
+    assert path.read_bytes() == PAGE
+    assert not (tmp_path / "001.png.part").exists()
+    assert server.requests_to("/node/")[0].headers["Range"] \
+        == f"bytes={len(part)}-"
+
+
+def test_restarts_when_range_is_ignored(md, server, tmp_path):
+    server.serve_chapters(chapter(1, pages=1))
+    server.route("GET", "/node/", lambda r: (200, PAGE))
+    path = tmp_path / "001.png"
+    (tmp_path / "001.png.part").write_bytes(b"\xff" * 1000)
+
+    download(md, server, path)
+    assert path.read_bytes() == PAGE
+
+
+def drop_after(size, body=LARGE):
+    """
+    A node that claims the rest of the page, but sends only ``size``
+    bytes of it before the connection drops.
+    """
+    def respond(request):
+        start = int(request.headers.get("Range", "bytes=0-")[6:-1])
+        return 200 if start == 0 else 206, body[start:start + size], {
+            "Content-Length": str(len(body) - start),
+            "Content-Range": f"bytes {start}-{len(body) - 1}/{len(body)}",
+        }
+    return respond
+
+
+def test_resumes_after_a_drop(md, server, tmp_path):
+    server.serve_chapters(chapter(1, pages=1), body=LARGE)
+    drop = drop_after(CHUNK + 100)
+    server.route("GET", "/node/", lambda r: (
+        drop(r) if len(server.requests_to("/node/")) < 3 else page(r, LARGE)
+    ))
+    path = tmp_path / "001.png"
+
+    assert download(md, server, path) == LARGE
+    assert path.read_bytes() == LARGE
+    assert [
+        i.headers.get("Range") for i in server.requests_to("/node/")
+    ] == [None, f"bytes={CHUNK}-", f"bytes={2 * CHUNK}-"]
+
+
+def test_keeps_what_arrived_after_the_last_attempt(md, server, tmp_path):
+    server.serve_chapters(chapter(1, pages=1), body=LARGE)
+    server.route("GET", "/node/", drop_after(CHUNK + 100))
+    path = tmp_path / "001.png"
+
+    with pytest.raises(DownloadException):
+        download(md, server, path, attempts=1)
+    assert not path.exists()
+    assert (tmp_path / "001.png.part").read_bytes() == LARGE[:CHUNK]
+
+    # The next download carries on from there
+    server.route("GET", "/node/", lambda r: page(r, LARGE))
+    download(md, server, path)
+    assert path.read_bytes() == LARGE
+    assert server.requests_to("/node/")[-1].headers["Range"] \
+        == f"bytes={CHUNK}-"
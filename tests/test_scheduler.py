@@ -0,0 +1,129 @@
+import threading
+
+import pytest
+
+from mdapi.download import DownloadScheduler
+
+from fakes import PAGE, chapter, page, uuid
+
+
+def run(scheduler, **kwargs):
+    # A hung scheduler should fail the test, not the whole run
+    outcome = {}
+
+    def target():
+        try:
+            outcome["results"] = scheduler.run(**kwargs)
+        except Exception as e:
+            outcome["error"] = e
+
+    thread = threading.Thread(target=target, daemon=True)
+    thread.start()
+    thread.join(10)
+    assert not thread.is_alive(), "run() didn't return"
+    if "error" in outcome:
+        raise outcome["error"]
+    return outcome["results"]
+
+
+def test_downloads_every_chapter(md, server, tmp_path):
+    server.serve_chapters(chapter(1), chapter(2, pages=5))
+    scheduler = DownloadScheduler(md, concurrency=4, report_mdah=False)
+    for obj in md.chapter.search():
+        scheduler.add_chapter(obj, str(tmp_path / obj.chapter))
+
+    results = run(scheduler)
+    assert [i.ok for i in results] == [True, True]
+    assert scheduler.stats.pages_done == scheduler.stats.pages_total == 8
+    assert scheduler.stats.chapters_done == 2
+    assert (tmp_path / "2" / "005.png").read_bytes() == PAGE
+
+    # Downloaded chapters are skipped outright
+    before = len(server.requests_to("/node/"))
+    scheduler = DownloadScheduler(md, report_mdah=False)
+    for obj in md.chapter.search():
+        scheduler.add_chapter(obj, str(tmp_path / obj.chapter))
+    assert all(i.skipped for i in run(scheduler))
+    assert len(server.requests_to("/node/")) == before
+
+
+@pytest.mark.parametrize("downloaded", [False, True])
+def test_failing_progress_callback(md, server, tmp_path, downloaded):
+    server.serve_chapters(chapter(1), chapter(2))
+    chapters = list(md.chapter.search())
+    if downloaded:
+        # Skipped pages are counted while resolving the chapter
+        for obj in chapters:
+            md.chapter.download_chapter(
+                obj, str(tmp_path / obj.chapter), report_mdah=False
+            )
+
+    def progress(stats):
+        raise RuntimeError("progress")
+
+    scheduler = DownloadScheduler(md, concurrency=2, report_mdah=False)
+    results = [
+        scheduler.add_chapter(obj, str(tmp_path / obj.chapter))
+        for obj in chapters
+    ]
+    with pytest.raises(RuntimeError, match="progress"):
+        run(scheduler, progress=progress)
+
+    # Every page was still seen through
+    assert all(i.ok for i in results)
+    assert scheduler.stats.pages_done == 6
+    assert scheduler.stats.chapters_done == 2
+
+
+def test_limits_pages_in_flight(md, server, tmp_path):
+    # Chapter 2 is another series, served from another host
+    other = chapter(2, pages=6)
+    other["relationships"] = [{"id": uuid(100), "type": "manga"}]
+    server.serve_chapters(chapter(1, pages=6), other)
+    server.route("GET", f"/at-home/server/{uuid(2)}", lambda r: {
+        "baseUrl": server.base.replace("127.0.0.1", "localhost") + "/node"
+    })
+
+    lock = threading.Lock()
+    in_flight = {}
+    peaks = {}
+    gate = threading.Barrier(3, timeout=5)
+
+    def slow_page(request):
+        host = request.headers["Host"].split(":")[0]
+        with lock:
+            in_flight[host] = in_flight.get(host, 0) + 1
+            peaks[host] = max(peaks.get(host, 0), in_flight[host])
+            peaks["all"] = max(peaks.get("all", 0), sum(in_flight.values()))
+        try:
+            gate.wait()
+        except threading.BrokenBarrierError:
+            pass
+        with lock:
+            in_flight[host] -= 1
+        return page(request)
+
+    server.route("GET", "/node/", slow_page)
+    scheduler = DownloadScheduler(
+        md, concurrency=3, per_host=2, report_mdah=False
+    )
+    for obj in md.chapter.search():
+        scheduler.add_chapter(obj, str(tmp_path / obj.chapter))
+
+    assert all(i.ok for i in run(scheduler))
+    assert peaks == {"127.0.0.1": 2, "localhost": 2, "all": 3}
+
+
+def test_series_take_turns(md, server, tmp_path):
+    short = chapter(2, pages=2)
+    short["relationships"] = [{"id": uuid(100), "type": "manga"}]
+    server.serve_chapters(chapter(1, pages=8), short)
+    scheduler = DownloadScheduler(md, concurrency=1, report_mdah=False)
+    for obj in md.chapter.search():
+        scheduler.add_chapter(obj, str(tmp_path / obj.chapter))
+    run(scheduler)
+
+    hashes = [i.path.split("/")[3] for i in server.requests_to("/node/")]
+    # The short series isn't left waiting behind the long one
+    assert hashes.index("hash2") < 4
+    assert hashes[-1] == "hash1"
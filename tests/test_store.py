@@ -0,0 +1,76 @@
+import os
+import zipfile
+
+import pytest
+
+from mdapi import MdAPI
+from mdapi.store import PageStore
+
+from fakes import PAGE, chapter, uuid
+
+
+def objects(store):
+    return [
+        os.path.join(root, name)
+        for root, _, names in os.walk(os.path.join(store.root, "objects"))
+        for name in names
+    ]
+
+
+def test_identical_pages_are_stored_once(tmp_path):
+    store = PageStore(str(tmp_path / "store"))
+    first, second = tmp_path / "a.png", tmp_path / "b.png"
+    first.write_bytes(PAGE)
+    second.write_bytes(PAGE)
+
+    digest = store.add("https://node/data/hash1/0.png", str(first))
+    assert store.add_bytes("https://node/data/hash2/5.png", PAGE) == digest
+    assert store.add("https://node/data/hash3/1.png", str(second)) == digest
+
+    assert objects(store) == [store.object_path(digest)]
+    assert os.path.samefile(first, second)
+    assert "https://other/data/hash2/5.png" in store
+    assert store.read("https://node/data/hash3/1.png") == PAGE
+    assert store.materialize(
+        "https://node/data/hash4/0.png", str(tmp_path / "c.png")
+    ) is None
+
+
+def test_key_of_rejects_other_urls():
+    with pytest.raises(ValueError):
+        PageStore.key_of("https://node/")
+
+
+@pytest.fixture
+def stored(server, tmp_path):
+    md = MdAPI(
+        rate_limiter=False, page_store=PageStore(str(tmp_path / "store"))
+    )
+    md.api.BASE = server.base
+    server.serve_chapters(chapter(1, pages=3))
+    yield md
+    md.close()
+
+
+def test_downloads_reuse_stored_pages(stored, server, tmp_path):
+    obj = stored.chapter.get(uuid(1))
+    assert stored.chapter.download_chapter(
+        obj, str(tmp_path / "a"), report_mdah=False
+    ).ok
+    assert len(server.requests_to("/node/")) == 3
+    # Every page has the same content, so only one object is kept
+    assert len(objects(stored.api.page_store)) == 1
+
+    assert stored.chapter.download_chapter(
+        obj, str(tmp_path / "b"), report_mdah=False
+    ).ok
+    assert stored.chapter.download_chapter_archive(
+        obj, str(tmp_path / "c.cbz"), report_mdah=False, info=False
+    ).ok
+    assert len(server.requests_to("/node/")) == 3
+
+    assert os.path.samefile(
+        tmp_path / "a" / "001.png", tmp_path / "b" / "003.png"
+    )
+    with zipfile.ZipFile(tmp_path / "c.cbz") as archive:
+        assert archive.read("002.png") == PAGE
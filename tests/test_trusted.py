@@ -0,0 +1,52 @@
+from datetime import datetime
+
+import pytest
+
+from mdapi import MdAPI
+from mdapi.schema import Type
+
+from fakes import author, chapter, entity, manga, results, uuid
+
+TAG = {
+    "id": uuid(9), "type": "tag",
+    "attributes": {
+        "name": {"en": "Action"}, "description": [], "group": "genre",
+        "version": 1,
+    },
+}
+
+
+def unwrap(obj):
+    response = entity(obj)
+    return {**response["data"], "relationships": response["relationships"]}
+
+
+@pytest.mark.parametrize("obj", [
+    manga(1, tags=[TAG], links={"al": "1", "mu": "2"}),
+    chapter(1),
+    author(1, version=1),
+], ids=["manga", "chapter", "author"])
+def test_construct_matches_validation(obj):
+    validated = Type.parse_obj(unwrap(obj))
+    trusted = Type.construct_obj(unwrap(obj))
+
+    assert type(trusted) is type(validated)
+    assert repr(trusted) == repr(validated)
+    assert isinstance(trusted.createdAt, datetime)
+
+
+def test_trusted_responses_option(server, monkeypatch):
+    md = MdAPI(rate_limiter=False, trusted_responses=True)
+    md.api.BASE = server.base
+    server.route("GET", "/manga", lambda r: results(
+        [manga(n, tags=[TAG]) for n in range(3)], r.query
+    ))
+    expected = repr(Type.parse_obj(unwrap(manga(1, tags=[TAG]))))
+
+    def parse_obj(obj):
+        raise AssertionError("validated a trusted response")
+
+    monkeypatch.setattr(Type, "parse_obj", parse_obj)
+    found = list(md.manga.search())
+    assert [i.id for i in found] == [uuid(n) for n in range(3)]
+    assert repr(found[1]) == expected